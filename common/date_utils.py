@@ -1,7 +1,8 @@
 """Date utility functions for scraper operations."""
 
-from datetime import date, timedelta
-from dateutil.relativedelta import relativedelta
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import List, Tuple
 
 
@@ -32,45 +33,79 @@ def generate_date_chunks(
 
     while current <= end_date:
         if chunk_size == 'daily':
-            chunk_end = current
+            period_end = current
         elif chunk_size == 'weekly':
-            chunk_end = current + timedelta(days=6)
+            period_end = current + timedelta(days=6)
         elif chunk_size == 'monthly':
-            # End of current month
-            next_month = current + relativedelta(months=1)
-            chunk_end = next_month.replace(day=1) - timedelta(days=1)
+            period_end = current.replace(day=monthrange(current.year, current.month)[1])
         elif chunk_size == 'quarterly':
-            # End of current quarter
             quarter_month = ((current.month - 1) // 3 + 1) * 3
-            chunk_end = date(current.year, quarter_month, 1) + relativedelta(months=1) - timedelta(days=1)
+            period_end = date(current.year, quarter_month, monthrange(current.year, quarter_month)[1])
         elif chunk_size == 'yearly':
-            chunk_end = date(current.year, 12, 31)
+            period_end = date(current.year, 12, 31)
         else:
             raise ValueError(f"Invalid chunk_size: {chunk_size}. Must be daily, weekly, monthly, quarterly, or yearly")
 
         # Don't exceed end_date
-        chunk_end = min(chunk_end, end_date)
+        chunks.append((current, min(period_end, end_date)))
 
-        chunks.append((current, chunk_end))
-
-        # Move to next chunk
-        if chunk_size == 'daily':
-            current = current + timedelta(days=1)
-        elif chunk_size == 'weekly':
-            current = current + timedelta(days=7)
-        elif chunk_size == 'monthly':
-            current = current + relativedelta(months=1)
-            current = current.replace(day=1)
-        elif chunk_size == 'quarterly':
-            current = current + relativedelta(months=3)
-            current = date(current.year, ((current.month - 1) // 3) * 3 + 1, 1)
-        elif chunk_size == 'yearly':
-            current = date(current.year + 1, 1, 1)
+        # Next chunk starts the day after this period ends
+        current = period_end + timedelta(days=1)
 
     return chunks
 
 
+def bisect_date_range(start_date: date, end_date: date) -> Tuple[Tuple[date, date], Tuple[date, date]]:
+    """
+    Split an inclusive date range into two halves.
+
+    Used to narrow a search whose results the portal truncated. Callers keep
+    bisecting until the range is a single day.
+
+    Args:
+        start_date: Start date
+        end_date: End date (must be after start_date)
+
+    Returns:
+        ((start_date, mid), (mid + 1 day, end_date))
+
+    Example:
+        >>> bisect_date_range(date(2024, 1, 1), date(2024, 1, 31))
+        ((date(2024, 1, 1), date(2024, 1, 16)), (date(2024, 1, 17), date(2024, 1, 31)))
+    """
+    if start_date >= end_date:
+        raise ValueError(f"Cannot bisect single-day range {start_date} to {end_date}")
+    mid = start_date + (end_date - start_date) // 2
+    return (start_date, mid), (mid + timedelta(days=1), end_date)
+
+
+@lru_cache(maxsize=1024)
 def parse_date(date_str: str) -> date:
-    """Parse YYYY-MM-DD string to date object."""
-    from datetime import datetime
+    """Parse YYYY-MM-DD string to date object (memoized; dates are immutable)."""
     return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
+@lru_cache(maxsize=4096)
+def parse_portal_date(date_str: str) -> date:
+    """
+    Parse a court portal MM/DD/YYYY string to date object (memoized).
+
+    Accepts exactly what datetime.strptime(date_str, '%m/%d/%Y') does, but
+    splits the string by hand: strptime is slow and serializes every caller in
+    the process on _strptime's module-level cache lock.
+
+    Args:
+        date_str: Date string such as '01/02/2024' or '1/2/2024'
+
+    Returns:
+        date: Parsed date
+
+    Raises:
+        ValueError: If the string is not a valid MM/DD/YYYY date
+    """
+    parts = date_str.split('/')
+    if (len(parts) != 3 or not all(part.isdigit() for part in parts)
+            or len(parts[0]) > 2 or len(parts[1]) > 2 or len(parts[2]) != 4):
+        raise ValueError(f"Date {date_str!r} does not match format MM/DD/YYYY")
+    month, day, year = parts
+    return date(int(year), int(month), int(day))
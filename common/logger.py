@@ -1,9 +1,94 @@
 """Logging configuration for NC Foreclosures project."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from common.config import config
 
+# Format: timestamp - name - level - message
+_formatter = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# Loggers configured by setup_logger, mapped to their own console handler
+_console_handlers = {}
+
+# Set while start_queue_logging() is active
+_queue_handler = None
+_listener = None
+_fork_hook_registered = False
+
+
+def _make_console_handler(level=None):
+    """Create a stdout handler with the project format."""
+    console_handler = logging.StreamHandler(sys.stdout)
+    if level is not None:
+        console_handler.setLevel(getattr(logging, level.upper()))
+    console_handler.setFormatter(_formatter)
+    return console_handler
+
+
+def _swap_handlers(use_queue):
+    """Point every setup_logger logger at the shared queue handler, or back at its console handler."""
+    for logger, console_handler in _console_handlers.items():
+        old, new = (console_handler, _queue_handler) if use_queue else (_queue_handler, console_handler)
+        logger.removeHandler(old)
+        logger.addHandler(new)
+
+
+def start_queue_logging():
+    """
+    Route all setup_logger loggers through one queue drained by a listener thread.
+
+    Worker threads then only enqueue records instead of contending on stdout.
+    Opt-in for multi-threaded entry points (parallel_scrape's main); call
+    stop_queue_logging() to flush, which also runs at exit. Forked children
+    switch back to writing directly, since the listener thread isn't copied
+    by fork; spawned children never start it.
+    """
+    global _queue_handler, _listener, _fork_hook_registered
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, _make_console_handler())
+    _swap_handlers(use_queue=True)
+    _listener.start()
+    atexit.register(stop_queue_logging)
+
+    if not _fork_hook_registered:
+        os.register_at_fork(after_in_child=_log_directly_in_child)
+        _fork_hook_registered = True
+
+
+def stop_queue_logging():
+    """Send loggers back to their console handlers and flush anything still queued."""
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+
+    _swap_handlers(use_queue=False)
+    # stop() drains the records enqueued before the swap
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
+    atexit.unregister(stop_queue_logging)
+
+
+def _log_directly_in_child():
+    """After fork: write synchronously, as no listener thread runs in the child."""
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+    _swap_handlers(use_queue=False)
+    _listener = None
+    _queue_handler = None
+
 
 def setup_logger(name: str, level: str = None) -> logging.Logger:
     """
@@ -24,18 +109,9 @@ def setup_logger(name: str, level: str = None) -> logging.Logger:
 
     # Avoid adding handlers multiple times
     if not logger.handlers:
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
-
-        # Format: timestamp - name - level - message
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        console_handler.setFormatter(formatter)
-
-        logger.addHandler(console_handler)
+        console_handler = _make_console_handler(level)
+        _console_handlers[logger] = console_handler
+        logger.addHandler(_queue_handler or console_handler)
 
     return logger
 
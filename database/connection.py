@@ -11,8 +11,8 @@ logger = setup_logger(__name__)
 # Create engine with connection pooling
 engine = create_engine(
     config.DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=config.DB_POOL_SIZE,
+    max_overflow=config.DB_MAX_OVERFLOW,
     pool_pre_ping=True,  # Verify connections before using
     echo=False  # Set to True for SQL debugging
 )
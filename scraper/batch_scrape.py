@@ -1,6 +1,7 @@
 """Batch scrape with configurable date chunking.
 
 Sequential batch scraper that uses DateRangeScraper to process date ranges in chunks.
+One browser is launched for the whole run and reused for every chunk.
 Unlike batch_initial_scrape.py (which uses InitialScraper for year-based initial scraping),
 this script is designed for flexible date range processing with configurable chunk sizes.
 
@@ -24,10 +25,12 @@ Usage:
 
 import argparse
 import sys
+from collections import deque
 from datetime import datetime
 
-from scraper.date_range_scrape import DateRangeScraper
-from common.date_utils import generate_date_chunks, parse_date
+from scraper.browser_pool import acquire_context, close_thread_browser
+from scraper.date_range_scrape import DateRangeScraper, FailedChunk, TruncatedResultsError
+from common.date_utils import bisect_date_range, generate_date_chunks, parse_date
 from common.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -104,57 +107,89 @@ def run_batch_scrape(start_date, end_date, chunk_size, county=None, limit=None,
         'chunks_processed': 0,
         'chunks_succeeded': 0,
         'chunks_failed': 0,
+        'chunks_split': 0,
         'total_cases': 0,
         'failed_chunks': []
     }
 
-    for i, (chunk_start, chunk_end, cnty) in enumerate(chunks, 1):
-        county_str = cnty if cnty else "all counties"
-        logger.info(f"\nProcessing chunk {i} of {total_chunks}: {chunk_start} to {chunk_end} ({county_str})")
-        logger.info("-" * 60)
-
-        try:
-            # Prepare counties list for DateRangeScraper
-            counties = [cnty] if cnty else None
-
-            scraper = DateRangeScraper(
-                start_date=chunk_start.strftime('%Y-%m-%d'),
-                end_date=chunk_end.strftime('%Y-%m-%d'),
-                counties=counties,
-                limit=limit
-            )
-            result = scraper.run()
-
-            results['chunks_processed'] += 1
-
-            if result['status'] == 'success':
-                results['chunks_succeeded'] += 1
-                cases_processed = result.get('cases_processed', 0)
-                results['total_cases'] += cases_processed
-                logger.info(f"✓ Chunk {i} completed: {cases_processed} foreclosures saved")
-            else:
+    # Work queue of (chunk_num, start, end, county); truncated chunks are bisected
+    # and their halves processed next, down to single days
+    pending = deque((i, chunk_start, chunk_end, cnty) for i, (chunk_start, chunk_end, cnty) in enumerate(chunks, 1))
+
+    # All chunks run on this thread, so they share one browser and context (see browser_pool)
+    try:
+        while pending:
+            i, chunk_start, chunk_end, cnty = pending.popleft()
+            county_str = cnty if cnty else "all counties"
+            logger.info(f"\nProcessing chunk {i} of {results['total_chunks']}: {chunk_start} to {chunk_end} ({county_str})")
+            logger.info("-" * 60)
+
+            try:
+                # Prepare counties list for DateRangeScraper
+                counties = [cnty] if cnty else None
+
+                scraper = DateRangeScraper(
+                    start_date=chunk_start,
+                    end_date=chunk_end,
+                    counties=counties,
+                    limit=limit,
+                    context=acquire_context()
+                )
+                result = scraper.run()
+
+                results['chunks_processed'] += 1
+
+                if result['status'] == 'success':
+                    results['chunks_succeeded'] += 1
+                    cases_processed = result.get('cases_processed', 0)
+                    results['total_cases'] += cases_processed
+                    logger.info(f"✓ Chunk {i} completed: {cases_processed} foreclosures saved")
+                else:
+                    results['chunks_failed'] += 1
+                    results['failed_chunks'].append(FailedChunk(
+                        chunk_num=i,
+                        start_date=chunk_start,
+                        end_date=chunk_end,
+                        county=cnty,
+                        error=result.get('error', 'Unknown error')
+                    ))
+                    logger.error(f"✗ Chunk {i} failed: {result.get('error', 'Unknown error')}")
+
+            except TruncatedResultsError as e:
+                results['chunks_processed'] += 1
+                if chunk_start < chunk_end:
+                    results['chunks_split'] += 1
+                    (first_start, first_end), (second_start, second_end) = bisect_date_range(chunk_start, chunk_end)
+                    pending.appendleft((results['total_chunks'] + 2, second_start, second_end, cnty))
+                    pending.appendleft((results['total_chunks'] + 1, first_start, first_end, cnty))
+                    results['total_chunks'] += 2
+                    logger.warning(f"⚠ Chunk {i} truncated, splitting into {first_start} to {first_end} "
+                                   f"and {second_start} to {second_end}")
+                else:
+                    results['chunks_failed'] += 1
+                    results['failed_chunks'].append(FailedChunk(
+                        chunk_num=i,
+                        start_date=chunk_start,
+                        end_date=chunk_end,
+                        county=cnty,
+                        error=str(e)
+                    ))
+                    logger.error(f"✗ Chunk {i} failed: single day still truncated: {e}")
+
+            except Exception as e:
+                results['chunks_processed'] += 1
                 results['chunks_failed'] += 1
-                results['failed_chunks'].append({
-                    'chunk_num': i,
-                    'start_date': chunk_start,
-                    'end_date': chunk_end,
-                    'county': cnty,
-                    'error': result.get('error', 'Unknown error')
-                })
-                logger.error(f"✗ Chunk {i} failed: {result.get('error', 'Unknown error')}")
-
-        except Exception as e:
-            results['chunks_processed'] += 1
-            results['chunks_failed'] += 1
-            results['failed_chunks'].append({
-                'chunk_num': i,
-                'start_date': chunk_start,
-                'end_date': chunk_end,
-                'county': cnty,
-                'error': str(e)
-            })
-            logger.error(f"✗ Chunk {i} failed with exception: {e}")
-            # Continue to next chunk even on error
+                results['failed_chunks'].append(FailedChunk(
+                    chunk_num=i,
+                    start_date=chunk_start,
+                    end_date=chunk_end,
+                    county=cnty,
+                    error=str(e)
+                ))
+                logger.error(f"✗ Chunk {i} failed with exception: {e}")
+                # Continue to next chunk even on error
+    finally:
+        close_thread_browser()
 
     # Print summary
     logger.info("\n" + "=" * 60)
@@ -164,14 +199,18 @@ def run_batch_scrape(start_date, end_date, chunk_size, county=None, limit=None,
     logger.info(f"Chunks processed: {results['chunks_processed']}")
     logger.info(f"Chunks succeeded: {results['chunks_succeeded']}")
     logger.info(f"Chunks failed: {results['chunks_failed']}")
+    if results['chunks_split']:
+        logger.info(f"Chunks split after truncation: {results['chunks_split']}")
     logger.info(f"Total foreclosures saved: {results['total_cases']}")
 
     if results['failed_chunks']:
-        logger.warning("\nFailed chunks:")
+        # One log record for the whole list rather than two per failure
+        lines = ["\nFailed chunks:"]
         for failed in results['failed_chunks']:
-            county_info = f" ({failed['county']})" if failed.get('county') else ""
-            logger.warning(f"  Chunk {failed['chunk_num']}: {failed['start_date']} to {failed['end_date']}{county_info}")
-            logger.warning(f"    Error: {failed['error']}")
+            county_info = f" ({failed.county})" if failed.county else ""
+            lines.append(f"  Chunk {failed.chunk_num}: {failed.start_date} to {failed.end_date}{county_info}")
+            lines.append(f"    Error: {failed.error}")
+        logger.warning("\n".join(lines))
 
     logger.info("=" * 60)
 
@@ -0,0 +1,145 @@
+"""Per-thread Playwright browser reuse for parallel scrapes.
+
+Playwright's sync API is bound to the thread that started it, so a browser
+can't be handed from one ThreadPoolExecutor worker to another. Instead each
+worker thread lazily launches ONE browser the first time it needs it and
+reuses it for every chunk it runs afterwards.
+
+acquire_context() goes one step further and hands back the thread's single
+long-lived browser context, so keep-alive connections to the portal (and its
+HTTP cache) survive from chunk to chunk. Cookies are cleared on every acquire
+so no portal session/search state leaks between chunks, and the context is
+replaced after CONTEXT_MAX_USES acquires so its memory doesn't grow without
+bound over a long run.
+
+Usage:
+    from scraper.browser_pool import acquire_context, close_pool_browsers
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        ...  # tasks call acquire_context() and pass it to DateRangeScraper
+        close_pool_browsers(executor, workers)
+"""
+
+import threading
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext
+
+from common.config import config
+from common.logger import setup_logger
+from scraper.portal_selectors import USER_AGENT
+
+logger = setup_logger(__name__)
+
+# Seconds to wait for every worker thread to pick up its shutdown task
+SHUTDOWN_TIMEOUT = 60
+
+# Acquires a thread's browser context serves before it is closed and replaced
+CONTEXT_MAX_USES = 50
+
+_local = threading.local()
+
+
+def acquire_browser(headless: bool = False) -> Browser:
+    """
+    Return this thread's browser, launching (or relaunching) it if needed.
+
+    A browser that crashed or was closed is detected via is_connected() and
+    replaced, so one bad chunk doesn't poison the rest of the worker's queue.
+
+    Args:
+        headless: Run the browser in headless mode (default: False for reliability)
+
+    Returns:
+        Browser: Playwright browser owned by the calling thread
+    """
+    browser = getattr(_local, 'browser', None)
+    if browser is not None and browser.is_connected():
+        return browser
+
+    if browser is not None:
+        logger.warning(f"[{threading.current_thread().name}] Browser disconnected, relaunching")
+
+    playwright = getattr(_local, 'playwright', None)
+    if playwright is None:
+        playwright = sync_playwright().start()
+        _local.playwright = playwright
+
+    _local.browser = playwright.chromium.launch(
+        headless=headless,
+        downloads_path=config.get_browser_downloads_path()
+    )
+    logger.debug(f"[{threading.current_thread().name}] Launched pooled browser")
+    return _local.browser
+
+
+def acquire_context() -> BrowserContext:
+    """
+    Return this thread's reusable browser context, with cookies cleared.
+
+    The context is recreated whenever the thread's browser had to be relaunched,
+    and after it has been handed out CONTEXT_MAX_USES times.
+
+    Returns:
+        BrowserContext: Context owned by the calling thread (do not close it)
+    """
+    browser = acquire_browser()
+    context = getattr(_local, 'context', None)
+    if context is not None and getattr(_local, 'context_browser', None) is browser:
+        if _local.context_uses < CONTEXT_MAX_USES:
+            _local.context_uses += 1
+            context.clear_cookies()
+            return context
+
+        logger.debug(f"[{threading.current_thread().name}] Recycling browser context after {_local.context_uses} uses")
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Failed to close recycled browser context: {e}")
+
+    _local.context = browser.new_context(user_agent=USER_AGENT)
+    _local.context_browser = browser
+    _local.context_uses = 1
+    return _local.context
+
+
+def close_thread_browser():
+    """Close the calling thread's browser and stop its Playwright driver, if any."""
+    browser = getattr(_local, 'browser', None)
+    playwright = getattr(_local, 'playwright', None)
+    _local.browser = None
+    _local.playwright = None
+    _local.context = None
+    _local.context_browser = None
+    _local.context_uses = 0
+
+    try:
+        if browser is not None and browser.is_connected():
+            browser.close()
+    finally:
+        if playwright is not None:
+            playwright.stop()
+
+
+def close_pool_browsers(executor, workers: int):
+    """
+    Close the pooled browser on every worker thread of an executor.
+
+    Each shutdown task blocks on a barrier until all `workers` tasks are
+    running, which guarantees they land on distinct threads and so every
+    thread closes its own browser.
+
+    Args:
+        executor: ThreadPoolExecutor whose tasks used acquire_browser()
+        workers: The executor's max_workers
+    """
+    barrier = threading.Barrier(workers)
+
+    def _close():
+        barrier.wait(timeout=SHUTDOWN_TIMEOUT)
+        close_thread_browser()
+
+    for future in [executor.submit(_close) for _ in range(workers)]:
+        try:
+            future.result()
+        except Exception as e:
+            logger.warning(f"Failed to close pooled browser: {e}")
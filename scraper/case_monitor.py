@@ -11,6 +11,7 @@ Usage:
 """
 
 import os
+import queue
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone, date
@@ -26,7 +27,7 @@ from sqlalchemy import or_, func
 from database.connection import get_session
 from database.models import Case, CaseEvent
 from scraper.page_parser import parse_case_detail
-from scraper.pdf_downloader import download_upset_bid_documents, download_all_case_documents
+from scraper.pdf_downloader import download_upset_bid_documents, download_all_case_documents, load_existing_event_keys
 from extraction.classifier import (
     SALE_REPORT_EVENTS,
     BLOCKING_EVENTS,
@@ -44,6 +45,8 @@ from extraction.extractor import (
     update_case_with_extracted_data
 )
 from ocr.processor import extract_text_from_pdf
+from common.config import config
+from common.date_utils import parse_portal_date
 from common.logger import setup_logger
 from common.county_codes import get_county_name
 from common.business_days import calculate_upset_bid_deadline
@@ -51,6 +54,12 @@ from analysis.queue_processor import enqueue_analysis
 
 logger = setup_logger(__name__)
 
+# Currency amounts in case page text, most specific first: "Bid Amount: $123,456.78", then any "$123,456.78"
+_BID_AMOUNT_RES = (
+    re.compile(r'(?:bid|sale|price|amount)[^\$]*\$\s*([\d,]+(?:\.\d{2})?)', re.IGNORECASE),
+    re.compile(r'\$\s*([\d,]+(?:\.\d{2})?)'),
+)
+
 
 class CaseMonitor:
     """Monitor existing cases for status updates."""
@@ -82,6 +91,8 @@ class CaseMonitor:
             'bid_updates': 0,
             'errors': []
         }
+        # case_id -> saved document event keys, prefetched for the whole run by run()
+        self._existing_event_keys = None
 
     def get_cases_to_monitor(self) -> List[Case]:
         """
@@ -359,25 +370,18 @@ class CaseMonitor:
         Returns:
             Decimal bid amount or None
         """
-        # Pattern for currency amounts
-        patterns = [
-            r'(?:bid|sale|price|amount)[^\$]*\$\s*([\d,]+(?:\.\d{2})?)',
-            r'\$\s*([\d,]+(?:\.\d{2})?)',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE)
-            if matches:
-                # Return the FIRST valid amount (most recent chronologically)
-                # NOT the max - we want newest bid, not highest bid
-                for match in matches:
-                    try:
-                        amount = Decimal(match.replace(',', ''))
-                        if amount > 1000:  # Filter out small amounts like filing fees
-                            logger.debug(f"Returning first valid bid amount: ${amount}")
-                            return amount
-                    except Exception as e:
-                        logger.debug(f"Amount parse failed for '{match}': {e}")
+        for pattern in _BID_AMOUNT_RES:
+            # Return the FIRST valid amount (most recent chronologically)
+            # NOT the max - we want newest bid, not highest bid; finditer stops
+            # scanning the page text as soon as one is found
+            for match in (m.group(1) for m in pattern.finditer(page_text)):
+                try:
+                    amount = Decimal(match.replace(',', ''))
+                    if amount > 1000:  # Filter out small amounts like filing fees
+                        logger.debug(f"Returning first valid bid amount: ${amount}")
+                        return amount
+                except Exception as e:
+                    logger.debug(f"Amount parse failed for '{match}': {e}")
 
         return None
 
@@ -406,7 +410,7 @@ class CaseMonitor:
                 # Calculate new deadline (10 days from bid date, adjusted for weekends/holidays)
                 if event_date:
                     try:
-                        bid_date = datetime.strptime(event_date, '%m/%d/%Y').date()
+                        bid_date = parse_portal_date(event_date)
                         adjusted_deadline = calculate_upset_bid_deadline(bid_date)
                         case.next_bid_deadline = datetime.combine(adjusted_deadline, datetime.min.time())
                     except Exception as e:
@@ -461,9 +465,13 @@ class CaseMonitor:
 
         # Download ALL documents for the case (for complete AI analysis)
         # This ensures we have mortgage info, deed details, etc.
+        existing_event_keys = None
+        if self._existing_event_keys is not None:
+            existing_event_keys = self._existing_event_keys.get(case.id, set())
         downloaded = download_all_case_documents(
             page, case.id, county_name, case.case_number,
-            skip_existing=True  # Don't re-download documents we already have
+            skip_existing=True,  # Don't re-download documents we already have
+            existing_event_keys=existing_event_keys
         )
 
         if not downloaded:
@@ -481,14 +489,14 @@ class CaseMonitor:
         # This ensures we process the most recent upset bid documents first
         # and don't overwrite with stale data from older PDFs
         def parse_event_date(doc_info):
-            """Parse event_date string to datetime for sorting, None sorts last."""
+            """Parse event_date string to date for sorting, None sorts last."""
             event_date = doc_info.get('event_date')
             if event_date:
                 try:
-                    return datetime.strptime(event_date, '%m/%d/%Y')
+                    return parse_portal_date(event_date)
                 except:
                     pass
-            return datetime.min  # Documents without dates sort to the end
+            return date.min  # Documents without dates sort to the end
 
         sorted_docs = sorted(downloaded, key=parse_event_date, reverse=True)
 
@@ -723,7 +731,7 @@ class CaseMonitor:
                 event_date = None
                 if event_data.get('event_date'):
                     try:
-                        event_date = datetime.strptime(event_data['event_date'], '%m/%d/%Y').date()
+                        event_date = parse_portal_date(event_data['event_date'])
                     except Exception as e:
                         logger.warning(f"Event date parse failed for {event_data}: {e}")
 
@@ -846,7 +854,7 @@ class CaseMonitor:
                         try:
                             event_date_str = event.get('event_date')
                             if event_date_str:
-                                event_date = datetime.strptime(event_date_str, '%m/%d/%Y').date()
+                                event_date = parse_portal_date(event_date_str)
                                 from common.business_days import calculate_upset_bid_deadline
                                 deadline = calculate_upset_bid_deadline(event_date)
                                 with get_session() as sess:
@@ -986,21 +994,24 @@ class CaseMonitor:
 
         return result
 
-    def _process_case_batch(self, cases: List[Case], worker_id: int) -> List[Dict]:
+    def _process_case_queue(self, case_queue: queue.SimpleQueue, worker_id: int) -> List[Dict]:
         """
-        Process a batch of cases in a single browser instance.
+        Process cases from a shared queue in a single browser instance until it is empty.
+
+        Workers pull one case at a time, so a worker that hits slow cases doesn't
+        hold up cases another idle worker could take.
 
         Args:
-            cases: List of cases to process
+            case_queue: Queue of cases shared by all workers
             worker_id: Worker identifier for logging
 
         Returns:
-            List of result dicts for each case
+            List of result dicts for each case this worker processed
         """
         results = []
 
         with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
+            browser = p.chromium.launch(headless=self.headless, downloads_path=config.get_browser_downloads_path())
             try:
                 # Use a real Chrome user-agent to avoid bot detection
                 context = browser.new_context(
@@ -1008,8 +1019,12 @@ class CaseMonitor:
                 )
                 page = context.new_page()
 
-                for i, case in enumerate(cases):
-                    logger.debug(f"[Worker {worker_id}] Processing case {i+1}/{len(cases)}: {case.case_number}")
+                while True:
+                    try:
+                        case = case_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    logger.debug(f"[Worker {worker_id}] Processing case {len(results) + 1}: {case.case_number}")
                     result = self.process_case(case, page)
                     results.append(result)
 
@@ -1046,26 +1061,23 @@ class CaseMonitor:
 
             return {'cases_to_check': len(cases), 'dry_run': True}
 
-        # Split cases into batches for parallel processing
-        batch_size = max(1, len(cases) // self.max_workers)
-        batches = []
-        for i in range(0, len(cases), batch_size):
-            batches.append(cases[i:i + batch_size])
+        # One query for every case's saved documents instead of one per case
+        self._existing_event_keys = load_existing_event_keys([case.id for case in cases])
 
-        # Limit to max_workers batches (redistribute if we have more)
-        while len(batches) > self.max_workers:
-            # Merge last batch into second-to-last
-            batches[-2].extend(batches[-1])
-            batches.pop()
+        # Workers pull cases from one shared queue instead of fixed per-worker batches
+        case_queue = queue.SimpleQueue()
+        for case in cases:
+            case_queue.put(case)
+        workers = min(self.max_workers, len(cases))
 
-        logger.info(f"Split into {len(batches)} batches: {[len(b) for b in batches]}")
+        logger.info(f"Starting {workers} workers on a shared queue of {len(cases)} cases")
 
-        # Process batches in parallel
+        # Process the queue in parallel
         all_results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
             futures = {
-                executor.submit(self._process_case_batch, batch, i): i
-                for i, batch in enumerate(batches)
+                executor.submit(self._process_case_queue, case_queue, i): i
+                for i in range(workers)
             }
 
             for future in as_completed(futures):
@@ -212,8 +212,8 @@ def run_new_case_search(target_date: datetime.date, dry_run: bool = False) -> Di
 
     try:
         scraper = DateRangeScraper(
-            start_date=target_date.strftime('%Y-%m-%d'),
-            end_date=target_date.strftime('%Y-%m-%d'),
+            start_date=target_date,
+            end_date=target_date,
             counties=TARGET_COUNTIES
         )
         result = scraper.run()
@@ -11,13 +11,15 @@ Usage:
 
 import json
 import sys
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
 from playwright.sync_api import sync_playwright
 
 from database.connection import get_session
 from database.models import Case, CaseEvent, Party, Hearing, ScrapeLog, SkippedCase
 from scraper.captcha_solver import solve_recaptcha
-from scraper.page_parser import is_foreclosure_case, parse_search_results, parse_case_detail, extract_total_count
+from scraper.page_parser import is_foreclosure_case, parse_search_results, parse_search_page, parse_case_detail
 from scraper.portal_interactions import (
     click_advanced_filter,
     fill_search_form,
@@ -26,10 +28,11 @@ from scraper.portal_interactions import (
     extract_total_count_from_page,
     go_to_next_page
 )
-from scraper.portal_selectors import PORTAL_URL
+from scraper.portal_selectors import PORTAL_URL, USER_AGENT
 from scraper.pdf_downloader import download_case_documents
 from common.county_codes import get_county_code, get_county_name, COUNTY_CODES
 from common.config import config
+from common.date_utils import parse_date
 from common.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -38,30 +41,55 @@ logger = setup_logger(__name__)
 TARGET_COUNTIES = ['wake', 'durham', 'orange', 'chatham', 'lee', 'harnett']
 
 
+class TruncatedResultsError(Exception):
+    """The portal capped the search results - the date range needs to be narrower."""
+
+
+@dataclass(slots=True)
+class FailedChunk:
+    """A date chunk that batch/parallel scrapes gave up on."""
+    chunk_num: int
+    start_date: Optional[date]
+    end_date: Optional[date]
+    county: Optional[str]
+    error: str
+
+
 class DateRangeScraper:
     """Scraper for multi-county date range searches."""
 
-    def __init__(self, start_date, end_date, counties=None, test_mode=False, limit=None, skip_existing=True, party_name=None):
+    def __init__(self, start_date, end_date, counties=None, test_mode=False, limit=None, skip_existing=True, party_name=None,
+                 browser=None, context=None):
         """
         Initialize scraper.
 
         Args:
-            start_date: Start date (YYYY-MM-DD string)
-            end_date: End date (YYYY-MM-DD string)
+            start_date: Start date (date object or YYYY-MM-DD string)
+            end_date: End date (date object or YYYY-MM-DD string)
             counties: List of county names (default: all 6 target counties)
             test_mode: If True, limit scraping for testing
             limit: Maximum number of cases to process (for testing)
             skip_existing: If True, skip cases already in DB (default: True)
             party_name: Optional party name to filter search (default: None)
+            browser: Optional already-launched Playwright browser to reuse. The scraper
+                opens (and closes) its own context in it but leaves the browser running.
+                Default: launch and close a dedicated browser.
+            context: Optional browser context to reuse (takes precedence over browser).
+                Keeps its connections/HTTP cache warm across scrapes; the scraper only
+                closes the pages it opens.
         """
-        self.start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-        self.end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+        # Chunked callers already hold date objects; only parse strings
+        self.start_date = parse_date(start_date) if isinstance(start_date, str) else start_date
+        self.end_date = parse_date(end_date) if isinstance(end_date, str) else end_date
         self.counties = counties or TARGET_COUNTIES
         self.test_mode = test_mode
         self.limit = limit
         self.skip_existing = skip_existing
         self.party_name = party_name
+        self.browser = browser
+        self.context = context
         self.scrape_log_id = None
+        self._detail_page = None
 
         # Validate counties
         for county in self.counties:
@@ -87,34 +115,35 @@ class DateRangeScraper:
         # Create scrape log
         self.scrape_log_id = self._create_scrape_log()
         cases_processed = 0
+        cases_found = None
         status = 'failed'
         error_message = None
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
-                # Use a real Chrome user-agent to avoid bot detection
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                page = context.new_page()
-
-                try:
-                    result = self._scrape_cases(page, context)
-                    cases_processed = result.get('cases_processed', 0)
-                    status = 'success'
-
-                except Exception as e:
-                    error_message = str(e)
-                    logger.error(f"Scrape failed: {e}")
-                    raise
+            if self.context is not None:
+                result = self._scrape_in_context(self.context)
+            elif self.browser is not None:
+                result = self._scrape_in_browser(self.browser)
+            else:
+                with sync_playwright() as p:
+                    browser = p.chromium.launch(headless=False, downloads_path=config.get_browser_downloads_path())
+                    try:
+                        result = self._scrape_in_browser(browser)
+                    finally:
+                        browser.close()
+
+            cases_processed = result.get('cases_processed', 0)
+            # Left unset when --limit stopped the scrape early, marking the run incomplete
+            cases_found = result.get('cases_found')
+            status = 'success'
 
-                finally:
-                    context.close()
-                    browser.close()
+        except Exception as e:
+            error_message = str(e)
+            logger.error(f"Scrape failed: {e}")
+            raise
 
         finally:
-            self._update_scrape_log(status, cases_processed, error_message)
+            self._update_scrape_log(status, cases_processed, error_message, cases_found)
 
         logger.info("=" * 60)
         logger.info(f"SCRAPE COMPLETE: {cases_processed} foreclosures saved")
@@ -127,12 +156,62 @@ class DateRangeScraper:
             'scrape_log_id': self.scrape_log_id
         }
 
+    def _scrape_in_browser(self, browser):
+        """Run the scrape in a fresh context of the given browser."""
+        # Use a real Chrome user-agent to avoid bot detection
+        context = browser.new_context(user_agent=USER_AGENT)
+        try:
+            return self._scrape_in_context(context)
+        finally:
+            context.close()
+
+    def _scrape_in_context(self, context):
+        """Run the scrape in a new page of the given context."""
+        page = context.new_page()
+        self._detail_page = None
+        try:
+            return self._scrape_cases(page, context)
+        finally:
+            self._discard_detail_page()
+            page.close()
+
+    def _get_detail_page(self, context):
+        """
+        Return the tab used for case detail pages, opening it on first use.
+
+        One tab is reused for every case in the scrape (each case navigates it
+        with goto) rather than opening and closing a tab per case. A tab that
+        crashed, or that a case failed on, is discarded and the next case opens
+        a fresh one.
+        """
+        if self._detail_page is None or self._detail_page.is_closed():
+            self._detail_page = context.new_page()
+            self._detail_page.on('crash', self._on_detail_page_crash)
+        return self._detail_page
+
+    def _on_detail_page_crash(self, page):
+        """Drop a crashed detail tab so the next case doesn't reuse it."""
+        logger.warning("  Case detail tab crashed, opening a new one for the next case")
+        if self._detail_page is page:
+            self._discard_detail_page()
+
+    def _discard_detail_page(self):
+        """Close the detail tab (if any) so the next _get_detail_page opens a new one."""
+        page, self._detail_page = self._detail_page, None
+        if page is None or page.is_closed():
+            return
+        try:
+            page.close()
+        except Exception as e:
+            logger.debug(f"  Error closing detail tab: {e}")
+
     def _create_scrape_log(self):
         """Create a scrape log entry."""
         with get_session() as session:
             log = ScrapeLog(
                 scrape_type='daily',
-                county_code='MULTI',  # Special code for multi-county searches
+                # Special code for multi-county searches
+                county_code=get_county_code(self.counties[0]) if len(self.counties) == 1 else 'MULTI',
                 start_date=self.start_date,
                 end_date=self.end_date,
                 status='in_progress'
@@ -141,16 +220,26 @@ class DateRangeScraper:
             session.commit()
             return log.id
 
-    def _update_scrape_log(self, status, cases_processed, error_message=None):
-        """Update the scrape log with results."""
+    def _update_scrape_log(self, status, cases_processed, error_message=None, cases_found=None):
+        """Update the scrape log with results (single UPDATE, no read-back)."""
         with get_session() as session:
-            log = session.query(ScrapeLog).filter_by(id=self.scrape_log_id).first()
-            if log:
-                log.status = status
-                log.cases_processed = cases_processed
-                log.error_message = error_message
-                log.completed_at = datetime.now()  # Use local time to match started_at
-                session.commit()
+            session.query(ScrapeLog).filter_by(id=self.scrape_log_id).update({
+                'status': status,
+                'cases_found': cases_found,
+                'cases_processed': cases_processed,
+                'error_message': error_message,
+                'completed_at': datetime.now()  # Use local time to match started_at
+            }, synchronize_session=False)
+            session.commit()
+
+    def _existing_case_numbers(self, cases):
+        """Return which of a results page's case numbers are already in the DB (one query)."""
+        case_numbers = [case_info['case_number'] for case_info in cases]
+        if not case_numbers:
+            return set()
+        with get_session() as session:
+            rows = session.query(Case.case_number).filter(Case.case_number.in_(case_numbers)).all()
+            return {row.case_number for row in rows}
 
     def _scrape_cases(self, page, context):
         """Main scraping logic."""
@@ -191,7 +280,7 @@ class DateRangeScraper:
         has_error, error_msg = check_for_error(page)
         if has_error and error_msg:
             if 'could have returned more' in error_msg.lower() or 'too many' in error_msg.lower():
-                raise Exception(f"Results truncated - date range too wide: {error_msg}")
+                raise TruncatedResultsError(f"Results truncated - date range too wide: {error_msg}")
 
         # Extract total count
         total_count = extract_total_count_from_page(page)
@@ -205,16 +294,29 @@ class DateRangeScraper:
             logger.info(f"Processing page {page_num}...")
 
             page_html = page.content()
-            results = parse_search_results(page_html)
+            if page_num == 1 and total_count is None:
+                # Pager locator missed - recover the count from the same parse
+                results, total_count = parse_search_page(page_html)
+                if total_count is not None:
+                    logger.info(f"Recovered total count from page HTML: {total_count} cases")
+            else:
+                results = parse_search_results(page_html)
             cases = results['cases']
 
+            # Skip existing cases if configured (default behavior)
+            existing = self._existing_case_numbers(cases) if self.skip_existing else set()
+
             for case_info in cases:
                 if self.limit and cases_processed >= self.limit:
                     logger.info(f"Reached limit of {self.limit} cases")
                     return {'cases_processed': cases_processed}
 
-                # Process case in new tab
-                if self._process_case_in_new_tab(context, case_info):
+                if case_info['case_number'] in existing:
+                    logger.debug(f"  Skipping existing case {case_info['case_number']}")
+                    continue
+
+                # Process case in the detail tab
+                if self._process_case_in_detail_tab(context, case_info):
                     cases_processed += 1
 
             # Check for next page
@@ -228,20 +330,12 @@ class DateRangeScraper:
             'cases_found': total_count or cases_processed
         }
 
-    def _process_case_in_new_tab(self, context, case_info):
-        """Process a case in a new browser tab."""
+    def _process_case_in_detail_tab(self, context, case_info):
+        """Process a case in the scrape's reusable detail tab."""
         case_number = case_info['case_number']
         case_url = case_info.get('case_url')
         location = case_info.get('location', '')
 
-        # Skip existing cases if configured (default behavior)
-        if self.skip_existing:
-            with get_session() as session:
-                existing = session.query(Case).filter_by(case_number=case_number).first()
-                if existing:
-                    logger.debug(f"  Skipping existing case {case_number}")
-                    return False
-
         logger.info(f"Processing case: {case_number} ({location})")
 
         if not case_url:
@@ -274,8 +368,8 @@ class DateRangeScraper:
             logger.warning(f"  Could not determine county from case number '{case_number}' or location '{location}', skipping")
             return False
 
-        # Open case in new tab
-        detail_page = context.new_page()
+        # Open case in the detail tab
+        detail_page = self._get_detail_page(context)
 
         try:
             detail_page.goto(case_url, wait_until='networkidle')
@@ -285,6 +379,8 @@ class DateRangeScraper:
                 detail_page.wait_for_selector('table.roa-caseinfo-info-rows', state='visible', timeout=30000)
             except:
                 logger.warning(f"  Case detail page didn't load properly for {case_number}")
+                # The tab may be hung - don't reuse it for the next case
+                self._discard_detail_page()
                 return False
 
             # Parse case details
@@ -316,11 +412,10 @@ class DateRangeScraper:
 
         except Exception as e:
             logger.error(f"  Error processing case {case_number}: {e}")
+            # A failed goto usually means a crashed or hung tab - start the next case fresh
+            self._discard_detail_page()
             return False
 
-        finally:
-            detail_page.close()
-
     def _save_case(self, case_number, case_url, county_code, county_name, case_data):
         """Save case to database with upsert logic. Returns case ID on success."""
         with get_session() as session:
@@ -441,12 +536,6 @@ def run_date_range_scrape(start_date, end_date, counties=None, dry_run=False):
     Returns:
         dict: Results with cases_processed, status, error
     """
-    # Convert date objects to strings if needed
-    if hasattr(start_date, 'strftime'):
-        start_date = start_date.strftime('%Y-%m-%d')
-    if hasattr(end_date, 'strftime'):
-        end_date = end_date.strftime('%Y-%m-%d')
-
     if dry_run:
         counties_list = counties or TARGET_COUNTIES
         logger.info("=" * 60)
@@ -1,12 +1,113 @@
 """HTML parsing utilities for NC Courts Portal."""
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
 from bs4 import BeautifulSoup
 from common.logger import setup_logger
 from scraper.portal_selectors import PORTAL_URL
 
 logger = setup_logger(__name__)
 
+# Precompiled patterns used by the parsers below. Keeping them at module scope
+# gives every hot function stable, typed globals (this module type-checks and
+# compiles under mypyc: scripts/build_compiled_parser.py) and skips the re
+# module's cache lookup on each call.
+_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+_DATE_LINE_RE = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+_DATE_PREFIX_RE = re.compile(r'^\d{2}/\d{2}/\d{4}')
+_STYLE_RE = re.compile(r'(FORECLOSURE[^§\n]{3,100})')
+_FILED_ON_RE = re.compile(r'Filed on:\s*(\d{2}/\d{2}/\d{4})')
+# One stripped line made of letters, digits, spaces, parens, slashes and hyphens
+# (e.g. "Chapter 45", "Sale/Resale"); [^\S\n] is whitespace that stays on the line
+_EVENT_TYPE_LINE_RE = re.compile(
+    r'^[^\S\n]*([A-Z](?:[a-zA-Z()/\-0-9]|[^\S\n])*?)[^\S\n]*$', re.MULTILINE
+)
+# Metadata and non-event-type content that disqualifies an event type candidate
+_EVENT_TYPE_SKIP_RE = re.compile('|'.join(map(re.escape, [
+    'Index', 'Created', 'Filed By', 'Against', 'A document is available', 'Click here', 'Receipt #',
+])))
+# Party types we keep from the Party Information table
+_VALID_PARTY_RE = re.compile(
+    'Respondent|Petitioner|Trustee|Plaintiff|Defendant|Garnishee|Applicant|Attorney|Guardian'
+)
+_CAPITALIZED_RE = re.compile(r'^[A-Z]')
+_ZIP_SUFFIX_RE = re.compile(r'\d{5}$')
+_DIGITS_LINE_RE = re.compile(r'^\d+$')
+# Event block fields (date, hearing date/time, Index #, Filed By, Against) in
+# one scan. The alternation sits in a zero-width lookahead so finditer reports
+# every position, giving the same first-occurrence results as separate searches;
+# the alternatives never start on the same character so none can shadow another.
+_EVENT_FIELDS_RE = re.compile(
+    r'(?=(?P<date>\d{2}/\d{2}/\d{4})(?:\s+(?P<time>\d{1,2}:\d{2}))?'
+    r'|Index\s*#\s*(?P<index>\d+)'
+    r'|Filed By:\s*(?P<filed_by>[^§\n]+)'
+    r'|Against:\s*(?P<against>[^§\n]+))'
+)
+_HEARING_TIME_RE = re.compile(r'\((\d{1,2}:\d{2}\s*(?:AM|PM)?)\)', re.IGNORECASE)
+_PARENTHESIZED_RE = re.compile(r'\([^)]+\)')
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_PAGER_TOTAL_RE = re.compile(r'of\s+(\d+)\s+items?', re.IGNORECASE)
+
+
+
+class _Record:
+    """Read-only mapping access so existing dict-style callers keep working.
+
+    Supports ``record.get('field')``, ``record['field']``, ``'field' in record``
+    and ``dict(record)`` (the latter is what to hand to ``json.dumps``).
+    """
+
+    __slots__ = ()
+
+    def keys(self):
+        return self.__dataclass_fields__.keys()
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__dataclass_fields__ else default
+
+    def __contains__(self, key):
+        return key in self.__dataclass_fields__
+
+    def __getitem__(self, key):
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+@dataclass(slots=True)
+class Event(_Record):
+    """Event parsed from the Register of Actions."""
+    event_date: Optional[str] = None
+    event_type: Optional[str] = None
+    event_index: Optional[int] = None
+    event_description: Optional[str] = None
+    document_title: Optional[str] = None
+    filed_by: Optional[str] = None
+    filed_against: Optional[str] = None
+    hearing_date: Optional[str] = None
+    document_url: Optional[str] = None
+    has_document: bool = False
+
+
+@dataclass(slots=True)
+class Party(_Record):
+    """Party parsed from the Party Information table."""
+    party_type: str
+    party_name: str
+
+
+@dataclass(slots=True)
+class Hearing(_Record):
+    """Hearing parsed from the Hearings section."""
+    hearing_date: str
+    hearing_time: Optional[str] = None
+    hearing_type: Optional[str] = None
+
+
 # Event types that indicate a foreclosure case
 FORECLOSURE_EVENT_INDICATORS = [
     'foreclosure (special proceeding)',
@@ -74,7 +175,30 @@ NON_PROPERTY_INDICATORS = [
 ]
 
 
-def is_foreclosure_case(case_data):
+def _is_document_label(aria_label: Optional[str]) -> bool:
+    """aria-label filter for the event's document button."""
+    return aria_label is not None and 'document' in aria_label.lower()
+
+
+def _indicator_regex(indicators: List[str]) -> re.Pattern:
+    """Compile a list of literal indicator substrings into one alternation."""
+    return re.compile('|'.join(re.escape(indicator) for indicator in indicators))
+
+
+_NON_PROPERTY_RE = _indicator_regex(NON_PROPERTY_INDICATORS)
+_FORECLOSURE_EVENT_RE = _indicator_regex(FORECLOSURE_EVENT_INDICATORS)
+_UPSET_BID_OPPORTUNITY_RE = _indicator_regex(UPSET_BID_OPPORTUNITY_INDICATORS)
+_SALE_DOCUMENT_RE = _indicator_regex(SALE_DOCUMENT_INDICATORS)
+
+
+def _matched_line(haystack: str, match: re.Match) -> str:
+    """Return the newline-delimited entry of ``haystack`` containing ``match``."""
+    start = haystack.rfind('\n', 0, match.start()) + 1
+    end = haystack.find('\n', match.end())
+    return haystack[start:] if end == -1 else haystack[start:end]
+
+
+def is_foreclosure_case(case_data: dict) -> bool:
     """
     Determine if a case is a foreclosure OR upset bid opportunity.
 
@@ -90,24 +214,37 @@ def is_foreclosure_case(case_data):
     Returns:
         bool: True if case is a foreclosure or upset bid opportunity
     """
+    # Bind the hot lookups to locals once
+    non_property_search = _NON_PROPERTY_RE.search
+    sale_document_search = _SALE_DOCUMENT_RE.search
+
     # Get events for checking
     events = case_data.get('events') or []
     case_type = (case_data.get('case_type') or '').lower()
 
     # Check case_type for non-property indicators FIRST (exclusions)
     # This catches cases like "Incompetency" before checking events
-    for indicator in NON_PROPERTY_INDICATORS:
-        if indicator in case_type:
-            logger.debug(f"Non-property case identified by case type: {case_type}")
-            return False
+    if non_property_search(case_type):
+        logger.debug(f"Non-property case identified by case type: {case_type}")
+        return False
+
+    # Read each event's fields once, then scan all events at once per indicator
+    # list; indicators never contain newlines, so a match can't straddle two events
+    event_type_list = []
+    document_title_list = []
+    description_list = []
+    for event in events:
+        get = event.get
+        event_type_list.append((get('event_type') or '').lower())
+        document_title_list.append((get('document_title') or '').lower())
+        description_list.append((get('event_description') or '').lower())
+    event_types = '\n'.join(event_type_list)
 
     # Check events for non-property indicators (exclusions)
-    for event in events:
-        event_type = (event.get('event_type') or '').lower()
-        for indicator in NON_PROPERTY_INDICATORS:
-            if indicator in event_type:
-                logger.debug(f"Non-property case identified by event type: {event_type}")
-                return False
+    match = non_property_search(event_types)
+    if match:
+        logger.debug(f"Non-property case identified by event type: {_matched_line(event_types, match)}")
+        return False
 
     # Check case type - must contain "foreclosure"
     if 'foreclosure' in case_type:
@@ -115,58 +252,45 @@ def is_foreclosure_case(case_data):
         return True
 
     # Check events for foreclosure indicators
-    for event in events:
-        event_type = (event.get('event_type') or '').lower()
-        for indicator in FORECLOSURE_EVENT_INDICATORS:
-            if indicator in event_type:
-                logger.debug(f"Foreclosure identified by event: {event_type}")
-                return True
+    match = _FORECLOSURE_EVENT_RE.search(event_types)
+    if match:
+        logger.debug(f"Foreclosure identified by event: {_matched_line(event_types, match)}")
+        return True
 
     # Check for non-foreclosure upset bid opportunities (partition sales, etc.)
-    for event in events:
-        event_type = (event.get('event_type') or '').lower()
-        for indicator in UPSET_BID_OPPORTUNITY_INDICATORS:
-            if indicator in event_type:
-                logger.debug(f"Upset bid opportunity identified by event: {event_type}")
-                return True
+    match = _UPSET_BID_OPPORTUNITY_RE.search(event_types)
+    if match:
+        logger.debug(f"Upset bid opportunity identified by event: {_matched_line(event_types, match)}")
+        return True
 
     # Check document titles for sale indicators (for day-1 detection)
-    for event in events:
-        document_title = (event.get('document_title') or '').lower()
-        if document_title:
-            for indicator in SALE_DOCUMENT_INDICATORS:
-                if indicator in document_title:
-                    logger.debug(f"Sale opportunity identified by document title: {document_title}")
-                    return True
-
-    # Also check event_type for sale indicators (e.g., "Petition To Sell")
-    for event in events:
-        event_type = (event.get('event_type') or '').lower()
-        if event_type:
-            # Exclude motor vehicle sales
-            if 'motor vehicle' in event_type:
-                continue
-            for indicator in SALE_DOCUMENT_INDICATORS:
-                if indicator in event_type:
-                    logger.debug(f"Sale opportunity identified by event type: {event_type}")
-                    return True
+    document_titles = '\n'.join(document_title_list)
+    match = sale_document_search(document_titles)
+    if match:
+        logger.debug(f"Sale opportunity identified by document title: {_matched_line(document_titles, match)}")
+        return True
+
+    # Also check event_type for sale indicators (e.g., "Petition To Sell").
+    # Motor vehicle events were already excluded by the non-property check above.
+    match = sale_document_search(event_types)
+    if match:
+        logger.debug(f"Sale opportunity identified by event type: {_matched_line(event_types, match)}")
+        return True
 
     # Check event_description for sale indicators (e.g., "Petition to Sell/Lease/Mortgage Ward's Estate")
-    for event in events:
-        event_description = (event.get('event_description') or '').lower()
-        if event_description:
-            # Exclude motor vehicle sales
-            if 'motor vehicle' in event_description:
-                continue
-            for indicator in SALE_DOCUMENT_INDICATORS:
-                if indicator in event_description:
-                    logger.debug(f"Sale opportunity identified by event description: {event_description}")
-                    return True
+    # Exclude motor vehicle sales
+    event_descriptions = '\n'.join(
+        description for description in description_list if 'motor vehicle' not in description
+    )
+    match = sale_document_search(event_descriptions)
+    if match:
+        logger.debug(f"Sale opportunity identified by event description: {_matched_line(event_descriptions, match)}")
+        return True
 
     return False
 
 
-def parse_search_results(page_content):
+def parse_search_results(page_content: str, soup: Optional[BeautifulSoup] = None) -> dict:
     """
     Parse search results page to extract case information.
 
@@ -185,6 +309,7 @@ def parse_search_results(page_content):
 
     Args:
         page_content: HTML content of search results page
+        soup: Already-parsed tree of page_content (skips re-parsing)
 
     Returns:
         dict: {
@@ -192,7 +317,8 @@ def parse_search_results(page_content):
             'total_count': int
         }
     """
-    soup = BeautifulSoup(page_content, 'html.parser')
+    if soup is None:
+        soup = BeautifulSoup(page_content, 'html.parser')
     cases = []
 
     # Method 1: Try Kendo UI Grid rows
@@ -259,7 +385,7 @@ def parse_search_results(page_content):
     }
 
 
-def parse_case_detail(page_content):
+def parse_case_detail(page_content: str) -> dict:
     """
     Parse case detail page (Register of Actions) to extract all case information.
 
@@ -274,11 +400,13 @@ def parse_case_detail(page_content):
         page_content: HTML content of case detail page
 
     Returns:
-        dict: Case data including case info, parties, events, hearings, documents
+        dict: Case data including case info, parties, events, hearings, documents.
+            Parties, events and hearings are Party/Event/Hearing records, which also
+            support dict-style ``get()``/``[]``/``in`` reads; use ``dict(record)`` to serialize.
     """
     soup = BeautifulSoup(page_content, 'html.parser')
 
-    case_data = {
+    case_data: Dict[str, Any] = {
         'case_type': None,
         'case_status': None,
         'file_date': None,
@@ -315,7 +443,7 @@ def parse_case_detail(page_content):
     # ========== 2. STYLE (Case Title) ==========
     # Look for the case title like "FORECLOSURE (HOA) - Mark Dwayne Ellis"
     # It's in a div within the Case Summary section
-    style_match = re.search(r'(FORECLOSURE[^§\n]{3,100})', page_text)
+    style_match = _STYLE_RE.search(page_text)
     if style_match:
         style_text = style_match.group(1).strip()
         # Clean up the style - remove extra whitespace
@@ -325,7 +453,7 @@ def parse_case_detail(page_content):
             logger.debug(f"Style: {style_text}")
 
     # ========== 3. FILE DATE ==========
-    filed_match = re.search(r'Filed on:\s*(\d{2}/\d{2}/\d{4})', page_text)
+    filed_match = _FILED_ON_RE.search(page_text)
     if filed_match:
         case_data['file_date'] = filed_match.group(1)
         logger.debug(f"File date: {case_data['file_date']}")
@@ -343,13 +471,8 @@ def parse_case_detail(page_content):
                 party_name = cells[1].get_text(strip=True).replace('\xa0', ' ')
 
                 # Validate this looks like a party row
-                valid_party_types = ['Respondent', 'Petitioner', 'Trustee', 'Plaintiff', 'Defendant',
-                                    'Garnishee', 'Applicant', 'Attorney', 'Guardian']
-                if party_type and party_name and any(pt in party_type for pt in valid_party_types):
-                    case_data['parties'].append({
-                        'party_type': party_type,
-                        'party_name': party_name
-                    })
+                if party_type and party_name and _VALID_PARTY_RE.search(party_type):
+                    case_data['parties'].append(Party(party_type=party_type, party_name=party_name))
                     logger.debug(f"Party: {party_type} - {party_name}")
 
     # ========== 5. EVENTS ==========
@@ -360,14 +483,32 @@ def parse_case_detail(page_content):
     for event_div in event_divs:
         event_text = event_div.get_text()
 
-        # Extract event date (first date in the block)
-        date_match = re.search(r'(\d{2}/\d{2}/\d{4})', event_text)
-        event_date = date_match.group(1) if date_match else None
+        # Extract event date (first date in the block), hearing date/time, Index number,
+        # Filed By and Against from a single pass over the block text
+        event_date = None
+        hearing_date = None
+        event_index = None
+        filed_by = None
+        filed_against = None
+        for field_match in _EVENT_FIELDS_RE.finditer(event_text):
+            field_date = field_match.group('date')
+            if field_date:
+                if event_date is None:
+                    event_date = field_date
+                if hearing_date is None and field_match.group('time'):
+                    hearing_date = f"{field_date} {field_match.group('time')}"
+            elif field_match.group('index'):
+                if event_index is None:
+                    event_index = int(field_match.group('index'))
+            elif field_match.group('filed_by'):
+                if filed_by is None:
+                    filed_by = field_match.group('filed_by').strip()
+            elif filed_against is None:
+                filed_against = field_match.group('against').strip()
 
         # Extract event type - FIRST check for label attribute on roa-data elements
         # This captures full event descriptions like "Petition to Sell/Lease/Mortgage Ward's Estate"
         event_type = None
-        event_description = None
 
         # Check for label attribute (preferred method - most accurate)
         roa_data_with_label = event_div.find(attrs={'label': lambda v: v and len(v) > 3 and ':' not in v})
@@ -380,63 +521,53 @@ def parse_case_detail(page_content):
 
         # Fallback: Extract from text content if label not found
         if not event_type:
-            lines = [l.strip() for l in event_text.split('\n') if l.strip()]
-            event_type_index = None
-
-            # Skip patterns - metadata and non-event-type content
-            skip_patterns = ['Index', 'Created', 'Filed By', 'Against', 'A document is available',
-                            'Click here', 'Receipt #']
-
-            for i, line in enumerate(lines):
-                # Event types are usually capitalized phrases
-                # Allow letters, spaces, parens, numbers, slashes, hyphens (for types like "Chapter 45", "Sale/Resale")
-                if (re.match(r'^[A-Z][a-zA-Z\s()/\-0-9]+$', line) and
-                    5 < len(line) < 100 and
-                    not any(skip in line for skip in skip_patterns)):
-                    event_type = line
-                    event_type_index = i
+            # Event types are usually capitalized phrases on their own line.
+            # A single MULTILINE finditer walks the stripped lines in C rather than
+            # splitting the block and matching each line from Python.
+            for type_match in _EVENT_TYPE_LINE_RE.finditer(event_text):
+                candidate = type_match.group(1)
+                if 5 < len(candidate) < 100 and not _EVENT_TYPE_SKIP_RE.search(candidate):
+                    event_type = candidate
                     break
 
             # Fallback: Try to concatenate adjacent short lines that might form an event type
             # This handles cases where portal splits "Order" and "for Sale of Ward's Property" into separate elements
             if event_type is None:
+                lines = [l.strip() for l in event_text.split('\n') if l.strip()]
+
                 # Find lines after the date that might be event type fragments
                 date_found = False
                 potential_fragments = []
-                fragment_start_index = None
 
-                for i, line in enumerate(lines):
+                for line in lines:
                     # Skip until we're past the date
-                    if re.match(r'^\d{2}/\d{2}/\d{4}$', line):
+                    if _DATE_LINE_RE.match(line):
                         date_found = True
                         continue
                     if not date_found:
                         continue
 
                     # Stop at metadata
-                    if any(skip in line for skip in skip_patterns):
+                    if _EVENT_TYPE_SKIP_RE.search(line):
                         break
                     # Skip dates and times
-                    if re.match(r'^\d{2}/\d{2}/\d{4}', line):
+                    if _DATE_PREFIX_RE.match(line):
                         break
 
                     # Collect short fragments that could be part of event type
                     # "Order" (5 chars) followed by "for Sale of Ward's Real Property"
-                    if len(line) <= 50 and not re.match(r'^\d+$', line):
-                        if fragment_start_index is None:
-                            fragment_start_index = i
+                    if len(line) <= 50 and not _DIGITS_LINE_RE.match(line):
                         potential_fragments.append(line)
 
                         # Try combining collected fragments
                         combined = ' '.join(potential_fragments)
                         # Check if combined text looks like an event type (starts with capital, reasonable length)
-                        if (re.match(r'^[A-Z]', combined) and
+                        if (_CAPITALIZED_RE.match(combined) and
                             5 < len(combined) < 150 and
-                            not any(skip in combined for skip in skip_patterns)):
+                            not _EVENT_TYPE_SKIP_RE.search(combined)):
                             # Verify it's not just a party name or address
-                            if not re.search(r'\d{5}$', combined):  # Not ending in zip code
+                            if not _ZIP_SUFFIX_RE.search(combined):  # Not ending in zip code
                                 event_type = combined
-                                event_type_index = fragment_start_index
                                 # Don't break yet - try to get more complete event type
 
                         # Stop after collecting enough fragments
@@ -447,65 +578,16 @@ def parse_case_detail(page_content):
                         if potential_fragments:
                             break
 
-        # Set event_type_index for description extraction (if we got it from label, skip description extraction)
-        event_type_index = None
-        if event_type:
-            # If event_type came from label attribute, we don't have an event_type_index from text parsing
-            # We still want to try to extract description though
-            lines = [l.strip() for l in event_text.split('\n') if l.strip()]
-
-        # Extract event description - the line(s) after event type that contain details
-        # Examples: "1508 Beacon Village Drive, Raleigh 27604" for Report of Sale
-        #           "Petition for Possession..." for Petition To Sell
-        #           "Bid Amount $9,830.00 Deposit Amount $750.00" for Upset Bid Filed
-        if event_type_index is not None:
-            # Labels that indicate we've reached metadata (stop here)
-            stop_labels = ['Index', 'Created', 'Filed By', 'Against', 'Index #']
-            # Labels to skip over but continue looking
-            skip_labels = ['A document is available', 'Click here', 'document']
-            desc_lines = []
-            for line in lines[event_type_index + 1:]:
-                # Stop at form labels or metadata
-                if any(stop in line for stop in stop_labels):
-                    break
-                # Skip document-related lines but continue looking for description
-                if any(skip in line for skip in skip_labels):
-                    continue
-                # Skip dates that look like Created dates (MM/DD/YYYY format followed by time)
-                if re.match(r'^\d{2}/\d{2}/\d{4}\s+\d{1,2}:\d{2}', line):
-                    break
-                # Skip pure dates
-                if re.match(r'^\d{2}/\d{2}/\d{4}$', line):
-                    continue
-                # Capture substantive description lines (e.g., "Bid Amount $9,830.00 Deposit...")
-                if len(line) > 3 and len(line) < 500:
-                    desc_lines.append(line)
-                    # Usually just one or two lines of description
-                    if len(desc_lines) >= 2:
-                        break
-            if desc_lines:
-                event_description = ' '.join(desc_lines)
-
-        # Extract Index number
-        index_match = re.search(r'Index\s*#\s*(\d+)', event_text)
-
-        # Extract Filed By and Against
-        filed_by_match = re.search(r'Filed By:\s*([^§\n]+)', event_text)
-        against_match = re.search(r'Against:\s*([^§\n]+)', event_text)
-
-        # Extract hearing date/time if present
-        hearing_match = re.search(r'(\d{2}/\d{2}/\d{4})\s+(\d{1,2}:\d{2})', event_text)
-
         # Check for document link
-        doc_button = event_div.find('button', attrs={'aria-label': lambda v: v and 'document' in v.lower()}) if event_div.find('button') else None
+        doc_button = event_div.find('button', attrs={'aria-label': _is_document_label})
         has_document = doc_button is not None
 
         # Extract document title (text on clickable document link)
         document_title = None
-        doc_link = event_div.find('a') or event_div.find('button', attrs={'aria-label': lambda v: v and 'document' in v.lower()})
+        doc_link = event_div.find('a') or doc_button
         if doc_link:
             # Get text near the document link - usually the document title
-            doc_text = doc_link.get_text(strip=True) if doc_link else None
+            doc_text = doc_link.get_text(strip=True)
             if not doc_text or doc_text == 'Click here to view the document':
                 # Look for text in sibling or parent elements
                 parent = doc_link.parent
@@ -515,7 +597,8 @@ def parse_case_detail(page_content):
                     # Extract document title - usually after "A document is available"
                     for line in parent_text.split('\n'):
                         line = line.strip()
-                        if line and 'document is available' not in line.lower() and 'click here' not in line.lower():
+                        lowered = line.lower()
+                        if line and 'document is available' not in lowered and 'click here' not in lowered:
                             if 5 < len(line) < 200 and not line.startswith('Index') and not line.startswith('Created'):
                                 document_title = line
                                 break
@@ -523,20 +606,18 @@ def parse_case_detail(page_content):
                 document_title = doc_text
 
         if event_date or event_type:
-            event_data = {
-                'event_date': event_date,
-                'event_type': event_type,
-                'event_index': int(index_match.group(1)) if index_match else None,
-                'event_description': event_description,
-                'document_title': document_title,  # Document title for classification
-                'filed_by': filed_by_match.group(1).strip() if filed_by_match else None,
-                'filed_against': against_match.group(1).strip() if against_match else None,
-                'hearing_date': f"{hearing_match.group(1)} {hearing_match.group(2)}" if hearing_match else None,
-                'document_url': None,  # Will need JS execution to get actual URL
-                'has_document': has_document
-            }
-            case_data['events'].append(event_data)
-            logger.debug(f"Event: {event_date} - {event_type} (Index #{event_data['event_index']}) - Doc: {document_title}")
+            case_data['events'].append(Event(
+                event_date=event_date,
+                event_type=event_type,
+                event_index=event_index,
+                document_title=document_title,  # Document title for classification
+                filed_by=filed_by,
+                filed_against=filed_against,
+                hearing_date=hearing_date,
+                document_url=None,  # Will need JS execution to get actual URL
+                has_document=has_document
+            ))
+            logger.debug(f"Event: {event_date} - {event_type} (Index #{event_index}) - Doc: {document_title}")
 
     # ========== 6. HEARINGS ==========
     # Hearings are in a separate section with ng-repeat="hearing in ..."
@@ -546,28 +627,28 @@ def parse_case_detail(page_content):
         hearing_text = hearing_div.get_text()
 
         # Extract hearing date
-        date_match = re.search(r'(\d{2}/\d{2}/\d{4})', hearing_text)
+        date_match = _DATE_RE.search(hearing_text)
 
         # Extract time (usually in parentheses like "(2:30 PM)")
-        time_match = re.search(r'\((\d{1,2}:\d{2}\s*(?:AM|PM)?)\)', hearing_text, re.IGNORECASE)
+        time_match = _HEARING_TIME_RE.search(hearing_text)
 
         # Extract hearing type
         hearing_type = None
         lines = [l.strip() for l in hearing_text.split('\n') if l.strip()]
         for line in lines:
-            if not re.match(r'^\d', line) and 'Created' not in line and len(line) < 50:
+            if not _LEADING_DIGIT_RE.match(line) and 'Created' not in line and len(line) < 50:
                 # Remove time in parentheses
-                clean_line = re.sub(r'\([^)]+\)', '', line).strip()
+                clean_line = _PARENTHESIZED_RE.sub('', line).strip()
                 if clean_line:
                     hearing_type = clean_line
                     break
 
         if date_match:
-            case_data['hearings'].append({
-                'hearing_date': date_match.group(1),
-                'hearing_time': time_match.group(1) if time_match else None,
-                'hearing_type': hearing_type
-            })
+            case_data['hearings'].append(Hearing(
+                hearing_date=date_match.group(1),
+                hearing_time=time_match.group(1) if time_match else None,
+                hearing_type=hearing_type
+            ))
             logger.debug(f"Hearing: {date_match.group(1)} - {hearing_type}")
 
     # ========== 7. FALLBACK: Text-based foreclosure detection ==========
@@ -585,16 +666,10 @@ def parse_case_detail(page_content):
 
         for indicator in foreclosure_indicators:
             if indicator in page_text_lower:
-                case_data['events'].append({
-                    'event_date': None,
-                    'event_type': indicator,
-                    'event_description': f'Found in page text: {indicator}',
-                    'filed_by': None,
-                    'filed_against': None,
-                    'hearing_date': None,
-                    'document_url': None,
-                    'has_document': False
-                })
+                case_data['events'].append(Event(
+                    event_type=indicator,
+                    event_description=f'Found in page text: {indicator}'
+                ))
                 logger.debug(f"Found foreclosure indicator in text: {indicator}")
 
     logger.info(f"Parsed case - Type: {case_data['case_type']}, Style: {case_data['style']}, "
@@ -604,7 +679,32 @@ def parse_case_detail(page_content):
     return case_data
 
 
-def extract_total_count(page_content):
+def parse_case_detail_batch(html_list: List[str], parallel: bool = False,
+                            max_workers: Optional[int] = None) -> List[dict]:
+    """
+    Parse many case detail pages, optionally across a process pool.
+
+    parse_case_detail is CPU-bound (BeautifulSoup + regex) and each page is
+    independent, so large backfills can spread the work over all cores. Small
+    batches and single-case callers should stay in-process to avoid the
+    pickling/IPC overhead of the pool.
+
+    Args:
+        html_list: HTML content of case detail pages
+        parallel: If True, parse in a ProcessPoolExecutor
+        max_workers: Worker process count (default: os.cpu_count())
+
+    Returns:
+        list: Case data dicts, in the same order as html_list
+    """
+    if not parallel or len(html_list) < 2:
+        return [parse_case_detail(html) for html in html_list]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        return list(executor.map(parse_case_detail, html_list, chunksize=8))
+
+
+def extract_total_count(page_content: str, soup: Optional[BeautifulSoup] = None) -> Optional[int]:
     """
     Extract total case count from search results.
 
@@ -613,11 +713,13 @@ def extract_total_count(page_content):
 
     Args:
         page_content: HTML content of search results page
+        soup: Already-parsed tree of page_content (skips re-parsing)
 
     Returns:
         int: Total number of cases, or None if not found
     """
-    soup = BeautifulSoup(page_content, 'html.parser')
+    if soup is None:
+        soup = BeautifulSoup(page_content, 'html.parser')
 
     # Kendo pager info element
     pager_info = soup.select_one('.k-pager-info')
@@ -626,7 +728,7 @@ def extract_total_count(page_content):
         logger.debug(f"Kendo pager info: {text}")
 
         # Parse "1 - 10 of 75 items"
-        match = re.search(r'of\s+(\d+)\s+items?', text, re.IGNORECASE)
+        match = _PAGER_TOTAL_RE.search(text)
         if match:
             total = int(match.group(1))
             logger.info(f"Total count extracted: {total}")
@@ -634,3 +736,23 @@ def extract_total_count(page_content):
 
     logger.warning("Could not extract total count from Kendo pager")
     return None
+
+
+def parse_search_page(page_content: str) -> Tuple[dict, Optional[int]]:
+    """
+    Parse a search results page once and extract both the cases and total count.
+
+    Parsing the HTML dominates the cost of both parse_search_results and
+    extract_total_count, so callers needing both should use this instead.
+
+    Args:
+        page_content: HTML content of search results page
+
+    Returns:
+        tuple: (parse_search_results dict, total count or None)
+    """
+    soup = BeautifulSoup(page_content, 'html.parser')
+    return (
+        parse_search_results(page_content, soup=soup),
+        extract_total_count(page_content, soup=soup),
+    )
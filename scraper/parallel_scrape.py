@@ -1,15 +1,23 @@
 """Parallel batch scrape with configurable date chunking.
 
 Uses ThreadPoolExecutor to run multiple DateRangeScraper instances in parallel.
-Each worker processes a different DATE CHUNK (not county) with its own browser instance.
+Each worker processes a different DATE CHUNK (not county). Every worker thread
+launches one browser and reuses it - and its browser context, keeping portal
+connections alive - for all chunks it picks up (see browser_pool), so a run
+starts `workers` browsers instead of one per chunk.
+
+With --mode process the workers are spawned processes instead of threads, so
+parsing and database work inside each chunk runs on its own core rather than
+sharing one GIL. Each process keeps its own pooled browser the same way, and
+gets 1/workers of the document download rate so the portal sees the same total.
 
 This is safe because:
-- Each DateRangeScraper creates its own isolated browser
+- Cookies are cleared between chunks and each chunk runs in its own page
 - Date chunks are independent (no shared state)
 - Workers process different time periods in parallel
 
 Usage:
-    # Monthly chunks, 3 workers (default)
+    # Monthly chunks, worker count sized to the host (default)
     PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py \
         --start 2024-01-01 --end 2024-12-31 --chunk monthly
 
@@ -25,35 +33,320 @@ Usage:
     PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py \
         --start 2024-01-01 --end 2024-12-31 --chunk monthly --dry-run
 
+    # Process workers for CPU-heavy backfills
+    PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py \
+        --start 2024-01-01 --end 2024-12-31 --chunk daily --per-county --mode process
+
     # Single county with parallel processing
     PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py \
         --start 2024-01-01 --end 2024-06-30 --chunk monthly --county wake --workers 3
+
+    # Resumable backfill: rerunning the same command skips chunks already in the checkpoint
+    PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py \
+        --start 2020-01-01 --end 2024-12-31 --chunk weekly --per-county --checkpoint logs/backfill.jsonl
+
+    # Re-run chunks recorded in the failures file (deduplicated, already-fixed ones dropped)
+    PYTHONPATH=$(pwd) venv/bin/python scraper/parallel_scrape.py --retry-failures
 """
 
 import argparse
+import json
+import multiprocessing
+import multiprocessing.util
+import os
+import random
+import socket
 import sys
-import threading
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-from scraper.date_range_scrape import DateRangeScraper
-from common.date_utils import generate_date_chunks, parse_date
-from common.logger import setup_logger
+import time
+from collections import defaultdict, deque
+from itertools import product
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from urllib.parse import urlparse
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from scraper.browser_pool import acquire_context, close_pool_browsers, close_thread_browser
+from scraper.date_range_scrape import DateRangeScraper, FailedChunk, TruncatedResultsError
+from scraper.pdf_downloader import set_download_share
+from scraper.portal_selectors import PORTAL_URL
+from common.config import config
+from common.county_codes import get_county_code
+from common.date_utils import bisect_date_range, generate_date_chunks, parse_date
+from common.logger import setup_logger, start_queue_logging
+from database.connection import get_session
+from database.models import ScrapeLog
 
 logger = setup_logger(__name__)
 
 # Target counties (when no --county specified)
-TARGET_COUNTIES = ['wake', 'durham', 'orange', 'chatham', 'lee', 'harnett']
+TARGET_COUNTIES = ('wake', 'durham', 'orange', 'chatham', 'lee', 'harnett')
+
+# Append-only record of failed chunks, written as they happen so a killed run keeps them
+FAILURES_FILE = Path(__file__).parent.parent / 'logs' / 'parallel_scrape_failures.jsonl'
+
+# How long a successful chunk scrape counts as fresh enough to skip on re-runs
+CACHE_MAX_AGE_DAYS = 7
+
+# In-place attempts for a chunk hitting transient network errors, and the backoff cap (seconds)
+TRANSIENT_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 60
+
+# Futures kept in flight per worker; the rest of the chunks wait unsubmitted
+PENDING_PER_WORKER = 2
+
+# Auto-sized worker count: one browser per CPU_PER_WORKER cores, at most MAX_AUTO_WORKERS
+# (each worker is a full Chromium plus its own portal session)
+CPU_PER_WORKER = 2
+MAX_AUTO_WORKERS = 6
+
+# Chromium network error codes surface in Playwright messages as net::ERR_*
+TRANSIENT_ERROR_MARKERS = ('net::ERR_', 'Navigation timeout', 'Target closed')
+
+
+def append_failure(failures_fp, failed, run_started):
+    """
+    Append one failed chunk to the failures JSONL file and fsync it.
+
+    Args:
+        failures_fp: File opened in append mode
+        failed: FailedChunk to record
+        run_started: ISO timestamp identifying the run that hit the failure
+    """
+    record = asdict(failed)
+    record['run_started'] = run_started
+    failures_fp.write(json.dumps(record, default=str) + '\n')
+    failures_fp.flush()
+    os.fsync(failures_fp.fileno())
+
+
+def checkpoint_key(chunk_start, chunk_end, county):
+    """Key identifying a chunk in a checkpoint file."""
+    return (str(chunk_start), str(chunk_end), county)
+
+
+def load_checkpoint(path):
+    """
+    Load the chunks a checkpoint file records as done.
+
+    Args:
+        path: Checkpoint JSONL file (may not exist yet)
+
+    Returns:
+        set: checkpoint_key() tuples of completed chunks
+    """
+    if not path.exists():
+        return set()
+
+    done = set()
+    with open(path) as fp:
+        for line_num, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                done.add(checkpoint_key(record['start_date'], record['end_date'], record.get('county')))
+            except (ValueError, KeyError, TypeError) as e:
+                # Usually the last line of a run killed mid-write; that chunk just runs again
+                logger.warning(f"Skipping malformed line {line_num} of {path}: {e}")
+    return done
+
+
+def open_for_append(path):
+    """
+    Open a JSONL file for appending, first ending a line a killed run left unterminated.
+
+    Without this the next record would be glued onto the partial line and lost with it.
+    """
+    needs_newline = False
+    if path.exists() and path.stat().st_size:
+        with open(path, 'rb') as fp:
+            fp.seek(-1, os.SEEK_END)
+            needs_newline = fp.read(1) != b'\n'
+    fp = open(path, 'a')
+    if needs_newline:
+        fp.write('\n')
+    return fp
+
+
+def append_checkpoint(checkpoint_fp, chunk_start, chunk_end, county):
+    """Record a completed chunk in the checkpoint file."""
+    record = {'start_date': str(chunk_start), 'end_date': str(chunk_end), 'county': county}
+    checkpoint_fp.write(json.dumps(record) + '\n')
+    checkpoint_fp.flush()
+
+
+def load_failures(path=FAILURES_FILE):
+    """
+    Load the chunks still worth retrying from a failures JSONL file.
+
+    The file is append-only, so the same (county, start, end) can appear once per
+    run that failed it; each key is kept once, in first-seen order. Keys with a
+    successful scrape completed after the failure was recorded are dropped, and
+    malformed lines (e.g. one cut short by a killed run) are skipped.
+
+    Args:
+        path: Failures file written by append_failure()
+
+    Returns:
+        list: (chunk_start, chunk_end, county) tuples to re-run
+    """
+    if not path.exists():
+        return []
+
+    # Latest failure time per key, so a success is only trusted if it came later
+    failed_at = {}
+    with open(path) as fp:
+        for line_num, line in enumerate(fp, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                key = (parse_date(record['start_date']), parse_date(record['end_date']), record.get('county'))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed line {line_num} of {path}: {e}")
+                continue
+            failed_at[key] = max(failed_at.get(key, ''), record.get('run_started') or '')
+
+    chunks = []
+    for key, run_started in failed_at.items():
+        chunk_start, chunk_end, county = key
+        since = datetime.fromisoformat(run_started) if run_started else None
+        if find_completed_scrape(chunk_start, chunk_end, county, since=since):
+            continue
+        chunks.append(key)
+
+    logger.info(f"Loaded {len(chunks)} chunks to retry from {path} "
+                f"({len(failed_at) - len(chunks)} already scraped since they failed)")
+    return chunks
+
+
+def warm_portal_dns():
+    """
+    Resolve the portal hostname once before the workers fan out.
+
+    Every chunk hits the same host, so one lookup here lets the first page load in
+    each worker browser hit the resolver cache instead of racing it. Best effort:
+    failures are logged and otherwise ignored.
+    """
+    host = urlparse(PORTAL_URL).hostname
+    try:
+        socket.getaddrinfo(host, 443, proto=socket.IPPROTO_TCP)
+        logger.debug(f"Resolved {host}")
+    except OSError as e:
+        logger.warning(f"Could not resolve {host} before scraping: {e}")
+
+
+def is_transient_error(error):
+    """
+    Check whether a scrape error is a network hiccup worth retrying in place.
+
+    Truncated results are never transient - they need a narrower date range.
+
+    Args:
+        error: Exception raised by DateRangeScraper.run()
+
+    Returns:
+        bool: True for timeouts, dropped connections and Chromium net::ERR_* failures
+    """
+    if isinstance(error, TruncatedResultsError):
+        return False
+    if isinstance(error, (PlaywrightTimeoutError, ConnectionError, TimeoutError)):
+        return True
+    message = str(error)
+    return any(marker in message for marker in TRANSIENT_ERROR_MARKERS)
+
+
+def _init_process_worker(workers):
+    """
+    ProcessPoolExecutor initializer: take this process's share of the download
+    rate, and close its pooled browser when it exits.
+    """
+    # Download buckets are per process; split the portal's rate across the pool
+    set_download_share(workers)
+    # Pool workers leave via os._exit(), which skips atexit but still runs multiprocessing finalizers
+    multiprocessing.util.Finalize(None, close_thread_browser, exitpriority=10)
+
+
+def default_workers():
+    """Pick a worker count from the host's CPUs, capped at MAX_AUTO_WORKERS."""
+    return max(1, min(MAX_AUTO_WORKERS, (os.cpu_count() or CPU_PER_WORKER) // CPU_PER_WORKER))
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with jitter for the given 1-based attempt, capped at MAX_BACKOFF_SECONDS."""
+    return min(MAX_BACKOFF_SECONDS, 2 ** attempt + random.random() * attempt)
+
+
+def find_completed_scrape(chunk_start, chunk_end, county, max_age_days=CACHE_MAX_AGE_DAYS, since=None):
+    """
+    Look up a recent, complete, successful scrape of exactly this chunk.
+
+    Runs stopped early by --limit leave cases_found unset and never match, as do
+    scrapes that completed before the chunk's end date was over (cases filed
+    later that day or after would be missing from them).
+
+    Args:
+        chunk_start: Start date of the chunk
+        chunk_end: End date of the chunk
+        county: Single county name or None for the multi-county search
+        max_age_days: Ignore scrapes that completed longer ago than this
+        since: If given, ignore scrapes completed before this datetime instead
+
+    Returns:
+        dict: scrape_log_id, cases_found, completed_at of the latest match, or None
+    """
+    county_code = get_county_code(county) if county else 'MULTI'
+    cutoff = since or datetime.now() - timedelta(days=max_age_days)
+    # Only trust scrapes of a range that had already closed when they ran
+    range_closed = datetime.combine(chunk_end, datetime.min.time()) + timedelta(days=1)
+    cutoff = max(cutoff, range_closed)
+
+    with get_session() as session:
+        log = session.query(ScrapeLog).filter(
+            ScrapeLog.county_code == county_code,
+            ScrapeLog.start_date == chunk_start,
+            ScrapeLog.end_date == chunk_end,
+            ScrapeLog.status == 'success',
+            ScrapeLog.cases_found.isnot(None),
+            ScrapeLog.completed_at >= cutoff
+        ).order_by(ScrapeLog.completed_at.desc()).first()
+
+        if not log:
+            return None
+
+        return {
+            'scrape_log_id': log.id,
+            'cases_found': log.cases_found,
+            'completed_at': log.completed_at
+        }
+
 
-# Thread-safe lock for logging
-log_lock = threading.Lock()
+def _chunk_result(chunk_num, chunk_start, chunk_end, county, **overrides):
+    """Build a run_chunk_scrape result: an empty success unless overridden."""
+    result = {
+        'chunk_num': chunk_num,
+        'start_date': chunk_start,
+        'end_date': chunk_end,
+        'county': county,
+        'success': True,
+        'cases': 0,
+        'error': None,
+        'too_many_results': False,
+        'cached': False
+    }
+    result.update(overrides)
+    return result
 
 
-def run_chunk_scrape(chunk_num, total_chunks, chunk_start, chunk_end, county, limit, dry_run):
+def run_chunk_scrape(chunk_num, total_chunks, chunk_start, chunk_end, county, limit, dry_run, use_cache=True):
     """
     Run scrape for a single date chunk.
 
-    This function runs in its own thread with its own browser.
+    This function runs in a worker thread, reusing that thread's pooled browser.
 
     Args:
         chunk_num: Chunk number (for logging)
@@ -63,80 +356,78 @@ def run_chunk_scrape(chunk_num, total_chunks, chunk_start, chunk_end, county, li
         county: Single county name or None for all counties
         limit: Limit cases per chunk for testing
         dry_run: If True, just show what would be done
+        use_cache: If True, skip chunks with a recent complete scrape (see find_completed_scrape)
 
     Returns:
-        dict: Result with chunk_num, success, cases, error, county
+        dict: Result with chunk_num, success, cases, error, county, too_many_results, cached
     """
     county_str = county if county else "all counties"
     chunk_id = f"Chunk {chunk_num}/{total_chunks}"
 
-    with log_lock:
-        logger.info(f"[{chunk_id}] Starting: {chunk_start} to {chunk_end} ({county_str})")
+    logger.info(f"[{chunk_id}] Starting: {chunk_start} to {chunk_end} ({county_str})")
 
     if dry_run:
-        with log_lock:
-            logger.info(f"[{chunk_id}] [DRY RUN] Would process {county_str}")
-        return {
-            'chunk_num': chunk_num,
-            'start_date': chunk_start,
-            'end_date': chunk_end,
-            'county': county,
-            'success': True,
-            'cases': 0,
-            'error': None
-        }
+        logger.info(f"[{chunk_id}] [DRY RUN] Would process {county_str}")
+        return _chunk_result(chunk_num, chunk_start, chunk_end, county)
 
     try:
+        # Limited runs are partial by design, so never satisfy them from the cache
+        if use_cache and not limit:
+            completed = find_completed_scrape(chunk_start, chunk_end, county)
+            if completed:
+                logger.info(f"[{chunk_id}] Skipping: already scraped {completed['completed_at']:%Y-%m-%d %H:%M} "
+                            f"(scrape log #{completed['scrape_log_id']}, {completed['cases_found']} cases found)")
+                return _chunk_result(chunk_num, chunk_start, chunk_end, county, cached=True)
+
         # Prepare counties list for DateRangeScraper
         counties = [county] if county else None
 
-        # Create scraper with its own browser
-        scraper = DateRangeScraper(
-            start_date=chunk_start.strftime('%Y-%m-%d'),
-            end_date=chunk_end.strftime('%Y-%m-%d'),
-            counties=counties,
-            limit=limit
-        )
-
-        # Run scrape
-        result = scraper.run()
+        # Run scrape, retrying transient network errors in place with backoff
+        attempt = 1
+        while True:
+            try:
+                # Create scraper on this worker thread's browser context (re-acquired per
+                # attempt so a crashed browser gets relaunched)
+                scraper = DateRangeScraper(
+                    start_date=chunk_start,
+                    end_date=chunk_end,
+                    counties=counties,
+                    limit=limit,
+                    context=acquire_context()
+                )
+                result = scraper.run()
+                break
+            except Exception as e:
+                if attempt >= TRANSIENT_ATTEMPTS or not is_transient_error(e):
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"[{chunk_id}] Transient error (attempt {attempt}/{TRANSIENT_ATTEMPTS}), "
+                               f"retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+                attempt += 1
 
         success = result['status'] == 'success'
         cases_processed = result.get('cases_processed', 0)
         error_message = result.get('error')
 
-        with log_lock:
-            if success:
-                logger.info(f"[{chunk_id}] ✓ Completed: {cases_processed} foreclosures saved")
-            else:
-                logger.error(f"[{chunk_id}] ✗ Failed: {error_message}")
+        if success:
+            logger.info(f"[{chunk_id}] ✓ Completed: {cases_processed} foreclosures saved")
+        else:
+            logger.error(f"[{chunk_id}] ✗ Failed: {error_message}")
 
-        return {
-            'chunk_num': chunk_num,
-            'start_date': chunk_start,
-            'end_date': chunk_end,
-            'county': county,
-            'success': success,
-            'cases': cases_processed,
-            'error': error_message
-        }
+        return _chunk_result(chunk_num, chunk_start, chunk_end, county,
+                             success=success, cases=cases_processed, error=error_message)
 
     except Exception as e:
-        with log_lock:
-            logger.error(f"[{chunk_id}] ✗ Exception: {e}")
+        logger.error(f"[{chunk_id}] ✗ Exception: {e}")
 
-        return {
-            'chunk_num': chunk_num,
-            'start_date': chunk_start,
-            'end_date': chunk_end,
-            'county': county,
-            'success': False,
-            'cases': 0,
-            'error': str(e)
-        }
+        return _chunk_result(chunk_num, chunk_start, chunk_end, county,
+                             success=False, error=str(e),
+                             too_many_results=isinstance(e, TruncatedResultsError))
 
 
-def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=None, dry_run=False, workers=3, per_county=False):
+def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=None, dry_run=False, workers=None, per_county=False,
+                        use_cache=True, retries=1, chunks=None, queue_depth=None, mode='thread', checkpoint=None):
     """
     Run parallel batch scrape with configurable date chunking.
 
@@ -147,37 +438,54 @@ def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=Non
         county: Single county name (optional, default: all 6 counties)
         limit: Limit cases per chunk for testing (optional)
         dry_run: If True, show chunks without running
-        workers: Number of parallel workers
+        workers: Number of parallel workers (default: default_workers())
         per_county: If True, search each county separately (recommended for backfills)
+        use_cache: If True, skip chunks already scraped successfully in the last CACHE_MAX_AGE_DAYS
+        retries: How many times a failed chunk is re-queued before it counts as failed
+        chunks: Explicit (chunk_start, chunk_end, county) list to run instead of chunking
+            the date range (used by --retry-failures)
+        queue_depth: Max chunks submitted to the executor at once (default: workers * PENDING_PER_WORKER)
+        mode: 'thread' for a thread pool, or 'process' for spawned worker processes
+        checkpoint: Optional Path of a JSONL file of completed chunks. Chunks listed there
+            are skipped, and each chunk that succeeds is appended, so a rerun resumes
+
+    Failed chunks are also appended to FAILURES_FILE as soon as they're final.
 
     Returns:
         dict: Summary of parallel scrape results
     """
-    # Generate base date chunks
-    date_chunks = generate_date_chunks(start_date, end_date, chunk_size)
-
-    # Expand chunks to include county if per_county mode
-    if per_county:
-        chunks = []
-        for chunk_start, chunk_end in date_chunks:
-            for cnty in TARGET_COUNTIES:
-                chunks.append((chunk_start, chunk_end, cnty))
-        logger.info(f"Per-county mode: {len(date_chunks)} date chunks × {len(TARGET_COUNTIES)} counties = {len(chunks)} total searches")
+    # Chunks are generated lazily as (chunk_start, chunk_end, county) and consumed once,
+    # either by the dry-run listing or by the submit window
+    if chunks is not None:
+        total_chunks = len(chunks)
+        chunks = iter(chunks)
+    elif per_county:
+        # Expand chunks to include county if per_county mode
+        date_chunks = generate_date_chunks(start_date, end_date, chunk_size)
+        total_chunks = len(date_chunks) * len(TARGET_COUNTIES)
+        chunks = ((chunk_start, chunk_end, cnty)
+                  for (chunk_start, chunk_end), cnty in product(date_chunks, TARGET_COUNTIES))
+        logger.info(f"Per-county mode: {len(date_chunks)} date chunks × {len(TARGET_COUNTIES)} counties = {total_chunks} total searches")
     else:
         # Original behavior: just date chunks, all counties at once
-        chunks = [(chunk_start, chunk_end, county) for chunk_start, chunk_end in date_chunks]
-
-    total_chunks = len(chunks)
+        date_chunks = generate_date_chunks(start_date, end_date, chunk_size)
+        total_chunks = len(date_chunks)
+        chunks = ((chunk_start, chunk_end, county) for chunk_start, chunk_end in date_chunks)
+    workers = workers or default_workers()
+    max_pending = max(queue_depth or workers * PENDING_PER_WORKER, workers)
 
     logger.info("=" * 60)
     logger.info("PARALLEL BATCH SCRAPE WITH DATE CHUNKING")
     logger.info("=" * 60)
     logger.info(f"Date range: {start_date} to {end_date}")
-    logger.info(f"Chunk size: {chunk_size}")
+    if chunk_size:
+        logger.info(f"Chunk size: {chunk_size}")
     logger.info(f"Total chunks: {total_chunks}")
-    logger.info(f"Parallel workers: {workers}")
+    logger.info(f"Parallel workers: {workers} {mode}s (queue depth {max_pending})")
     if per_county:
         logger.info(f"Mode: Per-county (each county searched separately)")
+    elif chunk_size is None:
+        logger.info("Mode: Retrying recorded failures")
     else:
         logger.info(f"Counties: {county or 'all 6 counties'}")
     if limit:
@@ -209,62 +517,156 @@ def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=Non
         'chunks_processed': 0,
         'chunks_succeeded': 0,
         'chunks_failed': 0,
+        'chunks_split': 0,
+        'chunks_cached': 0,
+        'chunks_retried': 0,
+        'chunks_checkpointed': 0,
         'total_cases': 0,
-        'failed_chunks': []
+        'failed_chunks': [],
+        # Per-county [succeeded, failed, cases], tallied in the same pass as the totals
+        'by_county': defaultdict(lambda: [0, 0, 0])
     }
 
-    # Use ThreadPoolExecutor to run chunks in parallel
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        # Submit all chunks
-        future_to_chunk = {
-            executor.submit(
+    warm_portal_dns()
+
+    # Use an executor to run chunks in parallel. Only a sliding window of
+    # max_pending futures is in flight at once; retries and the
+    # halves of truncated chunks jump the queue ahead of chunks not yet submitted.
+    run_started = datetime.now().isoformat(timespec='seconds')
+    FAILURES_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+    if mode == 'process':
+        # Spawn rather than fork: Playwright drivers and DB connections can't be shared across a fork
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_process_worker,
+            initargs=(workers,)
+        )
+    else:
+        executor = ThreadPoolExecutor(max_workers=workers)
+
+    checkpointed = load_checkpoint(checkpoint) if checkpoint else set()
+    if checkpointed:
+        logger.info(f"Checkpoint {checkpoint}: {len(checkpointed)} chunks already done")
+
+    with (open_for_append(FAILURES_FILE) as failures_fp,
+          open_for_append(checkpoint) if checkpoint else nullcontext() as checkpoint_fp,
+          executor):
+        future_to_chunk = {}
+
+        def record_failure(failed):
+            # Only the main thread's completion loop calls this, so no lock is needed
+            results['failed_chunks'].append(failed)
+            append_failure(failures_fp, failed, run_started)
+
+        def submit(chunk_num, chunk_start, chunk_end, cnty, attempt=1):
+            future = executor.submit(
                 run_chunk_scrape,
-                i,
-                total_chunks,
+                chunk_num,
+                results['total_chunks'],
                 chunk_start,
                 chunk_end,
                 cnty,
                 limit,
-                dry_run
-            ): i
-            for i, (chunk_start, chunk_end, cnty) in enumerate(chunks, 1)
-        }
-
-        # Collect results as they complete
-        for future in as_completed(future_to_chunk):
-            chunk_num = future_to_chunk[future]
-            try:
-                result = future.result()
-                results['chunks_processed'] += 1
-
-                if result['success']:
-                    results['chunks_succeeded'] += 1
-                    results['total_cases'] += result['cases']
+                dry_run,
+                use_cache
+            )
+            future_to_chunk[future] = (chunk_num, chunk_start, chunk_end, cnty, attempt)
+
+        unsubmitted = ((i, chunk_start, chunk_end, cnty) for i, (chunk_start, chunk_end, cnty) in enumerate(chunks, 1))
+        requeued = deque()
+
+        def fill():
+            while len(future_to_chunk) < max_pending:
+                if requeued:
+                    chunk = requeued.popleft()
                 else:
-                    results['chunks_failed'] += 1
-                    results['failed_chunks'].append({
-                        'chunk_num': result['chunk_num'],
-                        'start_date': result['start_date'],
-                        'end_date': result['end_date'],
-                        'county': result.get('county'),
-                        'error': result['error']
-                    })
-
-                # Progress update
-                with log_lock:
-                    logger.info(f"Overall progress: {results['chunks_processed']}/{total_chunks} chunks completed")
-
-            except Exception as e:
-                with log_lock:
+                    chunk = next(unsubmitted, None)
+                    if chunk is None:
+                        return
+                # Includes the halves of a split chunk, which are checkpointed on their own
+                _, chunk_start, chunk_end, cnty = chunk[:4]
+                if checkpoint_key(chunk_start, chunk_end, cnty) in checkpointed:
+                    # Done in an earlier run - count it without dispatching it
+                    results['chunks_processed'] += 1
+                    results['chunks_succeeded'] += 1
+                    results['chunks_checkpointed'] += 1
+                    results['by_county'][cnty][0] += 1
+                    continue
+                submit(*chunk)
+
+        # Collect results as they complete, topping the window back up each time
+        fill()
+        while future_to_chunk:
+            done, _ = wait(future_to_chunk, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk_num, chunk_start, chunk_end, cnty, attempt = future_to_chunk.pop(future)
+                try:
+                    result = future.result()
+
+                    if not result['success'] and not result.get('too_many_results') and attempt <= retries:
+                        # Re-queue on the same executor so retries run in parallel with the rest
+                        results['chunks_retried'] += 1
+                        logger.warning(f"Retrying chunk {chunk_num} (attempt {attempt + 1}/{retries + 1}): {result['error']}")
+                        requeued.append((chunk_num, chunk_start, chunk_end, cnty, attempt + 1))
+                        continue
+
+                    results['chunks_processed'] += 1
+
+                    if result.get('too_many_results') and chunk_start < chunk_end:
+                        # Too many results - re-queue both halves instead of failing; halves that
+                        # are still truncated get bisected again, down to single days
+                        results['chunks_split'] += 1
+                        halves = bisect_date_range(chunk_start, chunk_end)
+                        logger.warning(f"Chunk {chunk_num} truncated, re-queuing as "
+                                       f"{halves[0][0]} to {halves[0][1]} and {halves[1][0]} to {halves[1][1]}")
+                        for sub_start, sub_end in halves:
+                            results['total_chunks'] += 1
+                            requeued.append((results['total_chunks'], sub_start, sub_end, cnty))
+                    elif result['success']:
+                        results['chunks_succeeded'] += 1
+                        results['total_cases'] += result['cases']
+                        county_tally = results['by_county'][cnty]
+                        county_tally[0] += 1
+                        county_tally[2] += result['cases']
+                        if result.get('cached'):
+                            results['chunks_cached'] += 1
+                        if checkpoint_fp:
+                            append_checkpoint(checkpoint_fp, chunk_start, chunk_end, cnty)
+                    else:
+                        results['chunks_failed'] += 1
+                        results['by_county'][cnty][1] += 1
+                        record_failure(FailedChunk(
+                            chunk_num=result['chunk_num'],
+                            start_date=result['start_date'],
+                            end_date=result['end_date'],
+                            county=result.get('county'),
+                            error=result['error']
+                        ))
+
+                    # Progress update
+                    logger.info(f"Overall progress: {results['chunks_processed']}/{results['total_chunks']} chunks completed")
+
+                except Exception as e:
                     logger.error(f"Thread for chunk {chunk_num} failed: {e}")
-                results['chunks_processed'] += 1
-                results['chunks_failed'] += 1
-                results['failed_chunks'].append({
-                    'chunk_num': chunk_num,
-                    'start_date': None,
-                    'end_date': None,
-                    'error': f'Thread failed: {str(e)}'
-                })
+                    results['chunks_processed'] += 1
+                    results['chunks_failed'] += 1
+                    results['by_county'][cnty][1] += 1
+                    record_failure(FailedChunk(
+                        chunk_num=chunk_num,
+                        start_date=chunk_start,
+                        end_date=chunk_end,
+                        county=cnty,
+                        error=f'Thread failed: {str(e)}'
+                    ))
+
+            fill()
+
+        # Shut down each worker thread's browser before the threads exit (worker
+        # processes close theirs on exit via _init_process_worker)
+        if mode != 'process':
+            close_pool_browsers(executor, workers)
 
     # Print summary
     logger.info("\n" + "=" * 60)
@@ -274,14 +676,33 @@ def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=Non
     logger.info(f"Chunks processed: {results['chunks_processed']}")
     logger.info(f"Chunks succeeded: {results['chunks_succeeded']}")
     logger.info(f"Chunks failed: {results['chunks_failed']}")
+    if results['chunks_split']:
+        logger.info(f"Chunks split after truncation: {results['chunks_split']}")
+    if results['chunks_cached']:
+        logger.info(f"Chunks skipped (already scraped): {results['chunks_cached']}")
+    if results['chunks_checkpointed']:
+        logger.info(f"Chunks skipped (in checkpoint): {results['chunks_checkpointed']}")
+    if results['chunks_retried']:
+        logger.info(f"Chunk retries: {results['chunks_retried']}")
     logger.info(f"Total foreclosures saved: {results['total_cases']}")
 
+    if per_county:
+        lines = ["\nBy county:"]
+        for cnty in TARGET_COUNTIES:
+            succeeded, failed_count, cases = results['by_county'][cnty]
+            lines.append(f"  {cnty.title()}: {succeeded} succeeded, {failed_count} failed, {cases} foreclosures saved")
+        logger.info("\n".join(lines))
+    results['by_county'] = dict(results['by_county'])
+
     if results['failed_chunks']:
-        logger.warning("\nFailed chunks:")
+        # One log record for the whole list rather than two per failure
+        lines = ["\nFailed chunks:"]
         for failed in results['failed_chunks']:
-            county_info = f" ({failed['county']})" if failed.get('county') else ""
-            logger.warning(f"  Chunk {failed['chunk_num']}: {failed['start_date']} to {failed['end_date']}{county_info}")
-            logger.warning(f"    Error: {failed['error']}")
+            county_info = f" ({failed.county})" if failed.county else ""
+            lines.append(f"  Chunk {failed.chunk_num}: {failed.start_date} to {failed.end_date}{county_info}")
+            lines.append(f"    Error: {failed.error}")
+        logger.warning("\n".join(lines))
+        logger.warning(f"Failed chunks recorded in {FAILURES_FILE}")
 
     logger.info("=" * 60)
 
@@ -299,25 +720,93 @@ def run_parallel_scrape(start_date, end_date, chunk_size, county=None, limit=Non
     return results
 
 
+def exit_code(results):
+    """Map a run_parallel_scrape result to the process exit code."""
+    if results['status'] == 'success' or results['status'] == 'dry_run':
+        return 0
+    elif results['status'] == 'partial':
+        return 2  # Partial success
+    else:
+        return 1  # Complete failure
+
+
 def main():
     parser = argparse.ArgumentParser(description='Parallel batch scrape with configurable date chunking')
-    parser.add_argument('--start', required=True, help='Start date (YYYY-MM-DD)')
-    parser.add_argument('--end', required=True, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--start', help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', help='End date (YYYY-MM-DD)')
     parser.add_argument(
         '--chunk',
-        required=True,
         choices=['daily', 'weekly', 'monthly', 'quarterly', 'yearly'],
         help='Chunk size for date ranges'
     )
     parser.add_argument('--county', help='Single county override (default: all 6 counties)')
     parser.add_argument('--limit', type=int, help='Limit cases per chunk for testing')
     parser.add_argument('--dry-run', action='store_true', help='Show chunks without running')
-    parser.add_argument('--workers', type=int, default=3, help='Number of parallel workers (default: 3)')
+    parser.add_argument('--workers', type=int,
+                        help=f'Number of parallel workers (default: 1 per {CPU_PER_WORKER} CPUs, '
+                             f'at most {MAX_AUTO_WORKERS}; {default_workers()} on this host)')
+    parser.add_argument('--mode', choices=['thread', 'process'], default='thread',
+                        help='Run workers as threads (default) or as separate processes for CPU-heavy backfills')
+    parser.add_argument('--queue-depth', type=int,
+                        help=f'Max chunks queued on the executor at once (default: workers × {PENDING_PER_WORKER})')
     parser.add_argument('--per-county', action='store_true',
                         help='Search each county separately to avoid result limits (recommended for backfills)')
+    parser.add_argument('--retries', type=int, default=1,
+                        help='Times to re-queue a failed chunk before giving up (default: 1)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Re-scrape chunks even if they succeeded in the last {CACHE_MAX_AGE_DAYS} days')
+    parser.add_argument('--checkpoint', type=Path,
+                        help='JSONL file of completed chunks: skip those, and append each new success (resumable runs)')
+    parser.add_argument('--retry-failures', action='store_true',
+                        help=f'Re-run the chunks recorded in {FAILURES_FILE.name} instead of a date range')
 
     args = parser.parse_args()
 
+    # Worker threads log through one listener thread instead of contending on stdout
+    start_queue_logging()
+
+    # Validate workers
+    if args.workers is None:
+        args.workers = default_workers()
+    if args.workers < 1:
+        logger.error("Workers must be at least 1")
+        sys.exit(1)
+    if args.workers > 10:
+        logger.warning(f"Warning: {args.workers} workers means {args.workers} browsers and portal sessions "
+                       f"at once; expect rate limiting")
+    if args.mode == 'thread' and args.workers > config.DB_POOL_SIZE:
+        # Threads share one engine; checkouts past pool_size open and close a fresh connection each time
+        logger.warning(f"Warning: {args.workers} worker threads share a pool of {config.DB_POOL_SIZE} DB connections; "
+                       f"set DB_POOL_SIZE to at least {args.workers} to avoid reconnect churn")
+    if args.queue_depth is not None and args.queue_depth < args.workers:
+        logger.error(f"Queue depth must be at least the worker count ({args.workers})")
+        sys.exit(1)
+
+    if args.retry_failures:
+        chunks = load_failures()
+        if not chunks:
+            logger.info("No failed chunks to retry")
+            sys.exit(0)
+
+        results = run_parallel_scrape(
+            start_date=min(chunk_start for chunk_start, _, _ in chunks),
+            end_date=max(chunk_end for _, chunk_end, _ in chunks),
+            chunk_size=None,
+            limit=args.limit,
+            dry_run=args.dry_run,
+            workers=args.workers,
+            use_cache=not args.no_cache,
+            retries=max(0, args.retries),
+            chunks=chunks,
+            queue_depth=args.queue_depth,
+            mode=args.mode,
+            checkpoint=args.checkpoint
+        )
+        sys.exit(exit_code(results))
+
+    if not (args.start and args.end and args.chunk):
+        parser.error('--start, --end and --chunk are required unless --retry-failures is given')
+
     # Parse and validate dates
     try:
         start_date = parse_date(args.start)
@@ -341,14 +830,6 @@ def main():
     else:
         county = None
 
-    # Validate workers
-    if args.workers < 1:
-        logger.error("Workers must be at least 1")
-        sys.exit(1)
-    if args.workers > 10:
-        logger.warning("Warning: More than 10 workers may cause issues. Limiting to 10.")
-        args.workers = 10
-
     # Run parallel scrape
     results = run_parallel_scrape(
         start_date=start_date,
@@ -358,16 +839,15 @@ def main():
         limit=args.limit,
         dry_run=args.dry_run,
         workers=args.workers,
-        per_county=args.per_county
+        per_county=args.per_county,
+        use_cache=not args.no_cache,
+        retries=max(0, args.retries),
+        queue_depth=args.queue_depth,
+        mode=args.mode,
+        checkpoint=args.checkpoint
     )
 
-    # Exit with appropriate code
-    if results['status'] == 'success' or results['status'] == 'dry_run':
-        sys.exit(0)
-    elif results['status'] == 'partial':
-        sys.exit(2)  # Partial success
-    else:
-        sys.exit(1)  # Complete failure
+    sys.exit(exit_code(results))
 
 
 if __name__ == '__main__':
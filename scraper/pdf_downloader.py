@@ -11,17 +11,382 @@ import os
 import re
 import time
 import subprocess
+import threading
+from collections import Counter, defaultdict, deque
 from pathlib import Path
-from datetime import datetime
-from playwright.sync_api import Page, Download
+from urllib.parse import urlparse
+from playwright.sync_api import Page, Download, JSHandle, TimeoutError as PlaywrightTimeoutError
+from sqlalchemy import insert
 
 from common.config import config
+from common.date_utils import parse_portal_date
 from common.logger import setup_logger
 from database.connection import get_session
 from database.models import Document, CaseEvent
 
 logger = setup_logger(__name__)
 
+# Characters stripped from event/document names before they go into filenames
+_FILENAME_UNSAFE_RE = re.compile(r'[^\w\s-]')
+# The ASCII characters _FILENAME_UNSAFE_RE matches, for the bytes.translate fast path
+_FILENAME_UNSAFE_ASCII = bytes(c for c in range(128) if _FILENAME_UNSAFE_RE.match(chr(c)))
+_WHITESPACE_RE = re.compile(r'\s+')
+# Event documents are saved as "{date}_{type}.pdf", optionally with "_{counter}" or,
+# for popup documents, "_{n}_{name}" before the extension; group 1 is "{date}_{type}"
+_EVENT_FILENAME_RE = re.compile(r'^(.+?)(?:_\d+(?:_.*)?)?\.pdf$')
+
+# Document selector popup rows: "11/25/2025 Public Check Deposit- Unlimited Reload LLC 2"
+_ROW_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_TRAILING_PAGE_COUNT_RE = re.compile(r'\s+\d+\s*$')
+
+# Case numbers as they appear in PDF text (exact format, or with OCR spacing)
+_CASE_NUMBER_RES = (
+    re.compile(r'\b(\d{2})\s*SP\s*(\d{6})\b', re.IGNORECASE),  # Matches "25SP001024" or "25 SP 001024"
+    re.compile(r'\b(\d{2})\s*SP\s*(\d{4})\b', re.IGNORECASE),  # Matches "25SP1024" or "25 SP 1024"
+)
+
+# Document downloads allowed per second per portal host, across all threads, and the burst size.
+# Buckets live in the process, so multi-process runs split these with set_download_share()
+DOWNLOAD_RATE = 2.0
+DOWNLOAD_BURST = 4
+
+# Document downloads allowed to transfer at once from one case page or popup
+MAX_IN_FLIGHT_DOWNLOADS = 4
+
+# How long a click on an event's document control gets to start a direct download
+# before we look for the multi-document popup instead
+EVENT_CLICK_SETTLE_MS = 500
+
+
+# Page scripts are module constants, and per-call values go in as evaluate()
+# arguments, so every call ships the same source and Chromium can reuse its
+# compiled script instead of parsing a fresh one per event index.
+
+_EXTRACT_DOC_INFO_JS = r'''
+    () => {
+        // Nearest event row, else nearest table row, else nearest div - in one ancestor walk
+        const eventRowOf = (el) => {
+            let row = null;
+            let div = null;
+            for (let node = el; node; node = node.parentElement) {
+                if (node.matches('[ng-repeat*="event"]')) return node;
+                if (!row && node.tagName === 'TR') row = node;
+                if (!div && node.tagName === 'DIV') div = node;
+            }
+            return row || div;
+        };
+
+        // One query for both kinds of document control, split by tag in document order.
+        // Document icons (IMG with title) trigger PDF downloads; buttons with a
+        // "document" aria-label are only used when a page has no icons.
+        const icons = [];
+        const buttons = [];
+        document.querySelectorAll('img[title*="document" i], button[aria-label*="document" i]').forEach((el) => {
+            (el.tagName === 'IMG' ? icons : buttons).push(el);
+        });
+        const useIcons = icons.length > 0;
+
+        // Date and type are read from each row's text in one pass, the type with
+        // the same first-capitalized-line rule as _EVENT_SCAN_JS
+        return (useIcons ? icons : buttons).map((el, idx) => {
+            const eventRow = eventRowOf(el);
+            let eventDate = '';
+            let eventType = '';
+            if (eventRow) {
+                const text = eventRow.textContent || '';
+                const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
+                if (dateMatch) {
+                    eventDate = dateMatch[1];
+                }
+                for (const rawLine of text.split('\n')) {
+                    const line = rawLine.trim();
+                    if (line.length > 5 && line.length < 80 && /^[A-Z][a-zA-Z\s()/\-0-9]+$/.test(line)) {
+                        eventType = line;
+                        break;
+                    }
+                }
+            }
+            return {buttonIndex: idx, eventDate: eventDate, eventType: eventType};
+        });
+    }
+'''
+
+# The page's document icons (IMG with title), or its document buttons when it has no icons,
+# in the same order as the buttonIndex values from _EXTRACT_DOC_INFO_JS.
+# Captured once as a JSHandle so each click is an array lookup instead of a fresh query.
+_DOCUMENT_CONTROLS_JS = '''
+    () => {
+        const icons = document.querySelectorAll('img[title*="document" i]');
+        return Array.from(icons.length > 0 ? icons : document.querySelectorAll('button[aria-label*="document" i]'));
+    }
+'''
+
+# Click the Nth captured document control, re-querying if Angular replaced it since capture
+_CLICK_DOCUMENT_ICON_JS = '''
+    (docControls, buttonIndex) => {
+        let el = docControls[buttonIndex];
+        if (!el || !el.isConnected) {
+            let docElements = document.querySelectorAll('img[title*="document" i]');
+            if (docElements.length === 0) {
+                docElements = document.querySelectorAll('button[aria-label*="document" i]');
+            }
+            el = docElements[buttonIndex];
+        }
+        if (el) el.click();
+    }
+'''
+
+# The case's event rows, captured once per case as a JSHandle (indexes match the event scans)
+_EVENT_ROWS_JS = '''
+    () => Array.from(document.querySelectorAll('[ng-repeat*="event"]'))
+'''
+
+# Every case event that has a document button or icon, with its date, type and category flags.
+# Indexes match the case's event rows (_EVENT_ROWS_JS).
+_EVENT_SCAN_JS = r'''
+    () => {
+        const results = [];
+
+        // Find all event containers (Angular ng-repeat)
+        const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
+
+        eventDivs.forEach((eventDiv, idx) => {
+            // Check for document button/icon
+            const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
+            const docImg = eventDiv.querySelector('img[title*="document" i]');
+
+            if (docBtn || docImg) {
+                // Only rows with documents pay for building the subtree text
+                const text = eventDiv.textContent || '';
+
+                // Extract event date
+                const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
+                const eventDate = dateMatch ? dateMatch[1] : '';
+
+                // Extract event type - find capitalized text
+                let eventType = '';
+                const lines = text.split('\n').map(l => l.trim()).filter(l => l);
+                for (const line of lines) {
+                    if (line.match(/^[A-Z][a-zA-Z\s()/\-0-9]+$/) &&
+                        line.length > 5 && line.length < 80) {
+                        eventType = line;
+                        break;
+                    }
+                }
+
+                // Categorize document type
+                const textLower = text.toLowerCase();
+                const isUpsetBid = textLower.includes('upset bid');
+                const isSaleReport = textLower.includes('report of') && textLower.includes('sale');
+                const isNoticeOfSale = textLower.includes('notice of sale');
+                const isForeclosureFiling = textLower.includes('foreclosure') ||
+                                             textLower.includes('deed of trust');
+                const isOrder = textLower.includes('order') || textLower.includes('findings');
+
+                results.push({
+                    index: idx,
+                    eventType: eventType,
+                    eventDate: eventDate,
+                    hasButton: !!docBtn,
+                    hasImage: !!docImg,
+                    isUpsetBid: isUpsetBid,
+                    isSale: isSaleReport || isNoticeOfSale,
+                    isForeclosureFiling: isForeclosureFiling,
+                    isOrder: isOrder
+                });
+            }
+        });
+
+        return results;
+    }
+'''
+
+# Whether anything that could be the Document Selector popup is showing: its title in
+# rendered text (innerText skips closed dialogs and hidden nodes) or its aria-label
+_DOCUMENT_SELECTOR_SHOWN_JS = r'''
+    () => (document.body.innerText || '').replace(/\s+/g, ' ').toLowerCase().includes('document selector')
+        || document.querySelector('[aria-label="Document Selector"]') !== null
+'''
+
+# Click the Nth event row's document button; returns whether there was one to click
+_CLICK_EVENT_DOCUMENT_BUTTON_JS = '''
+    (eventIndex) => {
+        const eventDiv = document.querySelectorAll('[ng-repeat*="event"]')[eventIndex];
+        const docBtn = eventDiv ? eventDiv.querySelector('button[aria-label*="document" i]') : null;
+        if (!docBtn) return false;
+        docBtn.click();
+        return true;
+    }
+'''
+
+# Click the Nth event row's document button, or its document image.
+# This may trigger either a direct download or a multi-document popup.
+_CLICK_EVENT_DOCUMENT_JS = '''
+    (eventRows, eventIndex) => {
+        let eventDiv = eventRows[eventIndex];
+        if (!eventDiv || !eventDiv.isConnected) {
+            // Row was re-rendered (e.g. after a popup); fall back to a fresh query
+            eventDiv = document.querySelectorAll('[ng-repeat*="event"]')[eventIndex];
+        }
+        if (eventDiv) {
+            // Try button first, then image
+            const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
+            const docImg = eventDiv.querySelector('img[title*="document" i]');
+            if (docBtn) docBtn.click();
+            else if (docImg) docImg.click();
+        }
+    }
+'''
+
+
+def _strip_unsafe_filename_chars(text: str) -> str:
+    """
+    Remove the characters _FILENAME_UNSAFE_RE matches from a name.
+
+    Portal event and document names are almost always ASCII, where deleting
+    bytes with bytes.translate is several times faster than a regex substitution;
+    anything else goes through the regex so the result is identical either way.
+
+    Args:
+        text: Event type or document name
+
+    Returns:
+        str: text without filename-unsafe characters
+    """
+    if text.isascii():
+        return text.encode('ascii').translate(None, _FILENAME_UNSAFE_ASCII).decode('ascii')
+    return _FILENAME_UNSAFE_RE.sub('', text)
+
+
+def _event_file_key(filename: str) -> str:
+    """
+    Reduce a saved document filename to the "{date}_{type}" key of its event.
+
+    Args:
+        filename: Document filename, e.g. "11-25-2025_Notice of Sale_2.pdf"
+
+    Returns:
+        str: Event key, e.g. "11-25-2025_Notice of Sale" (filename unchanged if
+        it was not named after an event)
+    """
+    match = _EVENT_FILENAME_RE.match(filename)
+    return match.group(1) if match else filename
+
+
+def _parse_doc_date(date_str: str):
+    """
+    Parse a portal MM/DD/YYYY date, tolerating blank or malformed values.
+
+    Args:
+        date_str: Date string from the page
+
+    Returns:
+        date, or None if the string is empty or not in MM/DD/YYYY format
+    """
+    if not date_str:
+        return None
+    try:
+        return parse_portal_date(date_str)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: on average `rate` acquisitions per second, with
+    bursts of up to `burst` back to back. It only limits the threads of one
+    process.
+
+    A caller that finds the bucket empty reserves the next token and sleeps only
+    until it's due, so time already spent on a slow download isn't slept again.
+    """
+
+    def __init__(self, rate: float = DOWNLOAD_RATE, burst: int = DOWNLOAD_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it's available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+# One bucket per portal host, shared by every worker thread of this process downloading from it
+_download_buckets = {}
+_download_buckets_lock = threading.Lock()
+
+# How many processes split DOWNLOAD_RATE/DOWNLOAD_BURST (see set_download_share)
+_download_share = 1
+
+
+def set_download_share(processes: int):
+    """
+    Limit this process to its share of the download rate.
+
+    The token buckets are per process, so N processes downloading from the
+    portal would otherwise each get DOWNLOAD_RATE. Call this in every worker
+    process with N so the host sees DOWNLOAD_RATE in total; the burst is split
+    too, down to one download per process.
+
+    Args:
+        processes: Number of processes downloading at once
+    """
+    global _download_share
+    with _download_buckets_lock:
+        _download_share = max(1, processes)
+        _download_buckets.clear()
+
+
+def acquire_download_slot(page: Page):
+    """
+    Wait for the page's host to allow another document download.
+
+    Args:
+        page: Playwright page the download will be triggered from
+    """
+    host = urlparse(page.url).netloc
+    with _download_buckets_lock:
+        bucket = _download_buckets.get(host)
+        if bucket is None:
+            bucket = _download_buckets[host] = TokenBucket(
+                rate=DOWNLOAD_RATE / _download_share,
+                burst=max(1, DOWNLOAD_BURST // _download_share),
+            )
+    bucket.acquire()
+
+
+def save_download(download: Download, file_path: Path):
+    """
+    Move a finished download to file_path.
+
+    Browsers launched with config.get_browser_downloads_path() write downloads
+    onto the same filesystem as the PDF store, so the file is renamed into
+    place instead of being copied byte-for-byte by save_as(). Downloads staged
+    elsewhere (e.g. Playwright's default temp dir) still fall back to save_as().
+
+    Args:
+        download: Playwright download (waits for it to finish)
+        file_path: Destination path for the file
+    """
+    source = Path(download.path())
+    if source.stat().st_dev == file_path.parent.stat().st_dev:
+        try:
+            os.replace(source, file_path)
+            return
+        except OSError as e:
+            # e.g. EXDEV across bind mounts that report the same device
+            logger.debug("    Rename failed, copying download instead: %s", e)
+    download.save_as(str(file_path))
+
 
 def validate_document_case_number(file_path: str, expected_case_number: str) -> bool:
     """
@@ -45,7 +410,7 @@ def validate_document_case_number(file_path: str, expected_case_number: str) ->
 
         # Normalize expected case number to handle OCR variations
         # Convert "25SP001024" to patterns that match "25 SP 1024" or "25SP1024"
-        expected_normalized = re.sub(r'\s+', '', expected_core).upper()
+        expected_normalized = _WHITESPACE_RE.sub('', expected_core).upper()
 
         # Extract text from first page using pdftotext (limit to 2000 chars for performance)
         try:
@@ -57,34 +422,29 @@ def validate_document_case_number(file_path: str, expected_case_number: str) ->
             )
 
             if result.returncode != 0:
-                logger.debug(f"    pdftotext failed for {Path(file_path).name}: {result.stderr}")
+                logger.debug("    pdftotext failed for %s: %s", os.path.basename(file_path), result.stderr)
                 # If we can't extract text, assume valid (might be scanned image)
                 return True
 
             pdf_text = result.stdout[:2000]  # Only check first 2000 chars
 
         except subprocess.TimeoutExpired:
-            logger.warning(f"    pdftotext timeout for {Path(file_path).name}")
+            logger.warning(f"    pdftotext timeout for {os.path.basename(file_path)}")
             return True
         except FileNotFoundError:
             logger.warning(f"    pdftotext not found - skipping validation")
             return True
         except Exception as e:
-            logger.debug(f"    Error running pdftotext: {e}")
+            logger.debug("    Error running pdftotext: %s", e)
             return True
 
         # Search for case number patterns in the PDF text
         # Pattern 1: "25SP001024-910" (exact format)
         # Pattern 2: "25 SP 1024" (with spaces, common in OCR)
         # Pattern 3: "25SP1024" (no leading zeros)
-        case_number_patterns = [
-            r'\b(\d{2})\s*SP\s*(\d{6})\b',  # Matches "25SP001024" or "25 SP 001024"
-            r'\b(\d{2})\s*SP\s*(\d{4})\b',   # Matches "25SP1024" or "25 SP 1024"
-        ]
-
         found_case_numbers = []
-        for pattern in case_number_patterns:
-            matches = re.finditer(pattern, pdf_text, re.IGNORECASE)
+        for pattern in _CASE_NUMBER_RES:
+            matches = pattern.finditer(pdf_text)
             for match in matches:
                 # Reconstruct case number from groups (year + "SP" + number)
                 year = match.group(1)
@@ -94,25 +454,25 @@ def validate_document_case_number(file_path: str, expected_case_number: str) ->
 
         # If no case numbers found, assume valid (some docs don't have case numbers)
         if not found_case_numbers:
-            logger.debug(f"    No case numbers found in {Path(file_path).name} - assuming valid")
+            logger.debug("    No case numbers found in %s - assuming valid", os.path.basename(file_path))
             return True
 
         # Check if any found case number matches the expected one
         for found_case in found_case_numbers:
-            found_normalized = re.sub(r'\s+', '', found_case).upper()
+            found_normalized = _WHITESPACE_RE.sub('', found_case).upper()
             if found_normalized == expected_normalized:
-                logger.debug(f"    Validated: {Path(file_path).name} contains case {found_case}")
+                logger.debug("    Validated: %s contains case %s", os.path.basename(file_path), found_case)
                 return True
 
         # Mismatch detected - found case numbers but none match expected
         logger.warning(
-            f"    MISMATCH: {Path(file_path).name} - expected {expected_case_number}, "
+            f"    MISMATCH: {os.path.basename(file_path)} - expected {expected_case_number}, "
             f"found {', '.join(set(found_case_numbers))}"
         )
         return False
 
     except Exception as e:
-        logger.error(f"    Validation error for {Path(file_path).name}: {e}")
+        logger.error(f"    Validation error for {os.path.basename(file_path)}: {e}")
         # On error, assume valid to avoid false positives
         return True
 
@@ -135,7 +495,10 @@ def find_matching_event(session, case_id: int, event_date_str: str, event_type:
 
     try:
         # Convert date string to date object
-        event_date_obj = datetime.strptime(event_date_str, '%m/%d/%Y').date()
+        event_date_obj = _parse_doc_date(event_date_str)
+        if event_date_obj is None:
+            logger.debug("Invalid date format '%s'", event_date_str)
+            return None
 
         # Try exact match first
         event = session.query(CaseEvent).filter(
@@ -157,9 +520,6 @@ def find_matching_event(session, case_id: int, event_date_str: str, event_type:
 
         return event
 
-    except ValueError as e:
-        logger.debug(f"Invalid date format '{event_date_str}': {e}")
-        return None
     except Exception as e:
         logger.warning(f"Error finding matching event: {e}")
         return None
@@ -185,7 +545,25 @@ def handle_document_selector_popup(page: Page, download_path: Path, base_filenam
     """
     downloaded_files = []
 
+    # Row downloads are started back to back, with up to MAX_IN_FLIGHT_DOWNLOADS
+    # transferring at once, and saved in row order
+    in_flight = deque()
+
+    def finish_oldest():
+        download, file_path = in_flight.popleft()
+        try:
+            save_download(download, file_path)
+            downloaded_files.append(str(file_path))
+            logger.info(f"      Saved: {file_path.name}")
+        except Exception as e:
+            logger.warning(f"      Failed to download from popup: {e}")
+
     try:
+        # Rule the popup out in one round trip before probing the selectors below one
+        # at a time; each of them needs the visible title or the aria-label to match
+        if not page.evaluate(_DOCUMENT_SELECTOR_SHOWN_JS):
+            return []
+
         # Check if Document Selector dialog is present
         # The portal uses native HTML <dialog> elements, NOT div[role="dialog"]
         # Try multiple selectors to find the dialog
@@ -199,16 +577,18 @@ def handle_document_selector_popup(page: Page, download_path: Path, base_filenam
             '[aria-label="Document Selector"]',
         ]
 
+        # Combine the visible matches of every selector into one locator, so a
+        # single count() probes them all instead of two calls per selector
         dialog = None
-        for selector in dialog_selectors:
-            try:
-                d = page.locator(selector)
-                if d.count() > 0 and d.is_visible():
-                    dialog = d
-                    logger.debug(f"  Found dialog with selector: {selector}")
-                    break
-            except:
-                continue
+        try:
+            candidates = page.locator(f'{dialog_selectors[0]}:visible')
+            for selector in dialog_selectors[1:]:
+                candidates = candidates.or_(page.locator(f'{selector}:visible'))
+            if candidates.count() > 0:
+                dialog = candidates.first
+                logger.debug("  Found dialog with selectors")
+        except:
+            pass
 
         # If no dialog found by selectors, try Playwright's role-based locator
         if not dialog:
@@ -263,35 +643,43 @@ def handle_document_selector_popup(page: Page, download_path: Path, base_filenam
 
         logger.info(f"  Found {row_count} documents in popup")
 
+        # Read every row's text in one round trip instead of two calls per row
+        row_texts = doc_rows.all_inner_texts()
+
+        # List the directory once; picking a free filename is then a set lookup per candidate
+        files_on_disk = set(os.listdir(download_path)) if download_path.exists() else set()
+
         for i in range(row_count):
             row = doc_rows.nth(i)
-            row_text = row.inner_text(timeout=2000) if row.count() > 0 else ""
+            row_text = row_texts[i] if i < len(row_texts) else ""
 
             # Skip header rows
             if 'Date' in row_text and 'Document Type' in row_text:
                 continue
 
+            acquire_download_slot(page)
+
             # Extract document info from the row text
             # Format observed: "11/25/2025 Public Check Deposit- Unlimited Reload LLC 2"
             doc_name = f"document_{i+1}"
             doc_date = ""
             try:
                 # Try to extract date from row text using regex
-                date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', row_text)
+                date_match = _ROW_DATE_RE.search(row_text)
                 if date_match:
                     doc_date = date_match.group(1)
                 # Get document type/name after the date
                 if date_match:
                     name_part = row_text[date_match.end():].strip()
                     # Remove trailing page count number
-                    name_part = re.sub(r'\s+\d+\s*$', '', name_part)
+                    name_part = _TRAILING_PAGE_COUNT_RE.sub('', name_part)
                     if name_part:
                         doc_name = name_part
             except:
                 pass
 
             # Clean up for filename
-            clean_name = re.sub(r'[^\w\s-]', '', doc_name)[:40].strip()
+            clean_name = _strip_unsafe_filename_chars(doc_name)[:40].strip()
             clean_date = doc_date.replace('/', '-') if doc_date else 'unknown'
 
             if base_filename:
@@ -300,13 +688,12 @@ def handle_document_selector_popup(page: Page, download_path: Path, base_filenam
                 filename = f"{clean_date}_{clean_name}.pdf"
 
             # Handle duplicate filenames
-            file_path = download_path / filename
             counter = 1
-            while file_path.exists():
+            while filename in files_on_disk:
                 name_without_ext = filename.rsplit('.pdf', 1)[0]
                 filename = f"{name_without_ext}_{counter}.pdf"
-                file_path = download_path / filename
                 counter += 1
+            file_path = download_path / filename
 
             logger.info(f"    Downloading from popup: {doc_name[:50]}")
 
@@ -342,33 +729,34 @@ def handle_document_selector_popup(page: Page, download_path: Path, base_filenam
                         pass
 
                 if download_btn:
+                    if len(in_flight) >= MAX_IN_FLIGHT_DOWNLOADS:
+                        finish_oldest()
                     with page.expect_download(timeout=30000) as download_info:
                         download_btn.click()
 
-                    download = download_info.value
-                    download.save_as(str(file_path))
-                    downloaded_files.append(str(file_path))
-                    logger.info(f"      Saved: {filename}")
+                    # Reserve the name now so later rows don't pick it while this one transfers
+                    files_on_disk.add(filename)
+                    in_flight.append((download_info.value, file_path))
                 else:
                     logger.warning(f"      No download button found in row {i}")
 
             except Exception as e:
                 logger.warning(f"      Failed to download from popup: {e}")
 
-            # Small delay between downloads
-            time.sleep(0.3)
-
         # Close the dialog
         try:
             cancel_btn = page.locator('button:has-text("Cancel"):visible')
             cancel_btn.click(timeout=2000)
-            # Wait for dialog to close
-            page.wait_for_timeout(500)
+            # Wait for the dialog to actually close rather than a fixed delay
+            cancel_btn.wait_for(state='hidden', timeout=2000)
         except Exception as e:
-            logger.debug(f"  Could not close popup (may have closed automatically): {e}")
+            logger.debug("  Could not close popup (may have closed automatically): %s", e)
 
     except Exception as e:
-        logger.debug(f"  No multi-document popup or error handling it: {e}")
+        logger.debug("  No multi-document popup or error handling it: %s", e)
+
+    while in_flight:
+        finish_oldest()
 
     return downloaded_files
 
@@ -386,123 +774,107 @@ def extract_document_info_from_page(page: Page):
 
     Returns:
         list: List of dicts with document info:
-            - index: Document index/number
-            - event_type: Type of event this document is attached to
-            - event_date: Date of the event
-            - has_download: Whether download button exists
+            - buttonIndex: Index of the document control (see _DOCUMENT_CONTROLS_JS)
+            - eventDate: Date of the event the document is attached to (MM/DD/YYYY, or '')
+            - eventType: Type of that event (or '' if it couldn't be read)
     """
-    documents = []
-
     try:
-        # Find all event containers that have document indicators
         # The portal shows a document icon (IMG with title) for events with attached documents
-        doc_info = page.evaluate(r'''
-            () => {
-                const docs = [];
-
-                // Method 1: Look for IMG elements with title containing "document"
-                // These are clickable icons that trigger PDF downloads
-                const docIcons = document.querySelectorAll('img[title*="document" i], img.roa-clickable[title*="document" i]');
-                docIcons.forEach((img, idx) => {
-                    // Try to find the parent event row to get context
-                    const eventRow = img.closest('[ng-repeat*="event"]') || img.closest('tr') || img.closest('div');
-                    let eventType = '';
-                    let eventDate = '';
-
-                    if (eventRow) {
-                        // Extract text content for event info
-                        const text = eventRow.textContent || '';
-                        // Try to find date pattern
-                        const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
-                        if (dateMatch) {
-                            eventDate = dateMatch[1];
-                        }
-                    }
+        documents = page.evaluate(_EXTRACT_DOC_INFO_JS)
+        logger.debug("Found %d document buttons", len(documents))
+        return documents
 
-                    docs.push({
-                        index: idx + 1,
-                        buttonIndex: idx,
-                        eventType: eventType,
-                        eventDate: eventDate,
-                        title: img.getAttribute('title') || '',
-                        hasDownload: true
-                    });
-                });
+    except Exception as e:
+        logger.error(f"Error extracting document info: {e}")
+        return []
 
-                // Method 2: Fallback - look for buttons with aria-label containing "document"
-                if (docs.length === 0) {
-                    const docButtons = document.querySelectorAll('button[aria-label*="document" i]');
-                    docButtons.forEach((btn, idx) => {
-                        const eventRow = btn.closest('[ng-repeat*="event"]') || btn.closest('tr') || btn.closest('div');
-                        let eventDate = '';
-                        if (eventRow) {
-                            const text = eventRow.textContent || '';
-                            const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
-                            if (dateMatch) {
-                                eventDate = dateMatch[1];
-                            }
-                        }
-                        docs.push({
-                            index: idx + 1,
-                            buttonIndex: idx,
-                            eventType: '',
-                            eventDate: eventDate,
-                            title: btn.getAttribute('aria-label') || '',
-                            hasDownload: true
-                        });
-                    });
-                }
 
-                return {
-                    buttonDocs: docs,
-                    docCount: docs.length
-                };
-            }
-        ''')
+def scan_document_events(page: Page) -> list:
+    """
+    Scan the case detail page once for every event that has a document attached.
 
-        logger.debug(f"Found {len(doc_info.get('buttonDocs', []))} document buttons, {doc_info.get('indexCount', 0)} index references")
+    download_upset_bid_documents and download_all_case_documents both filter
+    this list, so a caller running both can scan once and pass it to each.
 
-        return doc_info.get('buttonDocs', [])
+    Args:
+        page: Playwright page object (on case detail page)
 
-    except Exception as e:
-        logger.error(f"Error extracting document info: {e}")
-        return []
+    Returns:
+        list: Dicts with index (into the case's event rows), eventType, eventDate,
+            hasButton, hasImage, isUpsetBid, isSale, isForeclosureFiling, isOrder
+    """
+    return page.evaluate(_EVENT_SCAN_JS)
 
 
-def click_document_button_and_download(page: Page, button_index: int, download_path: Path, timeout: int = 30000):
+def click_event_document(page: Page, event_rows: JSHandle, event_index: int,
+                         settle_ms: int = EVENT_CLICK_SETTLE_MS):
     """
-    Click a document icon/button and handle the download.
+    Click an event's document control once and capture the download if one starts.
+
+    Single-document events hand back their download as soon as it begins, with no
+    fixed sleep and no second click; only clicks that start nothing (typically
+    the multi-document popup) wait out the settle window.
 
     Args:
         page: Playwright page object
+        event_rows: Handle to the case's event rows (from _EVENT_ROWS_JS)
+        event_index: Index of the event in the case's event list
+        settle_ms: How long to wait for a direct download to start
+
+    Returns:
+        Download, or None if no download started within settle_ms
+    """
+    try:
+        with page.expect_download(timeout=settle_ms) as download_info:
+            event_rows.evaluate(_CLICK_EVENT_DOCUMENT_JS, event_index)
+        return download_info.value
+    except PlaywrightTimeoutError:
+        return None
+
+
+def start_document_download(page: Page, doc_controls: JSHandle, button_index: int,
+                            timeout: int = 30000):
+    """
+    Click a document icon/button and wait for its download to start.
+
+    Playwright reports a download as soon as the response begins; the file keeps
+    transferring in the browser until save_document_download() waits for it.
+
+    Args:
+        page: Playwright page object
+        doc_controls: Handle to the page's document controls (from _DOCUMENT_CONTROLS_JS)
         button_index: Index of the document icon to click
-        download_path: Path where to save the downloaded file
-        timeout: Download timeout in milliseconds
+        timeout: Milliseconds to wait for the download to start
 
     Returns:
-        str: Path to downloaded file, or None if download failed
+        Download: The started download, or None if none started
     """
     try:
         # Set up download handler
         with page.expect_download(timeout=timeout) as download_info:
             # Click the document icon by index
             # First try IMG elements (primary method), then fallback to buttons
-            page.evaluate(f'''
-                () => {{
-                    // Try IMG elements first (portal uses IMG with title for doc icons)
-                    let docElements = document.querySelectorAll('img[title*="document" i]');
-                    if (docElements.length === 0) {{
-                        // Fallback to buttons
-                        docElements = document.querySelectorAll('button[aria-label*="document" i]');
-                    }}
-                    if (docElements[{button_index}]) {{
-                        docElements[{button_index}].click();
-                    }}
-                }}
-            ''')
+            doc_controls.evaluate(_CLICK_DOCUMENT_ICON_JS, button_index)
+        return download_info.value
 
-        download = download_info.value
+    except Exception as e:
+        logger.warning(f"  Download failed for button {button_index}: {e}")
+        return None
+
+
+def save_document_download(download: Download, button_index: int, download_path: Path):
+    """
+    Wait for a started document download to finish and save it.
+
+    Args:
+        download: Download returned by start_document_download()
+        button_index: Index of the document icon that started it (for the fallback name)
+        download_path: Path where to save the downloaded file
 
+    Returns:
+        str: Path to downloaded file, or None if download failed
+    """
+    try:
         # Generate filename from suggested name or use default
         suggested_name = download.suggested_filename
         if not suggested_name or suggested_name == 'download':
@@ -514,7 +886,7 @@ def click_document_button_and_download(page: Page, button_index: int, download_p
 
         # Save the file
         file_path = download_path / suggested_name
-        download.save_as(str(file_path))
+        save_download(download, file_path)
 
         logger.info(f"  Downloaded: {suggested_name}")
         return str(file_path)
@@ -524,7 +896,203 @@ def click_document_button_and_download(page: Page, button_index: int, download_p
         return None
 
 
-def download_case_documents(page: Page, case_id: int, county: str, case_number: str):
+def click_document_button_and_download(page: Page, doc_controls: JSHandle, button_index: int,
+                                       download_path: Path, timeout: int = 30000):
+    """
+    Click a document icon/button and handle the download.
+
+    Args:
+        page: Playwright page object
+        doc_controls: Handle to the page's document controls (from _DOCUMENT_CONTROLS_JS)
+        button_index: Index of the document icon to click
+        download_path: Path where to save the downloaded file
+        timeout: Download timeout in milliseconds
+
+    Returns:
+        str: Path to downloaded file, or None if download failed
+    """
+    download = start_document_download(page, doc_controls, button_index, timeout)
+    if download is None:
+        return None
+    return save_document_download(download, button_index, download_path)
+
+
+def _load_case_events(session, case_id: int) -> dict:
+    """
+    Load a case's events for in-memory matching with _match_event_id().
+
+    Args:
+        session: Database session
+        case_id: Database ID of the case
+
+    Returns:
+        dict: event_date -> [(event id, event_type), ...] in id order
+    """
+    events_by_date = defaultdict(list)
+    rows = session.query(CaseEvent.id, CaseEvent.event_date, CaseEvent.event_type).filter(
+        CaseEvent.case_id == case_id
+    ).order_by(CaseEvent.id)
+    for event_id, event_date, event_type in rows:
+        events_by_date[event_date].append((event_id, event_type or ''))
+    return events_by_date
+
+
+def _match_event_id(events_by_date: dict, event_date_str: str, event_type: str):
+    """
+    Match a document's event date and type against events from _load_case_events().
+
+    Same rule as find_matching_event(): an exact type match on the date first,
+    then an event on the date whose type contains the first 20 characters of
+    event_type, case-insensitively.
+
+    Args:
+        events_by_date: Result of _load_case_events()
+        event_date_str: Event date string in MM/DD/YYYY format
+        event_type: Event type string (e.g., "Report of Sale Filed")
+
+    Returns:
+        int: Matching event id, or None
+    """
+    if not event_date_str or not event_type:
+        return None
+    event_date = _parse_doc_date(event_date_str)
+    if event_date is None:
+        # Undated events are filed under None; an unparseable date must not match them
+        return None
+    candidates = events_by_date.get(event_date, ())
+
+    for event_id, candidate_type in candidates:
+        if candidate_type == event_type:
+            return event_id
+
+    needle = event_type[:20].lower()
+    for event_id, candidate_type in candidates:
+        if needle in candidate_type.lower():
+            return event_id
+    return None
+
+
+def _document_values(events_by_date: dict, case_id: int, file_path: str, event_date: str,
+                     event_type: str) -> dict:
+    """Build the column values of a Document row for a downloaded file, linked to its event when one matches."""
+    return {
+        'case_id': case_id,
+        'event_id': _match_event_id(events_by_date, event_date, event_type),
+        'document_name': os.path.basename(file_path),
+        'file_path': file_path,
+        'document_date': _parse_doc_date(event_date),
+    }
+
+
+def save_document_records(case_id: int, downloaded: list) -> list:
+    """
+    Create Document records for downloaded files in a single transaction.
+
+    The batch is one INSERT ... RETURNING of plain column dicts, so no ORM
+    Document instances are built for it. If the batch fails, each row is retried in its own transaction so one bad
+    row doesn't lose the rest.
+
+    Args:
+        case_id: Database ID of the case
+        downloaded: (file_path, event_date, event_type) tuples
+
+    Returns:
+        list: Database ID of each saved record, aligned with downloaded (None where saving failed)
+    """
+    if not downloaded:
+        return []
+
+    # The case's events are loaded once and matched in memory, shared by the batch and the fallback
+    events_by_date = None
+    try:
+        with get_session() as session:
+            events_by_date = _load_case_events(session, case_id)
+            values = [_document_values(events_by_date, case_id, *row) for row in downloaded]
+            doc_ids = list(session.scalars(
+                insert(Document).returning(Document.id, sort_by_parameter_order=True),
+                values
+            ))
+            session.commit()
+        logger.debug("    Saved %d document records to database", len(downloaded))
+        return doc_ids
+    except Exception as e:
+        logger.warning(f"    Batch document insert failed, saving one at a time: {e}")
+
+    doc_ids = []
+    for row in downloaded:
+        try:
+            with get_session() as session:
+                if events_by_date is None:
+                    events_by_date = _load_case_events(session, case_id)
+                document = Document(**_document_values(events_by_date, case_id, *row))
+                session.add(document)
+                session.commit()
+                doc_ids.append(document.id)
+        except Exception as e:
+            logger.error(f"    Failed to save document record: {e}")
+            doc_ids.append(None)
+    return doc_ids
+
+
+def record_new_documents(case_id: int, new_docs: list):
+    """
+    Save Document records for newly downloaded files and fill in their document_id.
+
+    Args:
+        case_id: Database ID of the case
+        new_docs: Download info dicts (file_path, event_date, event_type) whose
+            document_id is set in place; None if the record couldn't be saved
+    """
+    doc_ids = save_document_records(
+        case_id,
+        [(doc['file_path'], doc['event_date'], doc['event_type']) for doc in new_docs]
+    )
+    for doc, doc_id in zip(new_docs, doc_ids):
+        doc['document_id'] = doc_id
+
+
+def filter_already_downloaded(case_id: int, doc_buttons: list) -> list:
+    """
+    Drop document buttons whose date already has all its documents on file.
+
+    Buttons only carry the event date, so matching is per date: a date is
+    skipped when the case already has at least as many Document rows dated
+    that day as there are buttons for it. Any other date - including one that
+    gained a document since the last run - is downloaded in full, as are
+    buttons with no parseable date.
+
+    Args:
+        case_id: Database ID of the case
+        doc_buttons: Button info from extract_document_info_from_page()
+
+    Returns:
+        list: The buttons that still need downloading
+    """
+    try:
+        with get_session() as session:
+            existing = Counter(
+                doc_date for (doc_date,) in session.query(Document.document_date).filter(
+                    Document.case_id == case_id,
+                    Document.document_date.isnot(None)
+                )
+            )
+    except Exception as e:
+        logger.warning(f"  Could not check existing documents, downloading all: {e}")
+        return doc_buttons
+
+    if not existing:
+        return doc_buttons
+
+    buttons_per_date = Counter(_parse_doc_date(b.get('eventDate', '')) for b in doc_buttons)
+    return [
+        b for b in doc_buttons
+        if (doc_date := _parse_doc_date(b.get('eventDate', ''))) is None
+        or existing[doc_date] < buttons_per_date[doc_date]
+    ]
+
+
+def download_case_documents(page: Page, case_id: int, county: str, case_number: str,
+                            skip_existing: bool = False):
     """
     Download all documents for a case from its detail page.
 
@@ -540,15 +1108,27 @@ def download_case_documents(page: Page, case_id: int, county: str, case_number:
         case_id: Database ID of the case
         county: County name (e.g., 'wake')
         case_number: Case number (e.g., '24SP000437-910')
+        skip_existing: If True, return without scanning the page when the case
+            already has any Document rows (default: False, download whatever
+            filter_already_downloaded() finds missing)
 
     Returns:
         int: Number of documents downloaded
     """
     logger.info(f"Checking for documents to download...")
 
+    if skip_existing:
+        with get_session() as session:
+            has_documents = session.query(
+                session.query(Document.id).filter(Document.case_id == case_id).exists()
+            ).scalar()
+        if has_documents:
+            logger.info(f"  Case already has documents, skipping")
+            return 0
+
     # Get storage path for this case
     download_path = config.get_pdf_path(county, case_number)
-    logger.debug(f"  Download path: {download_path}")
+    logger.debug("  Download path: %s", download_path)
 
     # Extract document info from page
     doc_buttons = extract_document_info_from_page(page)
@@ -557,60 +1137,51 @@ def download_case_documents(page: Page, case_id: int, county: str, case_number:
         logger.info(f"  No documents found")
         return 0
 
-    logger.info(f"  Found {len(doc_buttons)} document(s) to download")
+    found_count = len(doc_buttons)
+    doc_buttons = filter_already_downloaded(case_id, doc_buttons)
+    if not doc_buttons:
+        logger.info(f"  All {found_count} document(s) already downloaded")
+        return 0
 
-    downloaded_count = 0
+    logger.info(f"  Found {found_count} document(s), {len(doc_buttons)} to download")
 
-    for doc_info in doc_buttons:
-        button_index = doc_info.get('buttonIndex', 0)
-        event_date = doc_info.get('eventDate', '')
-        event_type = doc_info.get('eventType', '')
-
-        # Try to download
-        file_path = click_document_button_and_download(
-            page,
-            button_index,
-            download_path
-        )
+    # (file_path, event_date, event_type) per download, saved in one transaction below
+    downloaded = []
 
+    # Query the document controls once; the handle is released when the page navigates away
+    doc_controls = page.evaluate_handle(_DOCUMENT_CONTROLS_JS)
+
+    # Start each download as soon as the previous one has started, keeping up to
+    # MAX_IN_FLIGHT_DOWNLOADS transferring at once, and save them in click order
+    in_flight = deque()
+
+    def finish_oldest():
+        download, doc_info = in_flight.popleft()
+        file_path = save_document_download(download, doc_info.get('buttonIndex', 0), download_path)
         if file_path:
-            # Parse event date if available
-            doc_date = None
-            if event_date:
-                try:
-                    doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-                except ValueError:
-                    pass
+            downloaded.append((file_path, doc_info.get('eventDate', ''), doc_info.get('eventType', '')))
 
-            # Create database record
-            try:
-                with get_session() as session:
-                    # Find matching event if we have both date and type
-                    event = find_matching_event(session, case_id, event_date, event_type) if event_type else None
-
-                    document = Document(
-                        case_id=case_id,
-                        event_id=event.id if event else None,
-                        document_name=Path(file_path).name,
-                        file_path=file_path,
-                        document_date=doc_date
-                    )
-                    session.add(document)
-                    session.commit()
-
-                downloaded_count += 1
-                logger.debug(f"    Saved document record to database")
+    for doc_info in doc_buttons:
+        if len(in_flight) >= MAX_IN_FLIGHT_DOWNLOADS:
+            finish_oldest()
+        acquire_download_slot(page)
+        download = start_document_download(page, doc_controls, doc_info.get('buttonIndex', 0))
+        if download is not None:
+            in_flight.append((download, doc_info))
 
-            except Exception as e:
-                logger.error(f"    Failed to save document record: {e}")
+    while in_flight:
+        finish_oldest()
 
-        # Small delay between downloads to be polite
-        time.sleep(0.5)
+    downloaded_count = sum(1 for doc_id in save_document_records(case_id, downloaded) if doc_id is not None)
 
     logger.info(f"  Downloaded {downloaded_count}/{len(doc_buttons)} documents")
     return downloaded_count
 
 
+class _NoDocumentButton(Exception):
+    """The event row clicked by download_documents_for_event has no document button."""
+
+
 def download_documents_for_event(page: Page, case_id: int, county: str, case_number: str,
                                   event_index: int, event_type: str = None, event_date: str = None):
     """
@@ -633,39 +1204,18 @@ def download_documents_for_event(page: Page, case_id: int, county: str, case_num
     download_path = config.get_pdf_path(county, case_number)
 
     try:
-        # Check if this event has a document button
-        has_doc = page.evaluate(f'''
-            () => {{
-                const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                if (eventDivs[{event_index}]) {{
-                    const docBtn = eventDivs[{event_index}].querySelector('button[aria-label*="document" i]');
-                    return docBtn !== null;
-                }}
-                return false;
-            }}
-        ''')
-
-        if not has_doc:
-            return None
-
-        # Click and download
+        # Click and download; the script reports whether the event had a button to click
         with page.expect_download(timeout=30000) as download_info:
-            page.evaluate(f'''
-                () => {{
-                    const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                    if (eventDivs[{event_index}]) {{
-                        const docBtn = eventDivs[{event_index}].querySelector('button[aria-label*="document" i]');
-                        if (docBtn) docBtn.click();
-                    }}
-                }}
-            ''')
+            if not page.evaluate(_CLICK_EVENT_DOCUMENT_BUTTON_JS, event_index):
+                # Leaving the block with an exception cancels the download wait
+                raise _NoDocumentButton()
 
         download = download_info.value
 
         # Generate filename
         if event_type and event_date:
             # Clean filename
-            clean_type = re.sub(r'[^\w\s-]', '', event_type)[:30]
+            clean_type = _strip_unsafe_filename_chars(event_type)[:30]
             clean_date = event_date.replace('/', '-')
             filename = f"{clean_date}_{clean_type}.pdf"
         else:
@@ -675,15 +1225,10 @@ def download_documents_for_event(page: Page, case_id: int, county: str, case_num
             filename += '.pdf'
 
         file_path = download_path / filename
-        download.save_as(str(file_path))
+        save_download(download, file_path)
 
         # Save to database
-        doc_date = None
-        if event_date:
-            try:
-                doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-            except ValueError:
-                pass
+        doc_date = _parse_doc_date(event_date)
 
         with get_session() as session:
             # Find matching event if we have both date and type
@@ -702,12 +1247,16 @@ def download_documents_for_event(page: Page, case_id: int, county: str, case_num
         logger.info(f"    Downloaded document: {filename}")
         return str(file_path)
 
+    except _NoDocumentButton:
+        return None
+
     except Exception as e:
-        logger.debug(f"    No document download for event {event_index}: {e}")
+        logger.debug("    No document download for event %s: %s", event_index, e)
         return None
 
 
-def download_upset_bid_documents(page: Page, case_id: int, county: str, case_number: str):
+def download_upset_bid_documents(page: Page, case_id: int, county: str, case_number: str,
+                                 events: list = None):
     """
     Download documents specifically for upset bid and sale events.
 
@@ -721,6 +1270,7 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
         case_id: Database ID of the case
         county: County name (e.g., 'wake')
         case_number: Case number (e.g., '24SP000437-910')
+        events: Result of scan_document_events() for this page, if the caller already has it
 
     Returns:
         list: List of dicts with downloaded document info:
@@ -734,61 +1284,9 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
     downloaded = []
 
     try:
-        # Find all events with their document button status
-        # Use JavaScript to get event details with document availability
-        events_with_docs = page.evaluate(r'''
-            () => {
-                const results = [];
-
-                // Find all event containers (Angular ng-repeat)
-                const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-
-                eventDivs.forEach((eventDiv, idx) => {
-                    const text = eventDiv.textContent || '';
-                    const textLower = text.toLowerCase();
-
-                    // Check if this is an upset bid or sale event
-                    const isUpsetBid = textLower.includes('upset bid');
-                    const isSaleReport = textLower.includes('report of') && textLower.includes('sale');
-                    const isNoticeOfSale = textLower.includes('notice of sale');
-
-                    if (isUpsetBid || isSaleReport || isNoticeOfSale) {
-                        // Check for document button/icon
-                        const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                        const docImg = eventDiv.querySelector('img[title*="document" i]');
-
-                        if (docBtn || docImg) {
-                            // Extract event date
-                            const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
-                            const eventDate = dateMatch ? dateMatch[1] : '';
-
-                            // Extract event type - find capitalized text
-                            let eventType = '';
-                            const lines = text.split('\n').map(l => l.trim()).filter(l => l);
-                            for (const line of lines) {
-                                if (line.match(/^[A-Z][a-zA-Z\s()/\-0-9]+$/) &&
-                                    line.length > 5 && line.length < 80) {
-                                    eventType = line;
-                                    break;
-                                }
-                            }
-
-                            results.push({
-                                index: idx,
-                                eventType: eventType,
-                                eventDate: eventDate,
-                                hasButton: !!docBtn,
-                                hasImage: !!docImg,
-                                isUpsetBid: isUpsetBid,
-                                isSale: isSaleReport || isNoticeOfSale
-                            });
-                        }
-                    }
-                });
-
-                return results;
-            }
-        ''')
+        if events is None:
+            events = scan_document_events(page)
+        events_with_docs = [e for e in events if e['isUpsetBid'] or e['isSale']]
 
         if not events_with_docs:
             logger.info(f"  No upset bid/sale documents found")
@@ -796,39 +1294,28 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
 
         logger.info(f"  Found {len(events_with_docs)} upset bid/sale document(s)")
 
+        # Query the event rows once; the handle is released when the page navigates away
+        event_rows = page.evaluate_handle(_EVENT_ROWS_JS)
+
         for event_info in events_with_docs:
             event_index = event_info['index']
             event_type = event_info.get('eventType', 'Unknown')
             event_date = event_info.get('eventDate', '')
 
             logger.info(f"    Downloading: {event_date} - {event_type}")
+            acquire_download_slot(page)
 
             # Generate filename base
-            clean_type = re.sub(r'[^\w\s-]', '', event_type)[:40]
+            clean_type = _strip_unsafe_filename_chars(event_type)[:40]
             clean_date = event_date.replace('/', '-') if event_date else 'unknown'
 
             try:
                 # Click the document button/image for this specific event
                 # This may trigger either a download or a multi-document popup
-                page.evaluate(f'''
-                    () => {{
-                        const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                        const eventDiv = eventDivs[{event_index}];
-                        if (eventDiv) {{
-                            // Try button first, then image
-                            const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                            const docImg = eventDiv.querySelector('img[title*="document" i]');
-                            if (docBtn) docBtn.click();
-                            else if (docImg) docImg.click();
-                        }}
-                    }}
-                ''')
-
-                # Wait a moment for either download or popup
-                time.sleep(0.5)
-
-                # Check for multi-document popup first
-                popup_files = handle_document_selector_popup(
+                first_download = click_event_document(page, event_rows, event_index)
+
+                # No direct download means the click may have opened the popup instead
+                popup_files = [] if first_download else handle_document_selector_popup(
                     page,
                     download_path,
                     base_filename=f"{clean_date}_{clean_type}"
@@ -836,15 +1323,8 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
 
                 if popup_files:
                     # Multiple documents were downloaded from the popup
-                    doc_date = None
-                    if event_date:
-                        try:
-                            doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-                        except ValueError:
-                            pass
-
                     for file_path in popup_files:
-                        filename = Path(file_path).name
+                        filename = os.path.basename(file_path)
 
                         # Validate document case number
                         is_valid = validate_document_case_number(str(file_path), case_number)
@@ -856,50 +1336,26 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
                                 logger.error(f"      Failed to delete misfiled document: {e}")
                             continue
 
-                        with get_session() as session:
-                            # Find matching event
-                            event = find_matching_event(session, case_id, event_date, event_type)
-
-                            document = Document(
-                                case_id=case_id,
-                                event_id=event.id if event else None,
-                                document_name=filename,
-                                file_path=str(file_path),
-                                document_date=doc_date
-                            )
-                            session.add(document)
-                            session.commit()
-                            doc_id = document.id
-
                         downloaded.append({
                             'file_path': str(file_path),
-                            'document_id': doc_id,
+                            'document_id': None,  # assigned when the records are saved below
                             'event_type': event_type,
                             'event_date': event_date,
                             'is_upset_bid': event_info.get('isUpsetBid', False),
                             'is_sale': event_info.get('isSale', False)
                         })
                 else:
-                    # Single document - re-click and capture download
+                    # Single document - use the download the first click started, if any
                     try:
-                        with page.expect_download(timeout=30000) as download_info:
-                            page.evaluate(f'''
-                                () => {{
-                                    const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                                    const eventDiv = eventDivs[{event_index}];
-                                    if (eventDiv) {{
-                                        const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                                        const docImg = eventDiv.querySelector('img[title*="document" i]');
-                                        if (docBtn) docBtn.click();
-                                        else if (docImg) docImg.click();
-                                    }}
-                                }}
-                            ''')
-
-                        download = download_info.value
+                        download = first_download
+                        if download is None:
+                            # Nothing started within the settle window; click again and wait
+                            with page.expect_download(timeout=30000) as download_info:
+                                event_rows.evaluate(_CLICK_EVENT_DOCUMENT_JS, event_index)
+                            download = download_info.value
                         filename = f"{clean_date}_{clean_type}.pdf"
                         file_path = download_path / filename
-                        download.save_as(str(file_path))
+                        save_download(download, file_path)
 
                         # Validate document case number
                         is_valid = validate_document_case_number(str(file_path), case_number)
@@ -911,32 +1367,9 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
                                 logger.error(f"      Failed to delete misfiled document: {e}")
                             continue
 
-                        # Create database record
-                        doc_date = None
-                        if event_date:
-                            try:
-                                doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-                            except ValueError:
-                                pass
-
-                        with get_session() as session:
-                            # Find matching event
-                            event = find_matching_event(session, case_id, event_date, event_type)
-
-                            document = Document(
-                                case_id=case_id,
-                                event_id=event.id if event else None,
-                                document_name=filename,
-                                file_path=str(file_path),
-                                document_date=doc_date
-                            )
-                            session.add(document)
-                            session.commit()
-                            doc_id = document.id
-
                         downloaded.append({
                             'file_path': str(file_path),
-                            'document_id': doc_id,
+                            'document_id': None,  # assigned when the records are saved below
                             'event_type': event_type,
                             'event_date': event_date,
                             'is_upset_bid': event_info.get('isUpsetBid', False),
@@ -951,17 +1384,49 @@ def download_upset_bid_documents(page: Page, case_id: int, county: str, case_num
             except Exception as e:
                 logger.warning(f"      Download failed: {e}")
 
-            # Small delay between downloads
-            time.sleep(0.5)
-
     except Exception as e:
         logger.error(f"Error downloading upset bid documents: {e}")
 
+    # One transaction for every file downloaded above, including any before an error
+    record_new_documents(case_id, downloaded)
+
     return downloaded
 
 
+def load_existing_event_keys(case_ids: list) -> dict:
+    """
+    Load the event keys of documents already saved for a set of cases.
+
+    Keys are derived from each document's name and file name with
+    _event_file_key(), so files saved with a counter suffix or from the
+    Document Selector popup still mark their event as downloaded. One query
+    covers every case, letting a batch run prefetch them all up front.
+
+    Args:
+        case_ids: Database IDs of the cases
+
+    Returns:
+        dict: case_id -> set of "{date}_{type}" keys (cases without documents are absent)
+    """
+    if not case_ids:
+        return {}
+    existing = defaultdict(set)
+    with get_session() as session:
+        # Only the name columns are needed, so skip hydrating Document objects
+        rows = session.query(Document.case_id, Document.document_name, Document.file_path).filter(
+            Document.case_id.in_(set(case_ids))
+        ).all()
+    for doc_case_id, document_name, file_path in rows:
+        if document_name:
+            existing[doc_case_id].add(_event_file_key(document_name))
+        if file_path:
+            existing[doc_case_id].add(_event_file_key(os.path.basename(file_path)))
+    return dict(existing)
+
+
 def download_all_case_documents(page: Page, case_id: int, county: str, case_number: str,
-                                 skip_existing: bool = True):
+                                 skip_existing: bool = True, events: list = None,
+                                 existing_event_keys: set = None):
     """
     Download ALL documents for a case with detailed event association.
 
@@ -980,6 +1445,9 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
         county: County name (e.g., 'wake')
         case_number: Case number (e.g., '24SP000437-910')
         skip_existing: If True, skip documents already in database
+        events: Result of scan_document_events() for this page, if the caller already has it
+        existing_event_keys: This case's entry from load_existing_event_keys(), if the
+            caller prefetched it for a batch (queried here when None)
 
     Returns:
         list: List of dicts with downloaded document info:
@@ -994,77 +1462,45 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
     download_path = config.get_pdf_path(county, case_number)
     downloaded = []
 
-    # Get existing documents to avoid duplicates
-    existing_docs = set()
-    if skip_existing:
-        with get_session() as session:
-            docs = session.query(Document).filter_by(case_id=case_id).all()
-            for doc in docs:
-                # Use filename as identifier
-                if doc.document_name:
-                    existing_docs.add(doc.document_name)
-                if doc.file_path:
-                    existing_docs.add(Path(doc.file_path).name)
+    # Single-document downloads keep transferring while later events are clicked, up
+    # to MAX_IN_FLIGHT_DOWNLOADS at once; each is saved and validated in click order
+    in_flight = deque()
 
-    try:
-        # Find all events with their document button status
-        # Use JavaScript to get ALL event details with document availability
-        all_events_with_docs = page.evaluate(r'''
-            () => {
-                const results = [];
-
-                // Find all event containers (Angular ng-repeat)
-                const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-
-                eventDivs.forEach((eventDiv, idx) => {
-                    const text = eventDiv.textContent || '';
-
-                    // Check for document button/icon
-                    const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                    const docImg = eventDiv.querySelector('img[title*="document" i]');
-
-                    if (docBtn || docImg) {
-                        // Extract event date
-                        const dateMatch = text.match(/(\d{2}\/\d{2}\/\d{4})/);
-                        const eventDate = dateMatch ? dateMatch[1] : '';
-
-                        // Extract event type - find capitalized text
-                        let eventType = '';
-                        const lines = text.split('\n').map(l => l.trim()).filter(l => l);
-                        for (const line of lines) {
-                            if (line.match(/^[A-Z][a-zA-Z\s()/\-0-9]+$/) &&
-                                line.length > 5 && line.length < 80) {
-                                eventType = line;
-                                break;
-                            }
-                        }
+    def finish_oldest():
+        download, entry = in_flight.popleft()
+        file_path = entry['file_path']
+        filename = os.path.basename(file_path)
+        try:
+            save_download(download, Path(file_path))
+        except Exception as e:
+            logger.warning(f"      Single download failed: {e}")
+            downloaded.remove(entry)
+            files_on_disk.discard(filename)
+            return
+
+        # Validate document case number
+        if not validate_document_case_number(file_path, case_number):
+            logger.warning(f"      Misfiled document detected - deleting: {filename}")
+            downloaded.remove(entry)
+            try:
+                os.unlink(file_path)
+                files_on_disk.discard(filename)
+            except Exception as e:
+                logger.error(f"      Failed to delete misfiled document: {e}")
+            return
 
-                        // Categorize document type
-                        const textLower = text.toLowerCase();
-                        const isUpsetBid = textLower.includes('upset bid');
-                        const isSaleReport = textLower.includes('report of') && textLower.includes('sale');
-                        const isNoticeOfSale = textLower.includes('notice of sale');
-                        const isForeclosureFiling = textLower.includes('foreclosure') ||
-                                                     textLower.includes('deed of trust');
-                        const isOrder = textLower.includes('order') || textLower.includes('findings');
-
-                        results.push({
-                            index: idx,
-                            eventType: eventType,
-                            eventDate: eventDate,
-                            hasButton: !!docBtn,
-                            hasImage: !!docImg,
-                            isUpsetBid: isUpsetBid,
-                            isSale: isSaleReport || isNoticeOfSale,
-                            isForeclosureFiling: isForeclosureFiling,
-                            isOrder: isOrder
-                        });
-                    }
-                });
+        logger.info(f"      Saved: {filename}")
 
-                return results;
-            }
-        ''')
+    # Get existing documents to avoid duplicates (unless the caller prefetched them)
+    if not skip_existing:
+        existing_event_keys = set()
+    elif existing_event_keys is None:
+        existing_event_keys = load_existing_event_keys([case_id]).get(case_id, set())
+
+    try:
+        if events is None:
+            events = scan_document_events(page)
+        all_events_with_docs = events
 
         if not all_events_with_docs:
             logger.info(f"  No documents found on case page")
@@ -1072,19 +1508,27 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
 
         logger.info(f"  Found {len(all_events_with_docs)} event(s) with documents")
 
+        # Query the event rows once; the handle is released when the page navigates away
+        event_rows = page.evaluate_handle(_EVENT_ROWS_JS)
+
+        # List the case directory once and track new files in the set, so picking
+        # a free filename is a set lookup instead of a stat() per candidate
+        files_on_disk = set(os.listdir(download_path)) if download_path.exists() else set()
+
         for event_info in all_events_with_docs:
             event_index = event_info['index']
             event_type = event_info.get('eventType', 'Unknown')
             event_date = event_info.get('eventDate', '')
 
             # Generate filename to check for duplicates
-            clean_type = re.sub(r'[^\w\s-]', '', event_type)[:40]
+            clean_type = _strip_unsafe_filename_chars(event_type)[:40]
             clean_date = event_date.replace('/', '-') if event_date else 'unknown'
-            expected_filename = f"{clean_date}_{clean_type}.pdf"
+            event_key = f"{clean_date}_{clean_type}"
+            expected_filename = f"{event_key}.pdf"
 
-            # Skip if we already have this document
-            if skip_existing and expected_filename in existing_docs:
-                logger.debug(f"    Skipping existing: {expected_filename}")
+            # Skip if we already have a document for this event
+            if skip_existing and event_key in existing_event_keys:
+                logger.debug("    Skipping existing: %s", expected_filename)
                 downloaded.append({
                     'file_path': str(download_path / expected_filename),
                     'document_id': None,
@@ -1097,47 +1541,29 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
                 continue
 
             logger.info(f"    Downloading: {event_date} - {event_type}")
+            if len(in_flight) >= MAX_IN_FLIGHT_DOWNLOADS:
+                finish_oldest()
+            acquire_download_slot(page)
 
             try:
                 # Click the document button/image for this specific event
                 # This may trigger either:
                 # 1. A direct download (single document)
                 # 2. A "Document Selector" popup (multiple documents)
-                page.evaluate(f'''
-                    () => {{
-                        const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                        const eventDiv = eventDivs[{event_index}];
-                        if (eventDiv) {{
-                            // Try button first, then image
-                            const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                            const docImg = eventDiv.querySelector('img[title*="document" i]');
-                            if (docBtn) docBtn.click();
-                            else if (docImg) docImg.click();
-                        }}
-                    }}
-                ''')
-
-                # Wait a moment for either download or popup
-                time.sleep(0.5)
-
-                # Check for multi-document popup first
-                popup_files = handle_document_selector_popup(
+                first_download = click_event_document(page, event_rows, event_index)
+
+                # No direct download means the click may have opened the popup instead
+                popup_files = [] if first_download else handle_document_selector_popup(
                     page,
                     download_path,
                     base_filename=f"{clean_date}_{clean_type}"
                 )
+                files_on_disk.update(os.path.basename(file_path) for file_path in popup_files)
 
                 if popup_files:
                     # Multiple documents were downloaded from the popup
-                    doc_date = None
-                    if event_date:
-                        try:
-                            doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-                        except ValueError:
-                            pass
-
                     for file_path in popup_files:
-                        filename = Path(file_path).name
+                        filename = os.path.basename(file_path)
 
                         # Validate document case number
                         is_valid = validate_document_case_number(str(file_path), case_number)
@@ -1145,29 +1571,14 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
                             logger.warning(f"      Misfiled document detected - deleting: {filename}")
                             try:
                                 os.unlink(file_path)
+                                files_on_disk.discard(filename)
                             except Exception as e:
                                 logger.error(f"      Failed to delete misfiled document: {e}")
                             continue
 
-                        # Create database record for each
-                        with get_session() as session:
-                            # Find matching event
-                            event = find_matching_event(session, case_id, event_date, event_type)
-
-                            document = Document(
-                                case_id=case_id,
-                                event_id=event.id if event else None,
-                                document_name=filename,
-                                file_path=str(file_path),
-                                document_date=doc_date
-                            )
-                            session.add(document)
-                            session.commit()
-                            doc_id = document.id
-
                         downloaded.append({
                             'file_path': str(file_path),
-                            'document_id': doc_id,
+                            'document_id': None,  # assigned when the records are saved below
                             'event_type': event_type,
                             'event_date': event_date,
                             'is_new': True,
@@ -1175,83 +1586,39 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
                             'is_sale': event_info.get('isSale', False)
                         })
                 else:
-                    # Single document - wait for the download that should be in progress
+                    # Single document - use the download the first click started, if any
                     try:
-                        # Re-click and capture download since the first click may have started it
-                        with page.expect_download(timeout=30000) as download_info:
-                            # Click again (first click may have just opened nothing or started download)
-                            page.evaluate(f'''
-                                () => {{
-                                    const eventDivs = document.querySelectorAll('[ng-repeat*="event"]');
-                                    const eventDiv = eventDivs[{event_index}];
-                                    if (eventDiv) {{
-                                        const docBtn = eventDiv.querySelector('button[aria-label*="document" i]');
-                                        const docImg = eventDiv.querySelector('img[title*="document" i]');
-                                        if (docBtn) docBtn.click();
-                                        else if (docImg) docImg.click();
-                                    }}
-                                }}
-                            ''')
-
-                        download = download_info.value
+                        download = first_download
+                        if download is None:
+                            # Nothing started within the settle window; click again and wait
+                            with page.expect_download(timeout=30000) as download_info:
+                                event_rows.evaluate(_CLICK_EVENT_DOCUMENT_JS, event_index)
+                            download = download_info.value
 
                         # Generate meaningful filename
                         filename = expected_filename
-                        file_path = download_path / filename
 
                         # Handle duplicate filenames
                         counter = 1
-                        while file_path.exists():
+                        while filename in files_on_disk:
                             filename = f"{clean_date}_{clean_type}_{counter}.pdf"
-                            file_path = download_path / filename
                             counter += 1
 
-                        download.save_as(str(file_path))
-
-                        # Validate document case number
-                        is_valid = validate_document_case_number(str(file_path), case_number)
-                        if not is_valid:
-                            logger.warning(f"      Misfiled document detected - deleting: {filename}")
-                            try:
-                                os.unlink(str(file_path))
-                            except Exception as e:
-                                logger.error(f"      Failed to delete misfiled document: {e}")
-                            continue
-
-                        # Create database record
-                        doc_date = None
-                        if event_date:
-                            try:
-                                doc_date = datetime.strptime(event_date, '%m/%d/%Y').date()
-                            except ValueError:
-                                pass
-
-                        with get_session() as session:
-                            # Find matching event
-                            event = find_matching_event(session, case_id, event_date, event_type)
-
-                            document = Document(
-                                case_id=case_id,
-                                event_id=event.id if event else None,
-                                document_name=filename,
-                                file_path=str(file_path),
-                                document_date=doc_date
-                            )
-                            session.add(document)
-                            session.commit()
-                            doc_id = document.id
-
-                        downloaded.append({
-                            'file_path': str(file_path),
-                            'document_id': doc_id,
+                        # Reserve the name and the entry's place in the results now; the
+                        # file is saved and validated by finish_oldest() while later
+                        # events are clicked
+                        files_on_disk.add(filename)
+                        entry = {
+                            'file_path': str(download_path / filename),
+                            'document_id': None,  # assigned when the records are saved below
                             'event_type': event_type,
                             'event_date': event_date,
                             'is_new': True,
                             'is_upset_bid': event_info.get('isUpsetBid', False),
                             'is_sale': event_info.get('isSale', False)
-                        })
-
-                        logger.info(f"      Saved: {filename}")
+                        }
+                        downloaded.append(entry)
+                        in_flight.append((download, entry))
 
                     except Exception as e:
                         logger.warning(f"      Single download failed: {e}")
@@ -1259,8 +1626,8 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
             except Exception as e:
                 logger.warning(f"      Download failed: {e}")
 
-            # Small delay between downloads
-            time.sleep(0.5)
+        while in_flight:
+            finish_oldest()
 
         new_count = sum(1 for d in downloaded if d.get('is_new'))
         logger.info(f"  Downloaded {new_count} new documents, {len(downloaded) - new_count} existing")
@@ -1268,4 +1635,11 @@ def download_all_case_documents(page: Page, case_id: int, county: str, case_numb
     except Exception as e:
         logger.error(f"Error downloading all case documents: {e}")
 
+    # Finish downloads that were still transferring when an error cut the loop short
+    while in_flight:
+        finish_oldest()
+
+    # One transaction for every file downloaded above, including any before an error
+    record_new_documents(case_id, [doc for doc in downloaded if doc.get('is_new')])
+
     return downloaded
@@ -1,18 +1,83 @@
 """Portal interaction functions for NC Courts Portal."""
 
+import re
 import time
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from scraper.portal_selectors import *
 from scraper.captcha_solver import solve_recaptcha
 from common.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Kendo pager info text: "1 - 10 of 75 items"
+_PAGER_TOTAL_RE = re.compile(r'of\s+(\d+)\s+items?', re.IGNORECASE)
+
+# Page scripts take their values as evaluate() arguments rather than f-string
+# interpolation, so the source is the same on every call and a quote in a
+# county name or CAPTCHA token can't break (or inject into) the script.
+
+# Check the location checkbox whose label contains the given county name
+_CHECK_COUNTY_JS = '''
+    (countyName) => {
+        const checkboxes = document.querySelectorAll('input[type="checkbox"]');
+        for (const cb of checkboxes) {
+            const label = cb.closest('label') || cb.parentElement;
+            if (label && label.textContent.includes(countyName)) {
+                if (!cb.checked) {
+                    cb.click();
+                }
+                break;
+            }
+        }
+    }
+'''
+
+# Uncheck the "All Locations" checkbox so individual counties can be selected
+_UNCHECK_ALL_LOCATIONS_JS = '''
+    () => {
+        const checkboxes = document.querySelectorAll('input[type="checkbox"]');
+        for (const cb of checkboxes) {
+            const label = cb.closest('label') || cb.parentElement;
+            if (label && label.textContent.includes('All Locations')) {
+                if (cb.checked) {
+                    cb.click();
+                }
+                break;
+            }
+        }
+    }
+'''
+
+# Set a Kendo ComboBox (by input name) to a value and fire its change event
+_SET_COMBOBOX_JS = '''
+    ([inputName, value]) => {
+        const widget = $(`input[name="${inputName}"]`).data('kendoComboBox');
+        if (widget) {
+            widget.value(value);
+            widget.trigger("change");
+        }
+    }
+'''
+
+# Put a solved reCAPTCHA token into the hidden response field
+_SET_CAPTCHA_TOKEN_JS = '''
+    ([selector, token]) => {
+        document.querySelector(selector).value = token;
+    }
+'''
+
 
 def click_advanced_filter(page):
     """Click the Advanced Filter Options link."""
     logger.info("Clicking Advanced Filter Options...")
     page.click(ADVANCED_FILTER_LINK)
-    time.sleep(1)
+    # Continue as soon as the location filter is shown rather than after a fixed delay
+    try:
+        page.get_by_text('All Locations').first.wait_for(state='visible', timeout=5000)
+    except PlaywrightTimeoutError:
+        logger.debug("  'All Locations' filter not visible yet, continuing")
     logger.info("  ✓ Advanced filters opened")
 
 
@@ -56,35 +121,13 @@ def fill_search_form(page, county_names, start_date, end_date, search_text, part
     logger.info(f"  Selecting {len(county_names)} counties: {', '.join(county_names)}")
     try:
         # First, uncheck "All Locations" checkbox
-        page.evaluate('''
-            const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-            for (const cb of checkboxes) {
-                const label = cb.closest('label') || cb.parentElement;
-                if (label && label.textContent.includes('All Locations')) {
-                    if (cb.checked) {
-                        cb.click();
-                    }
-                    break;
-                }
-            }
-        ''')
+        page.evaluate(_UNCHECK_ALL_LOCATIONS_JS)
         time.sleep(0.3)
         logger.info("    ✓ Unchecked 'All Locations'")
 
         # Now check each county checkbox
         for county_name in county_names:
-            page.evaluate(f'''
-                const checkboxes = document.querySelectorAll('input[type="checkbox"]');
-                for (const cb of checkboxes) {{
-                    const label = cb.closest('label') || cb.parentElement;
-                    if (label && label.textContent.includes('{county_name}')) {{
-                        if (!cb.checked) {{
-                            cb.click();
-                        }}
-                        break;
-                    }}
-                }}
-            ''')
+            page.evaluate(_CHECK_COUNTY_JS, county_name)
             time.sleep(0.2)
         logger.info(f"    ✓ Selected {len(county_names)} counties")
     except Exception as e:
@@ -93,13 +136,7 @@ def fill_search_form(page, county_names, start_date, end_date, search_text, part
     # 4. Select Case Type using Kendo ComboBox (NOT DropDownList!)
     try:
         logger.info(f"  Selecting type: {SPECIAL_PROCEEDINGS}")
-        page.evaluate(f'''
-            const widget = $('input[name="caseCriteria.CaseType"]').data('kendoComboBox');
-            if (widget) {{
-                widget.value("{SPECIAL_PROCEEDINGS}");
-                widget.trigger("change");
-            }}
-        ''')
+        page.evaluate(_SET_COMBOBOX_JS, ['caseCriteria.CaseType', SPECIAL_PROCEEDINGS])
         logger.info(f"    ✓ Selected type: {SPECIAL_PROCEEDINGS}")
     except Exception as e:
         logger.warning(f"  Case type selection failed: {e}")
@@ -108,13 +145,8 @@ def fill_search_form(page, county_names, start_date, end_date, search_text, part
     # Status values are codes: "PEND" for Pending
     try:
         logger.info(f"  Selecting status: {PENDING_STATUS}")
-        page.evaluate('''
-            const widget = $('input[name="caseCriteria.CaseStatus"]').data('kendoComboBox');
-            if (widget) {
-                widget.value("PEND");  // "PEND" is the value for "Pending"
-                widget.trigger("change");
-            }
-        ''')
+        # "PEND" is the value for "Pending"
+        page.evaluate(_SET_COMBOBOX_JS, ['caseCriteria.CaseStatus', 'PEND'])
         logger.info(f"    ✓ Selected status: {PENDING_STATUS}")
     except Exception as e:
         logger.warning(f"  Status selection failed: {e}")
@@ -154,9 +186,7 @@ def solve_and_submit_captcha(page):
             return False
 
         # Inject token into the hidden response field
-        page.evaluate(f'''
-            document.querySelector("{RECAPTCHA_RESPONSE_FIELD}").value = "{token}";
-        ''')
+        page.evaluate(_SET_CAPTCHA_TOKEN_JS, [RECAPTCHA_RESPONSE_FIELD, token])
 
         logger.info("  ✓ CAPTCHA token injected")
 
@@ -263,8 +293,7 @@ def extract_total_count_from_page(page):
             logger.debug(f"Kendo pager info: {text}")
 
             # Parse "1 - 10 of 75 items"
-            import re
-            match = re.search(r'of\s+(\d+)\s+items?', text, re.IGNORECASE)
+            match = _PAGER_TOTAL_RE.search(text)
             if match:
                 total = int(match.group(1))
                 logger.info(f"Total cases found: {total}")
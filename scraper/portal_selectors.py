@@ -3,6 +3,9 @@
 # Portal URL
 PORTAL_URL = 'https://portal-nc.tylertech.cloud/Portal/Home/Dashboard/29'
 
+# Real Chrome user-agent to avoid bot detection
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
 # reCAPTCHA
 RECAPTCHA_SITE_KEY = '6LfqmHkUAAAAAAKhHRHuxUy6LOMRZSG2LvSwWPO9'
 RECAPTCHA_ELEMENT = '.g-recaptcha'
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Compile scraper/page_parser.py to a C extension with mypyc.
+
+The compiled module is written next to page_parser.py (scraper/page_parser.*.so)
+and Python imports it in preference to the .py, so parse_case_detail and friends
+run compiled with no other changes. Rerun after editing page_parser.py - a stale
+.so keeps the old code - or pass --clean to remove it and go back to pure Python.
+
+Requires mypy (which ships mypyc) and a C compiler:
+    venv/bin/pip install mypy
+    venv/bin/python scripts/build_compiled_parser.py
+    venv/bin/python scripts/build_compiled_parser.py --clean
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# Relative to REPO_ROOT so mypyc names the module scraper.page_parser
+MODULES = ['scraper/page_parser.py']
+
+# bs4 ships no type stubs; modules page_parser imports are used, not compiled or checked
+MYPY_OPTIONS = ['--ignore-missing-imports', '--follow-imports=silent']
+
+
+def compiled_files():
+    """Extension modules a previous build left next to the sources."""
+    return [
+        path
+        for module in MODULES
+        # The module itself plus mypyc's shared runtime library for it
+        for pattern in ('{}.*.so', '{}__mypyc.*.so')
+        for path in (REPO_ROOT / module).parent.glob(pattern.format(Path(module).stem))
+    ]
+
+
+def clean():
+    """Remove compiled modules so the pure-Python sources are imported again."""
+    for path in compiled_files():
+        path.unlink()
+        print(f"Removed {path.relative_to(REPO_ROOT)}")
+
+
+def build():
+    """Compile MODULES in place; mypyc's C sources and build outputs go to a temp dir."""
+    from mypyc.build import mypycify
+    from setuptools import setup
+
+    os.chdir(REPO_ROOT)
+    with tempfile.TemporaryDirectory() as build_dir:
+        setup(
+            name='nc-foreclosures-compiled',
+            ext_modules=mypycify(MYPY_OPTIONS + MODULES, target_dir=build_dir),
+            script_args=['build_ext', '--inplace', '--build-temp', build_dir, '--build-lib', build_dir],
+        )
+
+    for path in compiled_files():
+        print(f"Built {path.relative_to(REPO_ROOT)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile the case page parser with mypyc')
+    parser.add_argument('--clean', action='store_true', help='Remove the compiled module instead')
+    args = parser.parse_args()
+
+    if args.clean:
+        clean()
+    else:
+        build()
+
+
+if __name__ == '__main__':
+    main()
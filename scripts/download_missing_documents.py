@@ -25,6 +25,7 @@ from sqlalchemy import text
 from database.connection import get_session
 from database.models import Case, Document
 from scraper.pdf_downloader import download_case_documents
+from common.config import config
 from common.logger import setup_logger
 
 logger = setup_logger('download_missing')
@@ -96,7 +97,7 @@ def main():
     # Launch browser
     with sync_playwright() as p:
         logger.info("Launching browser (headless=False for Angular support)...")
-        browser = p.chromium.launch(headless=False)
+        browser = p.chromium.launch(headless=False, downloads_path=config.get_browser_downloads_path())
         context = browser.new_context()
 
         # Statistics
@@ -127,9 +128,9 @@ def main():
                 # Small delay for Angular to render document buttons
                 time.sleep(1.5)
 
-                # Download documents
+                # Download documents, unless another run saved some since the case list was built
                 county = county_name.lower() if county_name else 'unknown'
-                count = download_case_documents(page, case_id, county, case_number)
+                count = download_case_documents(page, case_id, county, case_number, skip_existing=True)
 
                 if count > 0:
                     print(f"  ✓ Downloaded {count} document(s)")
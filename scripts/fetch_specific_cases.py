@@ -22,6 +22,7 @@ from scraper.captcha_solver import solve_recaptcha
 from scraper.page_parser import is_foreclosure_case, parse_case_detail
 from scraper.portal_selectors import PORTAL_URL, RECAPTCHA_SITE_KEY
 from scraper.pdf_downloader import download_case_documents
+from common.config import config
 from common.county_codes import get_county_code, get_county_name
 from common.logger import setup_logger
 
@@ -40,7 +41,7 @@ def fetch_cases(case_numbers: list):
     }
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
+        browser = p.chromium.launch(headless=False, downloads_path=config.get_browser_downloads_path())
         context = browser.new_context(
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         )
@@ -61,10 +62,11 @@ def fetch_cases(case_numbers: list):
                 # Solve CAPTCHA
                 logger.info("  Solving CAPTCHA...")
                 token = solve_recaptcha(PORTAL_URL, RECAPTCHA_SITE_KEY)
-                page.evaluate(f'''
-                    document.getElementById('g-recaptcha-response').innerHTML = '{token}';
-                    document.getElementById('g-recaptcha-response').value = '{token}';
-                ''')
+                page.evaluate('''(token) => {
+                    const field = document.getElementById('g-recaptcha-response');
+                    field.innerHTML = token;
+                    field.value = token;
+                }''', token)
                 logger.info("  CAPTCHA token injected")
 
                 # Submit search - use correct selector
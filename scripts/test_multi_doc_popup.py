@@ -40,7 +40,7 @@ def test_multi_document_popup():
     print(f"URL: {case_url}")
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)  # Visible for debugging
+        browser = p.chromium.launch(headless=False, downloads_path=config.get_browser_downloads_path())  # Visible for debugging
         context = browser.new_context(user_agent=USER_AGENT)
         page = context.new_page()
 
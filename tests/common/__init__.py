@@ -0,0 +1 @@
+"""Tests for common module."""
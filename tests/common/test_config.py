@@ -0,0 +1,22 @@
+"""Tests for configuration helpers."""
+
+import shutil
+
+from common.config import Config
+
+
+class TestGetPdfPath:
+    """Tests for Config.get_pdf_path."""
+
+    def test_builds_lowercased_county_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, 'PDF_STORAGE_PATH', str(tmp_path))
+        path = Config.get_pdf_path('WAKE', '24SP000437-910')
+        assert path == tmp_path / 'wake' / '24SP000437-910'
+        assert path.is_dir()
+
+    def test_recreates_removed_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, 'PDF_STORAGE_PATH', str(tmp_path))
+        path = Config.get_pdf_path('wake', '24SP000437-910')
+        shutil.rmtree(path)
+        assert Config.get_pdf_path('wake', '24SP000437-910') == path
+        assert path.is_dir()
@@ -0,0 +1,82 @@
+"""Tests for date chunking utilities."""
+
+from datetime import date
+
+import pytest
+
+from common.date_utils import bisect_date_range, generate_date_chunks, parse_portal_date
+
+
+class TestGenerateDateChunks:
+    """Tests for generate_date_chunks function."""
+
+    def test_monthly_leap_year(self):
+        assert generate_date_chunks(date(2024, 1, 15), date(2024, 3, 10), 'monthly') == [
+            (date(2024, 1, 15), date(2024, 1, 31)),
+            (date(2024, 2, 1), date(2024, 2, 29)),
+            (date(2024, 3, 1), date(2024, 3, 10)),
+        ]
+
+    def test_quarterly(self):
+        assert generate_date_chunks(date(2023, 2, 1), date(2023, 12, 31), 'quarterly') == [
+            (date(2023, 2, 1), date(2023, 3, 31)),
+            (date(2023, 4, 1), date(2023, 6, 30)),
+            (date(2023, 7, 1), date(2023, 9, 30)),
+            (date(2023, 10, 1), date(2023, 12, 31)),
+        ]
+
+    def test_weekly_clamped_to_end(self):
+        assert generate_date_chunks(date(2024, 2, 1), date(2024, 2, 10), 'weekly') == [
+            (date(2024, 2, 1), date(2024, 2, 7)),
+            (date(2024, 2, 8), date(2024, 2, 10)),
+        ]
+
+    def test_monthly_full_year(self):
+        chunks = generate_date_chunks(date(2024, 1, 1), date(2024, 12, 31), 'monthly')
+        assert len(chunks) == 12
+        assert chunks[-1] == (date(2024, 12, 1), date(2024, 12, 31))
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            generate_date_chunks(date(2024, 1, 1), date(2024, 1, 31), 'hourly')
+
+
+class TestBisectDateRange:
+    """Tests for bisect_date_range function."""
+
+    def test_halves_cover_range(self):
+        assert bisect_date_range(date(2024, 1, 1), date(2024, 1, 31)) == (
+            (date(2024, 1, 1), date(2024, 1, 16)),
+            (date(2024, 1, 17), date(2024, 1, 31)),
+        )
+
+    def test_two_day_range(self):
+        assert bisect_date_range(date(2024, 2, 28), date(2024, 2, 29)) == (
+            (date(2024, 2, 28), date(2024, 2, 28)),
+            (date(2024, 2, 29), date(2024, 2, 29)),
+        )
+
+    def test_single_day_raises(self):
+        with pytest.raises(ValueError):
+            bisect_date_range(date(2024, 1, 1), date(2024, 1, 1))
+
+
+class TestParsePortalDate:
+    """Tests for parse_portal_date function."""
+
+    @pytest.mark.parametrize('value, expected', [
+        ('01/02/2024', date(2024, 1, 2)),
+        ('1/2/2024', date(2024, 1, 2)),
+        ('12/31/2023', date(2023, 12, 31)),
+        ('02/29/2024', date(2024, 2, 29)),
+    ])
+    def test_valid_dates(self, value, expected):
+        assert parse_portal_date(value) == expected
+
+    @pytest.mark.parametrize('value', [
+        '', '02/30/2024', '13/01/2024', '2024-01-02', '01/02/24',
+        '01/02/2024 ', ' 1/02/2024', '+1/02/2024', '001/02/2024', '01/02/2024/1',
+    ])
+    def test_invalid_dates_raise(self, value):
+        with pytest.raises(ValueError):
+            parse_portal_date(value)
@@ -0,0 +1,92 @@
+"""Tests for logging setup."""
+
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from common import logger as logger_module
+from common.logger import setup_logger, start_queue_logging, stop_queue_logging
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def run_script(tmp_path, source):
+    """Run source as a script file with the repo importable; return its stdout."""
+    script = tmp_path / 'script.py'
+    script.write_text(textwrap.dedent(source))
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), LOG_LEVEL='INFO')
+    completed = subprocess.run([sys.executable, str(script)], capture_output=True, text=True,
+                               env=env, timeout=60, check=True)
+    return completed.stdout
+
+
+class TestQueueLogging:
+    """Tests for start_queue_logging / stop_queue_logging."""
+
+    def test_import_starts_no_listener(self, tmp_path):
+        out = run_script(tmp_path, """
+            import threading
+            from common.logger import setup_logger
+            setup_logger('plain').info('direct')
+            print(threading.active_count())
+        """)
+        assert 'plain - INFO - direct' in out
+        assert out.strip().endswith('1')
+
+    def test_stop_flushes_and_restores_direct_handlers(self, capsys):
+        log = setup_logger('tests.queue_logging', level='INFO')
+        start_queue_logging()
+        try:
+            assert log.handlers == [logger_module._queue_handler]
+            for i in range(50):
+                log.info('queued %d', i)
+        finally:
+            stop_queue_logging()
+        assert logger_module._listener is None
+        assert log.handlers == [logger_module._console_handlers[log]]
+        out = capsys.readouterr().out
+        assert all(f'queued {i}\n' in out for i in range(50))
+
+    def test_loggers_created_while_active_use_queue(self):
+        start_queue_logging()
+        try:
+            log = setup_logger('tests.queue_logging.late', level='INFO')
+            assert log.handlers == [logger_module._queue_handler]
+        finally:
+            stop_queue_logging()
+        assert isinstance(log.handlers[0], logging.StreamHandler)
+
+    def test_flushes_at_exit(self, tmp_path):
+        out = run_script(tmp_path, """
+            from concurrent.futures import ThreadPoolExecutor
+            from common.logger import setup_logger, start_queue_logging
+            start_queue_logging()
+            log = setup_logger('worker')
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(lambda i: log.info('line %d', i), range(200)))
+        """)
+        lines = [line for line in out.splitlines() if 'worker - INFO - line' in line]
+        assert len(lines) == 200
+
+    def test_forked_and_spawned_children_log(self, tmp_path):
+        out = run_script(tmp_path, """
+            import multiprocessing
+            from common.logger import setup_logger, start_queue_logging
+
+            def child(tag):
+                setup_logger('child').info('from %s child', tag)
+
+            if __name__ == '__main__':
+                start_queue_logging()
+                setup_logger('parent').info('from parent')
+                for method in ('fork', 'spawn'):
+                    process = multiprocessing.get_context(method).Process(target=child, args=(method,))
+                    process.start()
+                    process.join()
+        """)
+        assert 'parent - INFO - from parent' in out
+        assert 'child - INFO - from fork child' in out
+        assert 'child - INFO - from spawn child' in out
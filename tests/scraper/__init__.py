@@ -0,0 +1 @@
+"""Tests for scraper module."""
@@ -0,0 +1,74 @@
+"""Tests for per-thread browser reuse."""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from scraper import browser_pool
+
+
+@pytest.fixture
+def fake_playwright(tmp_path):
+    """Patch sync_playwright so each launch returns a new connected mock browser."""
+    with mock.patch.object(browser_pool, 'sync_playwright') as mock_sync, \
+            mock.patch.object(browser_pool.config, 'get_browser_downloads_path', return_value=tmp_path):
+        playwright = mock_sync.return_value.start.return_value
+        playwright.chromium.launch.side_effect = lambda **kwargs: mock.MagicMock(
+            **{'is_connected.return_value': True}
+        )
+        yield playwright
+    browser_pool._local.__dict__.clear()
+
+
+class TestAcquireBrowser:
+    """Tests for acquire_browser function."""
+
+    def test_reuses_browser_on_same_thread(self, fake_playwright):
+        assert browser_pool.acquire_browser() is browser_pool.acquire_browser()
+        assert fake_playwright.chromium.launch.call_count == 1
+
+    def test_relaunches_disconnected_browser(self, fake_playwright):
+        first = browser_pool.acquire_browser()
+        first.is_connected.return_value = False
+        second = browser_pool.acquire_browser()
+        assert second is not first
+        assert fake_playwright.chromium.launch.call_count == 2
+
+
+class TestClosePoolBrowsers:
+    """Tests for close_pool_browsers function."""
+
+    def test_closes_one_browser_per_worker_thread(self, fake_playwright):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            browsers = list(executor.map(lambda _: browser_pool.acquire_browser(), range(12)))
+            browser_pool.close_pool_browsers(executor, 3)
+
+        unique = {id(b): b for b in browsers}.values()
+        assert 1 <= len(unique) <= 3
+        for browser in unique:
+            browser.close.assert_called_once()
+
+
+class TestAcquireContext:
+    """Tests for acquire_context function."""
+
+    def test_reuses_context_and_clears_cookies(self, fake_playwright):
+        first = browser_pool.acquire_context()
+        second = browser_pool.acquire_context()
+        assert second is first
+        first.clear_cookies.assert_called_once()
+
+    def test_new_context_after_browser_relaunch(self, fake_playwright):
+        first = browser_pool.acquire_context()
+        browser_pool.acquire_browser().is_connected.return_value = False
+        assert browser_pool.acquire_context() is not first
+
+    def test_recycles_context_after_max_uses(self, fake_playwright):
+        browser_pool.acquire_browser().new_context.side_effect = lambda **kwargs: mock.MagicMock()
+        with mock.patch.object(browser_pool, 'CONTEXT_MAX_USES', 2):
+            first = browser_pool.acquire_context()
+            assert browser_pool.acquire_context() is first
+            third = browser_pool.acquire_context()
+        assert third is not first
+        first.close.assert_called_once()
@@ -0,0 +1,55 @@
+"""Tests for the date range scraper's detail tab handling."""
+
+from unittest import mock
+
+import pytest
+
+pytest.importorskip('capsolver')
+
+from scraper.date_range_scrape import DateRangeScraper
+
+
+CASE = {'case_number': '24SP000437-910', 'case_url': 'https://example.test/Case/1', 'location': 'Wake'}
+
+
+@pytest.fixture
+def context():
+    """Browser context whose new_page returns a fresh open mock tab each call."""
+    context = mock.MagicMock()
+    context.new_page.side_effect = lambda: mock.MagicMock(**{'is_closed.return_value': False})
+    return context
+
+
+@pytest.fixture
+def scraper():
+    return DateRangeScraper('2024-01-01', '2024-01-02', counties=['wake'])
+
+
+class TestDetailPage:
+    """Tests for DateRangeScraper detail tab reuse."""
+
+    def test_reuses_tab_across_cases(self, scraper, context):
+        assert scraper._get_detail_page(context) is scraper._get_detail_page(context)
+        assert context.new_page.call_count == 1
+
+    def test_crashed_tab_is_replaced(self, scraper, context):
+        first = scraper._get_detail_page(context)
+        event, handler = first.on.call_args.args
+        assert event == 'crash'
+        handler(first)
+        first.close.assert_called_once()
+        assert scraper._get_detail_page(context) is not first
+
+    def test_failed_case_gets_fresh_tab_next(self, scraper, context):
+        first = scraper._get_detail_page(context)
+        first.goto.side_effect = Exception('Target crashed')
+        assert scraper._process_case_in_detail_tab(context, CASE) is False
+        first.close.assert_called_once()
+        assert scraper._get_detail_page(context) is not first
+        assert context.new_page.call_count == 2
+
+    def test_unloaded_case_gets_fresh_tab_next(self, scraper, context):
+        first = scraper._get_detail_page(context)
+        first.wait_for_selector.side_effect = TimeoutError('hung')
+        assert scraper._process_case_in_detail_tab(context, CASE) is False
+        assert scraper._get_detail_page(context) is not first
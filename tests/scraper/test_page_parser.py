@@ -0,0 +1,208 @@
+"""Tests for NC Courts Portal HTML parsing."""
+
+import json
+from dataclasses import asdict
+
+import pytest
+
+from scraper.page_parser import (
+    Event,
+    Hearing,
+    is_foreclosure_case,
+    parse_case_detail,
+    parse_case_detail_batch,
+    parse_search_results,
+    parse_search_page,
+    extract_total_count,
+)
+
+
+ROA_PAGE = """
+<html><body>
+<table class="roa-caseinfo-info-rows">
+<tr><td>Case&nbsp;Type:</td><td>Foreclosure (Special Proceeding)</td></tr>
+<tr><td>Case&nbsp;Status:</td><td>Pending</td></tr>
+</table>
+<div>FORECLOSURE (HOA) - Mark Dwayne Ellis</div>
+<div>Filed on: 03/14/2024</div>
+<table class="roa-table td-pad-5">
+<tr><td>Respondent</td><td>Mark&nbsp;Ellis</td><td></td></tr>
+<tr><td>Trustee</td><td>ACME Trustee Services, LLC</td><td></td></tr>
+<tr><td>Bailiff</td><td>Not A Party</td><td></td></tr>
+</table>
+<div ng-repeat="event in ctrl.events">
+<div>05/01/2024</div>
+<div>Report of Sale</div>
+<div><span>A document is available</span><button aria-label="View Document">Click here to view the document</button></div>
+<div>Index # 12</div>
+<div>Created: 05/02/2024 10:30 AM</div>
+<div>Filed By: John Smith</div>
+<div>Against: Jane Doe</div>
+</div>
+<div ng-repeat="event in ctrl.events">
+<div>05/10/2024</div>
+<div roa-data label="Upset Bid Filed">Upset Bid Filed</div>
+<div>Index # 13</div>
+</div>
+<div ng-repeat="hearing in ctrl.hearings">
+<div>06/01/2024</div>
+<div>Foreclosure Hearing (2:30 PM)</div>
+</div>
+</body></html>
+"""
+
+SEARCH_PAGE = """
+<html><body>
+<div id="CasesGrid"><table><tbody>
+<tr class="k-master-row"><td><a class="caseLink" data-url="/app/Case/1">24SP000437-910</a></td>
+<td>Foreclosure - Smith</td><td>Pending</td><td>Wake</td></tr>
+<tr class="k-master-row"><td><a class="caseLink" data-url="https://example.test/Case/2">24SP000438-910</a></td>
+<td>Special Proceeding - Doe</td><td>Closed</td><td>Wake</td></tr>
+</tbody></table></div>
+<div class="k-pager-info">1 - 10 of 75 items</div>
+</body></html>
+"""
+
+
+class TestParseCaseDetail:
+    """Tests for parse_case_detail function."""
+
+    def test_case_info(self):
+        result = parse_case_detail(ROA_PAGE)
+        assert result['case_type'] == 'Foreclosure (Special Proceeding)'
+        assert result['case_status'] == 'Pending'
+        assert result['style'] == 'FORECLOSURE (HOA) - Mark Dwayne Ellis'
+        assert result['file_date'] == '03/14/2024'
+
+    def test_parties_filtered_by_type(self):
+        parties = parse_case_detail(ROA_PAGE)['parties']
+        assert [p['party_type'] for p in parties] == ['Respondent', 'Trustee']
+        assert parties[0]['party_name'] == 'Mark Ellis'
+
+    def test_event_from_text(self):
+        event = parse_case_detail(ROA_PAGE)['events'][0]
+        assert event['event_date'] == '05/01/2024'
+        assert event['event_type'] == 'Report of Sale'
+        assert event['event_index'] == 12
+        assert event['filed_by'] == 'John Smith'
+        assert event['filed_against'] == 'Jane Doe'
+        assert event['hearing_date'] == '05/02/2024 10:30'
+        assert event['has_document'] is True
+
+    def test_event_type_from_label(self):
+        event = parse_case_detail(ROA_PAGE)['events'][1]
+        assert event['event_type'] == 'Upset Bid Filed'
+        assert event['event_index'] == 13
+        assert event['has_document'] is False
+
+    def test_hearings(self):
+        hearings = parse_case_detail(ROA_PAGE)['hearings']
+        assert hearings == [Hearing(
+            hearing_date='06/01/2024',
+            hearing_time='2:30 PM',
+            hearing_type='Foreclosure Hearing',
+        )]
+
+    def test_records_support_mapping_reads(self):
+        event = parse_case_detail(ROA_PAGE)['events'][0]
+        assert isinstance(event, Event)
+        assert event.get('event_type') == event['event_type'] == event.event_type
+        assert event.get('missing', 'default') == 'default'
+        assert asdict(event)['event_index'] == 12
+        with pytest.raises(KeyError):
+            event['missing']
+
+    def test_records_support_membership_and_dict(self):
+        result = parse_case_detail(ROA_PAGE)
+        event = result['events'][0]
+        assert 'event_date' in event
+        assert 'missing' not in event
+        assert 'get' not in event
+        assert dict(event) == asdict(event)
+        serialized = json.loads(json.dumps({
+            key: [dict(record) for record in result[key]] for key in ('events', 'parties', 'hearings')
+        }))
+        assert serialized['parties'][0] == {'party_type': 'Respondent', 'party_name': 'Mark Ellis'}
+
+    def test_text_fallback_when_no_events(self):
+        html = "<html><body><div>Notice: Upset Bid Filed on this matter</div></body></html>"
+        events = parse_case_detail(html)['events']
+        assert [e['event_type'] for e in events] == ['upset bid filed']
+
+
+class TestParseCaseDetailBatch:
+    """Tests for parse_case_detail_batch function."""
+
+    def test_sequential_matches_single(self):
+        assert parse_case_detail_batch([ROA_PAGE, ROA_PAGE]) == [parse_case_detail(ROA_PAGE)] * 2
+
+    def test_parallel_preserves_order(self):
+        empty = "<html><body></body></html>"
+        results = parse_case_detail_batch([ROA_PAGE, empty, ROA_PAGE], parallel=True, max_workers=2)
+        assert results == [parse_case_detail(ROA_PAGE), parse_case_detail(empty), parse_case_detail(ROA_PAGE)]
+
+
+class TestIsForeclosureCase:
+    """Tests for is_foreclosure_case function."""
+
+    def test_foreclosure_case_type(self):
+        assert is_foreclosure_case({'case_type': 'Foreclosure (Special Proceeding)', 'events': []})
+
+    def test_non_property_case_type_excluded(self):
+        case_data = {'case_type': 'Incompetency', 'events': [{'event_type': 'Upset Bid Filed'}]}
+        assert not is_foreclosure_case(case_data)
+
+    def test_non_property_event_excluded(self):
+        case_data = {
+            'case_type': 'Foreclosure',
+            'events': [{'event_type': 'Adoption Petition'}],
+        }
+        assert not is_foreclosure_case(case_data)
+
+    def test_upset_bid_event(self):
+        case_data = {'case_type': 'Special Proceeding', 'events': [{'event_type': 'Report of Sale'}]}
+        assert is_foreclosure_case(case_data)
+
+    def test_sale_document_title(self):
+        case_data = {
+            'case_type': 'Special Proceeding',
+            'events': [{'event_type': 'Petition', 'document_title': 'PETITION FOR THE SALE OF REAL PROPERTY'}],
+        }
+        assert is_foreclosure_case(case_data)
+
+    def test_motor_vehicle_sale_event_not_matched(self):
+        case_data = {
+            'case_type': 'Special Proceeding',
+            'events': [{'event_type': None, 'event_description': 'Motor vehicle sale of real property'}],
+        }
+        assert not is_foreclosure_case(case_data)
+
+    def test_no_indicators(self):
+        case_data = {'case_type': 'Special Proceeding', 'events': [{'event_type': 'Motion'}]}
+        assert not is_foreclosure_case(case_data)
+
+
+class TestSearchResults:
+    """Tests for parse_search_results and extract_total_count."""
+
+    def test_parse_search_results(self):
+        result = parse_search_results(SEARCH_PAGE)
+        assert result['total_count'] == 2
+        first, second = result['cases']
+        assert first['case_number'] == '24SP000437-910'
+        assert first['case_url'] == 'https://portal-nc.tylertech.cloud/app/Case/1'
+        assert first['style'] == 'Foreclosure - Smith'
+        assert first['status'] == 'Pending'
+        assert first['location'] == 'Wake'
+        assert second['case_url'] == 'https://example.test/Case/2'
+
+    def test_extract_total_count(self):
+        assert extract_total_count(SEARCH_PAGE) == 75
+
+    def test_extract_total_count_missing(self):
+        assert extract_total_count("<html><body></body></html>") is None
+
+    def test_parse_search_page(self):
+        result, total = parse_search_page(SEARCH_PAGE)
+        assert result == parse_search_results(SEARCH_PAGE)
+        assert total == 75
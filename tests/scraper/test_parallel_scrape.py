@@ -0,0 +1,318 @@
+"""Tests for parallel chunked scraping."""
+
+import json
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+
+pytest.importorskip('capsolver')
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database.models import ScrapeLog
+from scraper import parallel_scrape
+
+
+@pytest.fixture
+def scrape_logs(monkeypatch):
+    """Back parallel_scrape's get_session with an in-memory scrape_logs table; returns an add() helper."""
+    engine = create_engine('sqlite://')
+    ScrapeLog.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_session():
+        session = Session()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    def add(start_date, end_date, completed_at, county_code='MULTI', status='success', cases_found=5):
+        with get_session() as session:
+            session.add(ScrapeLog(
+                scrape_type='daily', county_code=county_code, start_date=start_date, end_date=end_date,
+                status=status, cases_found=cases_found, completed_at=completed_at
+            ))
+
+    monkeypatch.setattr(parallel_scrape, 'get_session', get_session)
+    return add
+
+
+class TestFindCompletedScrape:
+    """Tests for find_completed_scrape function."""
+
+    def test_matches_closed_range(self, scrape_logs):
+        end = date.today() - timedelta(days=3)
+        scrape_logs(end - timedelta(days=6), end, datetime.now() - timedelta(days=1))
+        completed = parallel_scrape.find_completed_scrape(end - timedelta(days=6), end, None)
+        assert completed['cases_found'] == 5
+
+    def test_ignores_scrape_before_range_ended(self, scrape_logs):
+        end = date.today() - timedelta(days=1)
+        # Scraped on the range's last day, so cases filed later that day are missing
+        scrape_logs(end - timedelta(days=6), end, datetime.combine(end, datetime.min.time()) + timedelta(hours=12))
+        assert parallel_scrape.find_completed_scrape(end - timedelta(days=6), end, None) is None
+
+    def test_ignores_range_ending_today(self, scrape_logs):
+        today = date.today()
+        scrape_logs(today - timedelta(days=6), today, datetime.now())
+        assert parallel_scrape.find_completed_scrape(today - timedelta(days=6), today, None) is None
+
+    def test_ignores_stale_limited_and_failed_scrapes(self, scrape_logs):
+        start, end = date(2024, 1, 1), date(2024, 1, 7)
+        scrape_logs(start, end, datetime.now() - timedelta(days=30))
+        scrape_logs(start, end, datetime.now(), cases_found=None)
+        scrape_logs(start, end, datetime.now(), status='failed')
+        assert parallel_scrape.find_completed_scrape(start, end, None) is None
+
+    def test_matches_county_code(self, scrape_logs):
+        start, end = date(2024, 1, 1), date(2024, 1, 7)
+        scrape_logs(start, end, datetime.now(), county_code='910')
+        assert parallel_scrape.find_completed_scrape(start, end, 'wake') is not None
+        assert parallel_scrape.find_completed_scrape(start, end, 'durham') is None
+
+
+def write_lines(path, *lines):
+    path.write_text(''.join(line + '\n' for line in lines))
+    return path
+
+
+def failure_line(start, end, county=None, run_started='2024-03-01T08:00:00'):
+    return json.dumps({'chunk_num': 1, 'start_date': start, 'end_date': end, 'county': county,
+                       'error': 'boom', 'run_started': run_started})
+
+
+class TestLoadFailures:
+    """Tests for load_failures function."""
+
+    def test_missing_file(self, tmp_path):
+        assert parallel_scrape.load_failures(tmp_path / 'missing.jsonl') == []
+
+    def test_duplicates_kept_once_in_first_seen_order(self, tmp_path, scrape_logs):
+        path = write_lines(
+            tmp_path / 'failures.jsonl',
+            failure_line('2024-01-08', '2024-01-14', 'wake'),
+            failure_line('2024-01-01', '2024-01-07', 'wake'),
+            failure_line('2024-01-08', '2024-01-14', 'wake', run_started='2024-03-02T08:00:00'),
+            failure_line('2024-01-08', '2024-01-14', 'durham'),
+        )
+        assert parallel_scrape.load_failures(path) == [
+            (date(2024, 1, 8), date(2024, 1, 14), 'wake'),
+            (date(2024, 1, 1), date(2024, 1, 7), 'wake'),
+            (date(2024, 1, 8), date(2024, 1, 14), 'durham'),
+        ]
+
+    def test_malformed_lines_skipped(self, tmp_path, scrape_logs):
+        path = write_lines(
+            tmp_path / 'failures.jsonl',
+            failure_line('2024-01-01', '2024-01-07'),
+            '',
+            '{"chunk_num": 2, "start_date": "2024-01-08", "end_da',
+            json.dumps({'chunk_num': 3, 'end_date': '2024-01-21'}),
+            json.dumps({'start_date': '01/22/2024', 'end_date': '2024-01-28'}),
+            '[1, 2]',
+            failure_line('2024-01-29', '2024-02-04'),
+        )
+        assert parallel_scrape.load_failures(path) == [
+            (date(2024, 1, 1), date(2024, 1, 7), None),
+            (date(2024, 1, 29), date(2024, 2, 4), None),
+        ]
+
+    def test_chunks_scraped_after_failing_are_dropped(self, tmp_path, scrape_logs):
+        # Succeeded after its latest failure: dropped
+        scrape_logs(date(2024, 1, 1), date(2024, 1, 7), datetime(2024, 3, 2, 9), county_code='910')
+        # Succeeded only before failing again: kept
+        scrape_logs(date(2024, 1, 8), date(2024, 1, 14), datetime(2024, 3, 1, 7), county_code='910')
+        path = write_lines(
+            tmp_path / 'failures.jsonl',
+            failure_line('2024-01-01', '2024-01-07', 'wake'),
+            failure_line('2024-01-01', '2024-01-07', 'wake', run_started='2024-03-02T08:00:00'),
+            failure_line('2024-01-08', '2024-01-14', 'wake'),
+        )
+        assert parallel_scrape.load_failures(path) == [(date(2024, 1, 8), date(2024, 1, 14), 'wake')]
+
+    def test_failure_without_run_started_matches_recent_success(self, tmp_path, scrape_logs):
+        scrape_logs(date(2024, 1, 1), date(2024, 1, 7), datetime.now())
+        path = write_lines(tmp_path / 'failures.jsonl', failure_line('2024-01-01', '2024-01-07', run_started=None))
+        assert parallel_scrape.load_failures(path) == []
+
+
+class ChunkScript(dict):
+    """Scripted chunk outcomes plus the chunks run_chunk_scrape was called with."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+
+@pytest.fixture
+def fake_chunks(tmp_path, monkeypatch):
+    """
+    Run run_parallel_scrape without browsers: chunk outcomes come from a script.
+
+    Returns the script dict, mapping (start, end, county) to a list of results
+    handed out one per call ('ok', 'fail' or 'truncated'); unscripted chunks
+    succeed. Every call is recorded in script.calls.
+    """
+    script = ChunkScript()
+
+    def run_chunk_scrape(chunk_num, total_chunks, chunk_start, chunk_end, county, limit, dry_run, use_cache=True):
+        key = (chunk_start, chunk_end, county)
+        script.calls.append(key)
+        outcomes = script.get(key)
+        outcome = outcomes.pop(0) if outcomes else 'ok'
+        return parallel_scrape._chunk_result(
+            chunk_num, chunk_start, chunk_end, county,
+            success=outcome == 'ok', cases=1 if outcome == 'ok' else 0,
+            error=None if outcome == 'ok' else outcome, too_many_results=outcome == 'truncated'
+        )
+
+    monkeypatch.setattr(parallel_scrape, 'run_chunk_scrape', run_chunk_scrape)
+    monkeypatch.setattr(parallel_scrape, 'FAILURES_FILE', tmp_path / 'failures.jsonl')
+    monkeypatch.setattr(parallel_scrape, 'warm_portal_dns', lambda: None)
+    monkeypatch.setattr(parallel_scrape, 'close_pool_browsers', lambda executor, workers: None)
+    return script
+
+
+def run_scrape(start, end, chunk_size='weekly', **kwargs):
+    kwargs.setdefault('workers', 1)
+    return parallel_scrape.run_parallel_scrape(start, end, chunk_size, **kwargs)
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+
+
+class TestCheckpoint:
+    """Tests for --checkpoint save and resume."""
+
+    JAN = (date(2024, 1, 1), date(2024, 1, 21))
+
+    def test_successes_written(self, tmp_path, fake_chunks):
+        checkpoint = tmp_path / 'checkpoint.jsonl'
+        fake_chunks[(date(2024, 1, 8), date(2024, 1, 14), None)] = ['fail', 'fail']
+        run_scrape(*self.JAN, checkpoint=checkpoint)
+        assert read_jsonl(checkpoint) == [
+            {'start_date': '2024-01-01', 'end_date': '2024-01-07', 'county': None},
+            {'start_date': '2024-01-15', 'end_date': '2024-01-21', 'county': None},
+        ]
+
+    def test_resume_skips_checkpointed_chunks(self, tmp_path, fake_chunks):
+        checkpoint = tmp_path / 'checkpoint.jsonl'
+        fake_chunks[(date(2024, 1, 8), date(2024, 1, 14), None)] = ['fail', 'fail']
+        run_scrape(*self.JAN, checkpoint=checkpoint)
+        fake_chunks.calls.clear()
+
+        results = run_scrape(*self.JAN, checkpoint=checkpoint)
+        assert fake_chunks.calls == [(date(2024, 1, 8), date(2024, 1, 14), None)]
+        assert results['chunks_checkpointed'] == 2
+        assert (results['chunks_processed'], results['chunks_succeeded']) == (3, 3)
+        assert len(read_jsonl(checkpoint)) == 3
+
+    def test_truncated_checkpoint(self, tmp_path, fake_chunks):
+        checkpoint = tmp_path / 'checkpoint.jsonl'
+        checkpoint.write_text(
+            '{"start_date": "2024-01-01", "end_date": "2024-01-07", "county": null}\n'
+            '{"start_date": "2024-01-08", "end_da'
+        )
+        results = run_scrape(*self.JAN, checkpoint=checkpoint)
+        assert fake_chunks.calls == [
+            (date(2024, 1, 8), date(2024, 1, 14), None),
+            (date(2024, 1, 15), date(2024, 1, 21), None),
+        ]
+        assert results['chunks_checkpointed'] == 1
+        # The partial line is terminated, so the new records stay readable
+        assert parallel_scrape.load_checkpoint(checkpoint) == {
+            ('2024-01-01', '2024-01-07', None),
+            ('2024-01-08', '2024-01-14', None),
+            ('2024-01-15', '2024-01-21', None),
+        }
+
+    def test_split_halves_persisted_and_skipped_on_resume(self, tmp_path, fake_chunks):
+        checkpoint = tmp_path / 'checkpoint.jsonl'
+        week = (date(2024, 1, 1), date(2024, 1, 7), None)
+        fake_chunks[week] = ['truncated', 'truncated']
+        fake_chunks[(date(2024, 1, 5), date(2024, 1, 7), None)] = ['fail', 'fail']
+        run_scrape(week[0], week[1], checkpoint=checkpoint)
+        assert ('2024-01-01', '2024-01-04', None) in parallel_scrape.load_checkpoint(checkpoint)
+        fake_chunks.calls.clear()
+
+        results = run_scrape(week[0], week[1], checkpoint=checkpoint)
+        # The week is searched again and split, but only the unfinished half runs
+        assert fake_chunks.calls == [week, (date(2024, 1, 5), date(2024, 1, 7), None)]
+        assert results['chunks_checkpointed'] == 1
+
+
+class TestRunParallelScrape:
+    """Tests for run_parallel_scrape requeueing and accounting."""
+
+    WEEK = (date(2024, 1, 1), date(2024, 1, 7), None)
+
+    def test_all_succeed(self, fake_chunks):
+        results = run_scrape(date(2024, 1, 1), date(2024, 1, 21), workers=2, queue_depth=2)
+        assert sorted(fake_chunks.calls) == [
+            (date(2024, 1, 1), date(2024, 1, 7), None),
+            (date(2024, 1, 8), date(2024, 1, 14), None),
+            (date(2024, 1, 15), date(2024, 1, 21), None),
+        ]
+        assert (results['total_chunks'], results['chunks_processed'], results['chunks_succeeded']) == (3, 3, 3)
+        assert results['total_cases'] == 3
+
+    def test_retry_then_success(self, fake_chunks):
+        fake_chunks[self.WEEK] = ['fail']
+        results = run_scrape(*self.WEEK[:2])
+        assert fake_chunks.calls == [self.WEEK, self.WEEK]
+        assert (results['chunks_retried'], results['chunks_succeeded'], results['chunks_failed']) == (1, 1, 0)
+        assert results['chunks_processed'] == results['total_chunks'] == 1
+
+    def test_retries_exhausted(self, fake_chunks):
+        fake_chunks[self.WEEK] = ['fail'] * 3
+        results = run_scrape(*self.WEEK[:2], retries=2)
+        assert fake_chunks.calls == [self.WEEK] * 3
+        assert (results['chunks_retried'], results['chunks_failed']) == (2, 1)
+        assert results['chunks_processed'] == results['total_chunks'] == 1
+        [failed] = results['failed_chunks']
+        assert (failed.start_date, failed.end_date, failed.error) == (self.WEEK[0], self.WEEK[1], 'fail')
+        assert [record['start_date'] for record in read_jsonl(parallel_scrape.FAILURES_FILE)] == ['2024-01-01']
+
+    def test_truncated_chunk_split_not_retried(self, fake_chunks):
+        fake_chunks[self.WEEK] = ['truncated']
+        results = run_scrape(*self.WEEK[:2])
+        assert fake_chunks.calls == [
+            self.WEEK,
+            (date(2024, 1, 1), date(2024, 1, 4), None),
+            (date(2024, 1, 5), date(2024, 1, 7), None),
+        ]
+        assert (results['chunks_split'], results['chunks_retried']) == (1, 0)
+        # The week plus its two halves
+        assert results['chunks_processed'] == results['total_chunks'] == 3
+        assert (results['chunks_succeeded'], results['chunks_failed']) == (2, 0)
+
+    def test_truncated_halves_bisected_to_single_days(self, fake_chunks):
+        fake_chunks[(date(2024, 1, 1), date(2024, 1, 2), 'wake')] = ['truncated']
+        fake_chunks[(date(2024, 1, 1), date(2024, 1, 1), 'wake')] = ['truncated']
+        results = run_scrape(date(2024, 1, 1), date(2024, 1, 2), chunk_size='weekly', county='wake')
+        assert fake_chunks.calls == [
+            (date(2024, 1, 1), date(2024, 1, 2), 'wake'),
+            (date(2024, 1, 1), date(2024, 1, 1), 'wake'),
+            (date(2024, 1, 2), date(2024, 1, 2), 'wake'),
+        ]
+        # A truncated single day can't be split: reported as a failure, not retried
+        assert (results['chunks_split'], results['chunks_failed'], results['chunks_retried']) == (1, 1, 0)
+        [failed] = results['failed_chunks']
+        assert (failed.start_date, failed.end_date, failed.county) == (date(2024, 1, 1), date(2024, 1, 1), 'wake')
+        assert results['chunks_processed'] == results['total_chunks'] == 3
+        assert results['by_county']['wake'] == [1, 1, 1]
+
+    def test_worker_exception_recorded_as_failure(self, fake_chunks, monkeypatch):
+        def explode(*args, **kwargs):
+            raise RuntimeError('worker died')
+
+        monkeypatch.setattr(parallel_scrape, 'run_chunk_scrape', explode)
+        results = run_scrape(*self.WEEK[:2])
+        assert (results['chunks_processed'], results['chunks_failed']) == (1, 1)
+        assert results['failed_chunks'][0].error == 'Thread failed: worker died'
@@ -0,0 +1,451 @@
+"""Tests for pdf_downloader helpers."""
+
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from scraper import pdf_downloader
+from scraper.pdf_downloader import (
+    _FILENAME_UNSAFE_RE,
+    TokenBucket,
+    _document_values,
+    _event_file_key,
+    _match_event_id,
+    _parse_doc_date,
+    _strip_unsafe_filename_chars,
+    click_event_document,
+    download_all_case_documents,
+    download_case_documents,
+    download_documents_for_event,
+    filter_already_downloaded,
+    save_download,
+    set_download_share,
+)
+
+
+class TestParseDocDate:
+    """Tests for _parse_doc_date function."""
+
+    def test_valid_date(self):
+        assert _parse_doc_date('1/2/2024') == date(2024, 1, 2)
+
+    @pytest.mark.parametrize('value', ['', None, '02/30/2024', '2024-01-02'])
+    def test_blank_or_invalid_returns_none(self, value):
+        assert _parse_doc_date(value) is None
+
+
+class TestStripUnsafeFilenameChars:
+    """Tests for _strip_unsafe_filename_chars function."""
+
+    @pytest.mark.parametrize('value', [
+        'Report of Sale (Foreclosure) - Filed/Entered',
+        "Notice of Hearing: Trustee's Sale #2",
+        ''.join(map(chr, range(128))),
+        'Caf\u00e9 \u00a7 Order\u2019s \u2013 Findings',
+        '',
+    ])
+    def test_matches_regex(self, value):
+        assert _strip_unsafe_filename_chars(value) == _FILENAME_UNSAFE_RE.sub('', value)
+
+
+class TestEventFileKey:
+    """Tests for mapping saved filenames back to their event."""
+
+    def test_plain_event_filename(self):
+        assert _event_file_key('11-25-2025_Notice of Sale.pdf') == '11-25-2025_Notice of Sale'
+
+    def test_counter_suffix(self):
+        assert _event_file_key('11-25-2025_Notice of Sale_2.pdf') == '11-25-2025_Notice of Sale'
+
+    def test_popup_document(self):
+        assert _event_file_key('11-25-2025_Motion_1_Public Check Deposit.pdf') == '11-25-2025_Motion'
+
+    def test_digits_inside_type_are_kept(self):
+        assert _event_file_key('11-25-2025_Report 2.pdf') == '11-25-2025_Report 2'
+
+    def test_non_event_filename_unchanged(self):
+        assert _event_file_key('notes.txt') == 'notes.txt'
+
+
+class FakeDownload:
+    """Download stub staged at a temp path, recording save_as() copies."""
+
+    def __init__(self, staged):
+        self.staged = staged
+        self.copied_to = None
+
+    def path(self):
+        return str(self.staged)
+
+    def save_as(self, path):
+        self.copied_to = path
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(pdf_downloader.time, 'monotonic', clock.monotonic)
+    monkeypatch.setattr(pdf_downloader.time, 'sleep', clock.sleep)
+    return clock
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket rate limiting."""
+
+    def test_burst_runs_without_sleeping(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=4)
+        for _ in range(4):
+            bucket.acquire()
+        assert clock.sleeps == []
+
+    def test_waits_for_next_token_after_burst(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=4)
+        for _ in range(5):
+            bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_sustained_rate(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=1)
+        for _ in range(5):
+            bucket.acquire()
+        assert clock.now - 100.0 == pytest.approx(2.0)
+
+    def test_refills_while_idle(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=4)
+        for _ in range(4):
+            bucket.acquire()
+        clock.now += 1.0
+        bucket.acquire()
+        bucket.acquire()
+        assert clock.sleeps == []
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_refill_capped_at_burst(self, clock):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        clock.now += 60.0
+        for _ in range(3):
+            bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_time_spent_working_is_not_slept_again(self, clock):
+        bucket = TokenBucket(rate=1.0, burst=1)
+        bucket.acquire()
+        clock.now += 0.75  # a slow download
+        bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.25)]
+
+
+class TestSetDownloadShare:
+    """Tests for splitting the download rate across processes."""
+
+    @pytest.fixture(autouse=True)
+    def reset_share(self):
+        yield
+        set_download_share(1)
+
+    def page(self):
+        return SimpleNamespace(url='https://portal.example.test/app/Case/1')
+
+    def bucket(self):
+        pdf_downloader.acquire_download_slot(self.page())
+        return pdf_downloader._download_buckets['portal.example.test']
+
+    def test_single_process_gets_full_rate(self, clock):
+        set_download_share(1)
+        bucket = self.bucket()
+        assert (bucket.rate, bucket.burst) == (pdf_downloader.DOWNLOAD_RATE, pdf_downloader.DOWNLOAD_BURST)
+
+    def test_rate_split_across_processes(self, clock):
+        set_download_share(4)
+        bucket = self.bucket()
+        assert bucket.rate == pytest.approx(pdf_downloader.DOWNLOAD_RATE / 4)
+        assert bucket.burst == max(1, pdf_downloader.DOWNLOAD_BURST // 4)
+
+    def test_burst_never_below_one(self, clock):
+        set_download_share(pdf_downloader.DOWNLOAD_BURST * 3)
+        assert self.bucket().burst == 1
+
+
+class TestSaveDownload:
+    """Tests for save_download function."""
+
+    def test_renames_on_same_filesystem(self, tmp_path):
+        staged = tmp_path / 'staged'
+        staged.write_bytes(b'%PDF')
+        download = FakeDownload(staged)
+        save_download(download, tmp_path / 'doc.pdf')
+        assert (tmp_path / 'doc.pdf').read_bytes() == b'%PDF'
+        assert not staged.exists()
+        assert download.copied_to is None
+
+    def test_copies_when_rename_fails(self, monkeypatch, tmp_path):
+        staged = tmp_path / 'staged'
+        staged.write_bytes(b'%PDF')
+
+        def failing_replace(src, dst):
+            raise OSError(18, 'Invalid cross-device link')
+
+        monkeypatch.setattr(pdf_downloader.os, 'replace', failing_replace)
+        download = FakeDownload(staged)
+        save_download(download, tmp_path / 'doc.pdf')
+        assert download.copied_to == str(tmp_path / 'doc.pdf')
+
+
+class TestMatchEventId:
+    """Tests for _match_event_id function."""
+
+    EVENTS = {
+        date(2024, 1, 2): [(10, 'Notice of Hearing'), (11, 'Report of Sale Filed')],
+        date(2024, 1, 3): [(12, 'Order for Sale')],
+        None: [(13, 'Order for Sale')],
+    }
+
+    def test_exact_type_match(self):
+        assert _match_event_id(self.EVENTS, '01/02/2024', 'Report of Sale Filed') == 11
+
+    def test_partial_match_is_case_insensitive(self):
+        assert _match_event_id(self.EVENTS, '01/02/2024', 'REPORT OF SALE') == 11
+
+    def test_date_must_match(self):
+        assert _match_event_id(self.EVENTS, '01/03/2024', 'Report of Sale Filed') is None
+
+    def test_missing_or_invalid_input(self):
+        assert _match_event_id(self.EVENTS, '', 'Order for Sale') is None
+        assert _match_event_id(self.EVENTS, '01/03/2024', '') is None
+        assert _match_event_id(self.EVENTS, 'not a date', 'Order for Sale') is None
+        assert _match_event_id(self.EVENTS, '02/30/2024', 'Order for Sale') is None
+
+    def test_document_values_links_event(self):
+        values = _document_values(self.EVENTS, 7, '/pdfs/01-03-2024_Order.pdf', '01/03/2024', 'Order for Sale')
+        assert values == {
+            'case_id': 7,
+            'event_id': 12,
+            'document_name': '01-03-2024_Order.pdf',
+            'file_path': '/pdfs/01-03-2024_Order.pdf',
+            'document_date': date(2024, 1, 3),
+        }
+
+
+class FakePage:
+    """Page stub whose click either starts a download or starts nothing."""
+
+    def __init__(self, download=None):
+        self.download = download
+        self.timeouts = []
+
+    @contextmanager
+    def expect_download(self, timeout):
+        self.timeouts.append(timeout)
+        info = SimpleNamespace(value=self.download)
+        yield info
+        if self.download is None:
+            raise PlaywrightTimeoutError(f"Timeout {timeout}ms exceeded")
+
+
+class FakeRows:
+    """JSHandle stub recording which event index was clicked."""
+
+    def __init__(self):
+        self.clicks = []
+
+    def evaluate(self, script, arg):
+        self.clicks.append(arg)
+
+
+class NoButtonPage(FakePage):
+    """Page stub whose event row has no document button."""
+
+    def __init__(self):
+        super().__init__()
+        self.evaluated = []
+
+    def evaluate(self, script, event_index):
+        self.evaluated.append(event_index)
+        return False
+
+
+class TestDownloadDocumentsForEvent:
+    """Tests for download_documents_for_event function."""
+
+    def test_no_button_returns_none_without_waiting(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(pdf_downloader.config, 'get_pdf_path', lambda county, case_number: tmp_path)
+        page = NoButtonPage()
+        assert download_documents_for_event(page, 1, 'wake', '24SP000001-910', 2) is None
+        assert page.evaluated == [2]
+
+
+class TestClickEventDocument:
+    """Tests for click_event_document function."""
+
+    def test_returns_direct_download_after_one_click(self):
+        page, rows = FakePage(download='the-download'), FakeRows()
+        assert click_event_document(page, rows, 3) == 'the-download'
+        assert rows.clicks == [3]
+
+    def test_returns_none_when_nothing_starts(self):
+        page, rows = FakePage(), FakeRows()
+        assert click_event_document(page, rows, 5, settle_ms=100) is None
+        assert rows.clicks == [5]
+        assert page.timeouts == [100]
+
+
+class RecordingPage:
+    """Page stub where every document click starts a download, logging starts and saves."""
+
+    def __init__(self, log):
+        self.log = log
+        self.url = 'https://portal.example'
+
+    def evaluate_handle(self, script):
+        return self
+
+    def evaluate(self, script, button_index):
+        self.log.append(('start', button_index))
+        self.clicked = button_index
+
+    @contextmanager
+    def expect_download(self, timeout):
+        info = SimpleNamespace()
+        yield info
+        info.value = SimpleNamespace(suggested_filename=f'doc{self.clicked}.pdf', index=self.clicked)
+
+
+class TestFilterAlreadyDownloaded:
+    """Tests for filter_already_downloaded function."""
+
+    @pytest.fixture
+    def existing_dates(self, monkeypatch):
+        """Dates of the case's Document rows, as the patched get_session returns them."""
+        dates = []
+
+        @contextmanager
+        def get_session():
+            query = SimpleNamespace(filter=lambda *criteria: [(d,) for d in dates])
+            yield SimpleNamespace(query=lambda column: query)
+
+        monkeypatch.setattr(pdf_downloader, 'get_session', get_session)
+        return dates
+
+    @staticmethod
+    def buttons(*event_dates):
+        return [{'index': i, 'eventDate': event_date} for i, event_date in enumerate(event_dates)]
+
+    def test_nothing_on_file_downloads_all(self, existing_dates):
+        buttons = self.buttons('01/02/2024', '01/03/2024')
+        assert filter_already_downloaded(1, buttons) == buttons
+
+    def test_date_with_all_documents_skipped(self, existing_dates):
+        existing_dates.extend([date(2024, 1, 2), date(2024, 1, 2)])
+        buttons = self.buttons('01/02/2024', '01/02/2024', '01/03/2024')
+        assert filter_already_downloaded(1, buttons) == buttons[2:]
+
+    def test_date_missing_one_document_downloads_all_of_it(self, existing_dates):
+        existing_dates.append(date(2024, 1, 2))
+        buttons = self.buttons('01/02/2024', '01/02/2024')
+        assert filter_already_downloaded(1, buttons) == buttons
+
+    def test_more_rows_than_buttons_skipped(self, existing_dates):
+        # e.g. a multi-document popup saved several files for one button
+        existing_dates.extend([date(2024, 1, 2)] * 3)
+        assert filter_already_downloaded(1, self.buttons('01/02/2024')) == []
+
+    def test_counts_are_per_date(self, existing_dates):
+        existing_dates.extend([date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 3)])
+        buttons = self.buttons('01/02/2024', '01/03/2024', '01/03/2024', '1/2/2024')
+        # 01/02 has two buttons (in both date formats) but one row; 01/03 has two of each
+        assert filter_already_downloaded(1, buttons) == [buttons[0], buttons[3]]
+
+    def test_undated_buttons_always_kept(self, existing_dates):
+        existing_dates.append(date(2024, 1, 2))
+        buttons = self.buttons('', 'bad date', '01/02/2024')
+        assert filter_already_downloaded(1, buttons) == buttons[:2]
+
+    def test_database_error_downloads_all(self, monkeypatch):
+        @contextmanager
+        def get_session():
+            raise RuntimeError('db down')
+            yield
+
+        monkeypatch.setattr(pdf_downloader, 'get_session', get_session)
+        buttons = self.buttons('01/02/2024')
+        assert filter_already_downloaded(1, buttons) == buttons
+
+
+class TestDownloadCaseDocuments:
+    """Tests for download_case_documents function."""
+
+    def test_keeps_bounded_downloads_in_flight(self, monkeypatch, tmp_path):
+        log = []
+        buttons = [{'buttonIndex': i, 'eventDate': '01/02/2024', 'eventType': 'Notice'} for i in range(6)]
+        monkeypatch.setattr(pdf_downloader.config, 'get_pdf_path', lambda county, case_number: tmp_path)
+        monkeypatch.setattr(pdf_downloader, 'extract_document_info_from_page', lambda page: buttons)
+        monkeypatch.setattr(pdf_downloader, 'filter_already_downloaded', lambda case_id, docs: docs)
+        monkeypatch.setattr(pdf_downloader, 'acquire_download_slot', lambda page: None)
+        monkeypatch.setattr(pdf_downloader, 'save_download',
+                            lambda download, file_path: log.append(('save', download.index)))
+        monkeypatch.setattr(pdf_downloader, 'save_document_records',
+                            lambda case_id, downloaded: list(range(len(downloaded))))
+        monkeypatch.setattr(pdf_downloader, 'MAX_IN_FLIGHT_DOWNLOADS', 4)
+
+        assert download_case_documents(RecordingPage(log), 1, 'wake', '24SP000001-910') == 6
+        assert log == [
+            ('start', 0), ('start', 1), ('start', 2), ('start', 3),
+            ('save', 0), ('start', 4),
+            ('save', 1), ('start', 5),
+            ('save', 2), ('save', 3), ('save', 4), ('save', 5),
+        ]
+
+
+class TestDownloadAllCaseDocuments:
+    """Tests for download_all_case_documents function."""
+
+    def test_pipelines_single_downloads_in_event_order(self, monkeypatch, tmp_path):
+        log = []
+        events = [{'index': i, 'eventType': f'Event {i}', 'eventDate': '01/02/2024'} for i in range(5)]
+        page = SimpleNamespace(evaluate_handle=lambda script: 'rows')
+
+        def fake_click(page, rows, event_index):
+            log.append(('start', event_index))
+            return SimpleNamespace(index=event_index)
+
+        monkeypatch.setattr(pdf_downloader.config, 'get_pdf_path', lambda county, case_number: tmp_path)
+        monkeypatch.setattr(pdf_downloader, 'acquire_download_slot', lambda page: None)
+        monkeypatch.setattr(pdf_downloader, 'click_event_document', fake_click)
+        monkeypatch.setattr(pdf_downloader, 'save_download',
+                            lambda download, file_path: log.append(('save', download.index)))
+        # Event 1's document belongs to another case
+        monkeypatch.setattr(pdf_downloader, 'validate_document_case_number',
+                            lambda file_path, case_number: 'Event 1' not in file_path)
+        monkeypatch.setattr(pdf_downloader, 'record_new_documents', lambda case_id, docs: None)
+        monkeypatch.setattr(pdf_downloader, 'MAX_IN_FLIGHT_DOWNLOADS', 2)
+
+        downloaded = download_all_case_documents(page, 1, 'wake', '24SP000001-910',
+                                                 skip_existing=False, events=events)
+
+        assert [d['event_type'] for d in downloaded] == ['Event 0', 'Event 2', 'Event 3', 'Event 4']
+        assert log == [
+            ('start', 0), ('start', 1),
+            ('save', 0), ('start', 2),
+            ('save', 1), ('start', 3),
+            ('save', 2), ('start', 4),
+            ('save', 3), ('save', 4),
+        ]